@@ -0,0 +1,101 @@
+"""
+Compares the time taken to search a generated tree of plugin files serially
+against searching it with a thread pool.
+
+The workers only overlap walking and reading the files, so on a local disk
+little difference is expected. Directly loaded files are only loaded again
+once they change, so a second search of the same tree is warm. Each mode is therefore given its own
+(identical) tree for the cold searches, and then searches it again for
+the warm numbers.
+
+Run from the root of the repository:
+
+.. code-block:: bash
+
+    python benchmarks/bench_parallel_loading.py --files 5000 --workers 8
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import factories
+import plugin_tree
+from factories.examples.reader import ReaderPlugin
+
+
+# ------------------------------------------------------------------------------
+def _search(path, workers):
+    """
+    Creates a factory and times how long it takes to search the given path.
+
+    :return: (seconds, factory)
+    """
+    factory = factories.Factory(
+        abstract=ReaderPlugin,
+        plugin_identifier='name',
+        versioning_identifier='version',
+    )
+
+    start_time = time.perf_counter()
+    factory.add_path(path, mechanism=factory.LOAD_SOURCE, workers=workers)
+
+    return time.perf_counter() - start_time, factory
+
+
+# ------------------------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--files', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    serial_root = tempfile.mkdtemp()
+    parallel_root = tempfile.mkdtemp()
+
+    try:
+        plugin_tree.generate(serial_root, args.files)
+        plugin_tree.generate(parallel_root, args.files)
+
+        cold_serial_time, serial = _search(serial_root, workers=None)
+        cold_parallel_time, parallel = _search(
+            parallel_root,
+            workers=args.workers,
+        )
+
+        # -- The parallel search must give exactly the same plugins in
+        # -- exactly the same order
+        assert [r.class_name() for r in serial._records] == [
+            r.class_name() for r in parallel._records
+        ]
+
+        warm_serial_time, _ = _search(serial_root, workers=None)
+        warm_parallel_time, _ = _search(parallel_root, workers=args.workers)
+
+        print('files    : {} ({} workers)'.format(args.files, args.workers))
+
+        for label, serial_time, parallel_time in [
+            ('cold', cold_serial_time, cold_parallel_time),
+            ('warm', warm_serial_time, warm_parallel_time),
+        ]:
+            print(
+                '{}     : serial {:.3f}s, parallel {:.3f}s, '
+                'speedup {:.2f}x'.format(
+                    label,
+                    serial_time,
+                    parallel_time,
+                    serial_time / parallel_time,
+                ),
+            )
+
+    finally:
+        shutil.rmtree(serial_root)
+        shutil.rmtree(parallel_root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+The factory benchmarks in a form which can be run with pytest-benchmark.
+These are not collected by default, so they must be run explicitly:
+
+.. code-block:: bash
+
+    python -m pytest benchmarks/bench_pytest.py
+
+The size of the generated tree can be altered through the
+FACTORIES_BENCHMARK_FILES, FACTORIES_BENCHMARK_CLASSES,
+FACTORIES_BENCHMARK_VERSIONS and FACTORIES_BENCHMARK_DEPTH environment
+variables.
+"""
+import os
+import sys
+import shutil
+import tempfile
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import run
+import plugin_tree
+
+
+# ------------------------------------------------------------------------------
+def _setting(name, default):
+    return int(os.environ.get('FACTORIES_BENCHMARK_{}'.format(name), default))
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture(scope='module')
+def tree():
+    root = tempfile.mkdtemp()
+
+    plugin_tree.generate(
+        root,
+        _setting('FILES', 1000),
+        classes_per_file=_setting('CLASSES', 1),
+        versions=_setting('VERSIONS', 1),
+        depth=_setting('DEPTH', 0),
+    )
+
+    yield root
+
+    shutil.rmtree(root)
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture(scope='module')
+def factory(tree):
+    return run.create_factory(tree)
+
+
+# ------------------------------------------------------------------------------
+def test_discovery(benchmark, tree):
+    benchmark(run.create_factory, tree)
+
+
+# ------------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    'name',
+    [
+        'identifiers',
+        'plugins',
+        'request',
+        'request (version)',
+        'request (miss)',
+        'versions',
+        'instance',
+        'constructor',
+    ],
+)
+def test_lookup(benchmark, factory, name):
+    calls = dict(
+        (call_name, func)
+        for call_name, func, _ in run.lookups(
+            factory,
+            sorted(factory.identifiers()),
+        )
+    )
+    benchmark(calls[name])
@@ -0,0 +1,106 @@
+"""
+Generates synthetic plugin trees for benchmarking the factory. The plugins
+all inherit from the ReaderPlugin abstract in factories.examples.reader and
+are identified through a 'name' attribute, so that a single identifier can
+be given many versions.
+"""
+import os
+
+_HEADER = '''from factories.examples.reader import ReaderPlugin
+'''
+
+_CLASS_TEMPLATE = '''
+
+class {class_name}(ReaderPlugin):
+    name = '{identifier}'
+    version = {version}
+
+    @classmethod
+    def can_read(cls, filepath):
+        return filepath.endswith('.{identifier}')
+'''
+
+
+# ------------------------------------------------------------------------------
+def generate(root,
+             files,
+             classes_per_file=1,
+             versions=1,
+             depth=0,
+             files_per_folder=100):
+    """
+    Writes a tree of plugin files beneath the given root.
+
+    Every class within the tree is given a unique identifier unless
+    versions is greater than one, in which case each identifier is
+    given that many versions (spread over consecutive classes).
+
+    :param root: Folder to write the tree into
+    :type root: str
+
+    :param files: Number of plugin files to write
+    :type files: int
+
+    :param classes_per_file: Number of plugin classes in each file
+    :type classes_per_file: int
+
+    :param versions: Number of versions of each identifier
+    :type versions: int
+
+    :param depth: Number of nested folders each group of files sits
+        within beneath the root
+    :type depth: int
+
+    :param files_per_folder: Number of files to place in each folder
+    :type files_per_folder: int
+
+    :return: List of written filepaths
+    """
+    filepaths = list()
+    class_index = 0
+
+    for index in range(files):
+        folder_index = index // files_per_folder
+
+        folder = os.path.join(
+            root,
+            *(
+                ['level_{}'.format(level) for level in range(depth)]
+                + ['folder_{}'.format(folder_index)]
+            )
+        )
+
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+
+        filepath = os.path.join(folder, 'plugin_{}.py'.format(index))
+
+        with open(filepath, 'w') as f:
+            f.write(_HEADER)
+
+            for _ in range(classes_per_file):
+                f.write(
+                    _CLASS_TEMPLATE.format(
+                        class_name='Plugin{}'.format(class_index),
+                        identifier=identifier(class_index // versions),
+                        version=(class_index % versions) + 1,
+                    ),
+                )
+                class_index += 1
+
+        filepaths.append(filepath)
+
+    return filepaths
+
+
+# ------------------------------------------------------------------------------
+def identifier(index):
+    """
+    Returns the identifier given to the plugin at the given index.
+
+    :param index: Index of the identifier
+    :type index: int
+
+    :return: str
+    """
+    return 'reader_{}'.format(index)
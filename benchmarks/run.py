@@ -0,0 +1,253 @@
+"""
+Benchmarks the discovery, lookup and instancing paths of the factory
+against generated plugin trees, using only the standard library.
+
+Run from the root of the repository:
+
+.. code-block:: bash
+
+    python benchmarks/run.py --files 1000 --classes 2 --versions 3 --depth 2
+
+Discovery is reported for a cold search (the files have never been loaded)
+and a warm search (a second factory searching the same files), along with
+the peak memory allocated during a cold search. Lookups are reported as the
+best average latency per call over a number of repeats.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import timeit
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import factories
+import plugin_tree
+from factories.examples.reader import ReaderPlugin
+
+_MECHANISMS = dict(
+    guess=factories.Factory.GUESS,
+    load_source=factories.Factory.LOAD_SOURCE,
+    importable=factories.Factory.IMPORTABLE,
+)
+
+
+# ------------------------------------------------------------------------------
+def create_factory(root=None, mechanism=factories.Factory.LOAD_SOURCE, workers=None):
+    """
+    Creates a factory suitable for the generated plugin trees, searching
+    the given root if one is given.
+
+    :return: factories.Factory
+    """
+    factory = factories.Factory(
+        abstract=ReaderPlugin,
+        plugin_identifier='name',
+        versioning_identifier='version',
+        log_errors=False,
+    )
+
+    if root:
+        factory.add_path(root, mechanism=mechanism, workers=workers)
+
+    return factory
+
+
+# ------------------------------------------------------------------------------
+def measure_discovery(root, mechanism, workers=None):
+    """
+    Returns the number of seconds taken to search the given root.
+
+    :return: (seconds, factory)
+    """
+    start_time = time.perf_counter()
+    factory = create_factory(root, mechanism, workers)
+
+    return time.perf_counter() - start_time, factory
+
+
+# ------------------------------------------------------------------------------
+def measure_memory(root, mechanism, workers=None):
+    """
+    Returns the peak number of bytes allocated whilst searching the
+    given root.
+
+    :return: int
+    """
+    tracemalloc.start()
+
+    try:
+        create_factory(root, mechanism, workers)
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+# ------------------------------------------------------------------------------
+def measure_call(func, number, repeat):
+    """
+    Returns the best average number of seconds per call of the given
+    function.
+
+    :return: float
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+# ------------------------------------------------------------------------------
+def lookups(factory, identifiers):
+    """
+    Returns the named lookup calls to measure against the given factory.
+
+    :return: list((name, callable, relative_number), ...)
+    """
+    identifier = identifiers[len(identifiers) // 2]
+    version = factory.versions(identifier)[0]
+    constructor = factory.constructor(identifier)
+
+    return [
+        ('identifiers', factory.identifiers, 0.01),
+        ('plugins', factory.plugins, 0.01),
+        ('request', lambda: factory.request(identifier), 1),
+        ('request (version)', lambda: factory.request(identifier, version), 1),
+        ('request (miss)', lambda: factory.request('missing'), 1),
+        ('versions', lambda: factory.versions(identifier), 1),
+        ('instance', lambda: factory.instance(identifier), 1),
+        ('constructor', constructor, 1),
+    ]
+
+
+# ------------------------------------------------------------------------------
+def run(files,
+        classes_per_file=1,
+        versions=1,
+        depth=0,
+        mechanism='load_source',
+        workers=None,
+        number=10000,
+        repeat=5):
+    """
+    Generates a plugin tree with the given shape and benchmarks it.
+
+    :return: dict of results
+    """
+    mechanism = _MECHANISMS[mechanism]
+    roots = [tempfile.mkdtemp(), tempfile.mkdtemp()]
+
+    try:
+        for root in roots:
+            plugin_tree.generate(
+                root,
+                files,
+                classes_per_file=classes_per_file,
+                versions=versions,
+                depth=depth,
+            )
+
+        cold_time, factory = measure_discovery(roots[0], mechanism, workers)
+        warm_time = min(
+            measure_discovery(roots[0], mechanism, workers)[0]
+            for _ in range(repeat)
+        )
+        peak_memory = measure_memory(roots[1], mechanism, workers)
+
+        identifiers = sorted(factory.identifiers())
+
+        results = dict(
+            shape=dict(
+                files=files,
+                classes_per_file=classes_per_file,
+                versions=versions,
+                depth=depth,
+                workers=workers,
+                plugins=files * classes_per_file,
+                identifiers=len(identifiers),
+            ),
+            discovery=dict(
+                cold_seconds=cold_time,
+                warm_seconds=warm_time,
+                peak_memory_bytes=peak_memory,
+            ),
+            lookups=dict(),
+        )
+
+        for name, func, relative_number in lookups(factory, identifiers):
+            results['lookups'][name] = measure_call(
+                func,
+                number=max(1, int(number * relative_number)),
+                repeat=repeat,
+            )
+
+        return results
+
+    finally:
+        for root in roots:
+            shutil.rmtree(root)
+
+
+# ------------------------------------------------------------------------------
+def report(results):
+    """
+    Prints the given results in a readable form.
+
+    :return: None
+    """
+    shape = results['shape']
+    discovery = results['discovery']
+
+    print(
+        'Tree: {files} files x {classes_per_file} classes, {versions} '
+        'version(s) per identifier, depth {depth} '
+        '({plugins} plugins, {identifiers} identifiers)'.format(**shape)
+    )
+    print('')
+    print('{:<24}{:>14}'.format('discovery (cold)', '{:.4f} s'.format(discovery['cold_seconds'])))
+    print('{:<24}{:>14}'.format('discovery (warm)', '{:.4f} s'.format(discovery['warm_seconds'])))
+    print('{:<24}{:>14}'.format('peak memory', '{:.2f} MB'.format(discovery['peak_memory_bytes'] / 1048576.0)))
+    print('')
+
+    for name, seconds in results['lookups'].items():
+        print('{:<24}{:>14}'.format(name, '{:.3f} us'.format(seconds * 1000000)))
+
+
+# ------------------------------------------------------------------------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--files', type=int, default=1000)
+    parser.add_argument('--classes', type=int, default=1, help='Classes per file')
+    parser.add_argument('--versions', type=int, default=1, help='Versions per identifier')
+    parser.add_argument('--depth', type=int, default=0, help='Nested folder depth')
+    parser.add_argument('--mechanism', choices=sorted(_MECHANISMS), default='load_source')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--number', type=int, default=10000, help='Calls per lookup measurement')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help='Output the results as json')
+    args = parser.parse_args()
+
+    results = run(
+        args.files,
+        classes_per_file=args.classes,
+        versions=args.versions,
+        depth=args.depth,
+        mechanism=args.mechanism,
+        workers=args.workers,
+        number=args.number,
+        repeat=args.repeat,
+    )
+
+    if args.json:
+        print(json.dumps(results, indent=4))
+
+    else:
+        report(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -66,6 +66,22 @@ from .factory import (
     enable_debugging,
 )
 
+from .overlay import (
+    FactoryOverlay,
+)
+
+from .watcher import (
+    PathWatcher,
+)
+
+from .resolver import (
+    ModuleResolver,
+)
+
+from .stats import (
+    FactoryStats,
+)
+
 from .constants import (
     log,
 )
@@ -0,0 +1,149 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from . import manifest
+from .factory import Factory
+
+import sys
+import argparse
+import importlib
+
+
+# ------------------------------------------------------------------------------
+def _import_abstract(name):
+    """
+    Imports and returns the class described by the given name, which should
+    be given as module:Class (or module.Class).
+
+    :param name: The name of the abstract class
+    :type name: str
+
+    :return: Class
+    """
+    if ':' in name:
+        module_name, _, attribute_path = name.partition(':')
+
+    else:
+        module_name, _, attribute_path = name.rpartition('.')
+
+    item = importlib.import_module(module_name)
+
+    for attribute in attribute_path.split('.'):
+        item = getattr(item, attribute)
+
+    return item
+
+
+# ------------------------------------------------------------------------------
+def build_manifest(args):
+    """
+    Searches the given paths for plugins of the given abstract and writes
+    a manifest describing them.
+
+    :param args: The parsed command line arguments
+    :type args: argparse.Namespace
+
+    :return: int
+    """
+    factory = Factory(
+        abstract=_import_abstract(args.abstract),
+        plugin_identifier=args.identifier,
+        versioning_identifier=args.versioning_identifier,
+        regex_filter=args.regex_filter,
+    )
+
+    for path in args.path:
+        factory.add_path(path, mechanism=args.mechanism)
+
+    data = manifest.build(factory)
+    manifest.write(data, args.output)
+
+    print(
+        'Wrote {} plugins to {}'.format(
+            len(data['plugins']),
+            args.output,
+        ),
+    )
+    return 0
+
+
+# ------------------------------------------------------------------------------
+def main(argv=None):
+    """
+    Entry point for "python -m factories".
+
+    :param argv: The command line arguments, defaulting to sys.argv
+    :type argv: list(str, str, ...)
+
+    :return: int
+    """
+    parser = argparse.ArgumentParser(prog='python -m factories')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    build = commands.add_parser(
+        'build-manifest',
+        help='Write a manifest of the plugins found within the given paths',
+    )
+    build.add_argument(
+        '--abstract',
+        required=True,
+        help='The abstract class to search for, as module:Class',
+    )
+    build.add_argument(
+        '--path',
+        action='append',
+        required=True,
+        help='A path to search for plugins. This can be given many times',
+    )
+    build.add_argument(
+        '--output',
+        required=True,
+        help='The file to write the manifest to',
+    )
+    build.add_argument(
+        '--identifier',
+        default=None,
+        help='The plugin identifier the factory will use',
+    )
+    build.add_argument(
+        '--versioning-identifier',
+        default=None,
+        help='The versioning identifier the factory will use',
+    )
+    build.add_argument(
+        '--mechanism',
+        type=int,
+        default=Factory.GUESS,
+        choices=[Factory.GUESS, Factory.LOAD_SOURCE, Factory.IMPORTABLE],
+        help='The loading mechanism to search the paths with',
+    )
+    build.add_argument(
+        '--regex-filter',
+        default=None,
+        help='Only files matching this expression are searched',
+    )
+    build.set_defaults(func=build_manifest)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import re
+import os
+import zipfile
+import zipimport
+import threading
+
+
+# -- The archives we will look for plugins within, when given as a path
+EXTENSIONS = ('.zip', '.whl', '.pyz')
+
+# -- Splits a path to a file within an archive into the archive and the
+# -- member within it
+_MEMBER_CHECK = re.compile(
+    r'^(.+?\.(?:zip|whl|pyz))[\\/](.+)$',
+    re.IGNORECASE,
+)
+
+# -- Per archive we hold the modification time and size it had when we
+# -- read its central directory, along with the member names and the
+# -- zipimporters created for it. This is shared by all factories as
+# -- zipimport shares its own record of each archive.
+_ARCHIVES = dict()
+_LOCK = threading.Lock()
+
+
+# ------------------------------------------------------------------------------
+def is_archive(path):
+    """
+    Returns whether the given path is an archive plugins can be loaded from
+
+    :param path: Absolute path
+    :type path: str
+
+    :return: bool
+    """
+    return path.lower().endswith(EXTENSIONS) and os.path.isfile(path)
+
+
+# ------------------------------------------------------------------------------
+def split(filepath):
+    """
+    Splits a path to a file within an archive into the path of the archive
+    and the name of the member within it. If the path is not within an
+    archive then None is returned.
+
+    :param filepath: Absolute path, such as /plugins/bundle.zip/tools/a.py
+    :type filepath: str
+
+    :return: (str, str) or None
+    """
+    match = _MEMBER_CHECK.match(filepath)
+
+    if not match or not os.path.isfile(match.group(1)):
+        return None
+
+    return match.group(1), match.group(2).replace('\\', '/')
+
+
+# ------------------------------------------------------------------------------
+def _invalidate(archive):
+    """
+    Forgets zipimports copy of the central directory of the given archive,
+    so it is read again by the next zipimporter created for it.
+
+    :return: None
+    """
+    if getattr(zipimport.zipimporter, 'invalidate_caches', None):
+        zipimport.zipimporter(archive).invalidate_caches()
+        return
+
+    # -- Before python 3.10 zipimporters have no invalidate_caches, and
+    # -- read the central directory from this cache when created
+    getattr(zipimport, '_zip_directory_cache', dict()).pop(archive, None)
+
+
+# ------------------------------------------------------------------------------
+def _entry(archive):
+    """
+    Returns our record of the given archive, reading its central directory
+    again only if the archive has changed since it was last read. This
+    must only be called whilst holding the lock.
+
+    :return: dict
+    """
+    stat = os.stat(archive)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    entry = _ARCHIVES.get(archive)
+
+    if entry and entry['stamp'] == stamp:
+        return entry
+
+    with zipfile.ZipFile(archive) as f:
+        names = f.namelist()
+
+    # -- zipimport holds its own copy of the central directory, which
+    # -- is out of date if we have seen this archive before
+    if entry:
+        _invalidate(archive)
+
+    entry = _ARCHIVES[archive] = dict(
+        stamp=stamp,
+        names=frozenset(names),
+        importers=dict(),
+    )
+    return entry
+
+
+# ------------------------------------------------------------------------------
+def members(archive):
+    """
+    Returns the names of all the python files within the given archive,
+    leaving out any bytecode which is cached alongside its source.
+
+    :param archive: Absolute path to the archive
+    :type archive: str
+
+    :return: list(str, str, ...)
+    """
+    with _LOCK:
+        names = _entry(archive)['names']
+
+    return sorted(
+        name
+        for name in names
+        if name.endswith('.py') or (
+            name.endswith('.pyc') and
+            '__pycache__' not in name and
+            name[:-1] not in names
+        )
+    )
+
+
+# ------------------------------------------------------------------------------
+def contains(filepath):
+    """
+    Returns whether the given path is a file within an existing archive.
+
+    :param filepath: Absolute path, such as /plugins/bundle.zip/tools/a.py
+    :type filepath: str
+
+    :return: bool
+    """
+    location = split(filepath)
+
+    if not location:
+        return False
+
+    archive, member = location
+
+    with _LOCK:
+        return member in _entry(archive)['names']
+
+
+# ------------------------------------------------------------------------------
+def read(filepath):
+    """
+    Returns the contents of the given file within an archive.
+
+    :param filepath: Absolute path, such as /plugins/bundle.zip/tools/a.py
+    :type filepath: str
+
+    :return: bytes
+    """
+    archive, member = split(filepath)
+
+    with zipfile.ZipFile(archive) as f:
+        try:
+            return f.read(member)
+
+        except KeyError:
+            raise FileNotFoundError(filepath)
+
+
+# ------------------------------------------------------------------------------
+def code(filepath):
+    """
+    Returns the code object for the given file within an archive. This is
+    read through zipimport, so any bytecode held alongside the source
+    within the archive is used rather than compiling the source.
+
+    :param filepath: Absolute path, such as /plugins/bundle.zip/tools/a.py
+    :type filepath: str
+
+    :return: code
+    """
+    archive, member = split(filepath)
+    folder, _, filename = member.rpartition('/')
+
+    with _LOCK:
+        importers = _entry(archive)['importers']
+
+        # -- zipimport looks for modules within a single folder of the
+        # -- archive, so we hold an importer for each folder
+        if folder not in importers:
+            location = archive
+
+            if folder:
+                location = os.path.join(archive, *folder.split('/'))
+
+            importers[folder] = zipimport.zipimporter(location)
+
+        importer = importers[folder]
+
+    return importer.get_code(os.path.splitext(filename)[0])
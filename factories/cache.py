@@ -0,0 +1,235 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from .constants import log
+
+import re
+import os
+import json
+import hashlib
+
+
+# ------------------------------------------------------------------------------
+class DiscoveryCache(object):
+    """
+    A persistent record of what each plugin file contained the last time
+    it was inspected by a factory.
+
+    For every file we store its modification time, size and a hash of its
+    contents along with the names of the plugin classes which were found
+    within it. When a factory is searching a path it can then ask the cache
+    whether a file is unchanged - in which case files which held no plugins
+    do not need to be imported at all, and files which did hold plugins can
+    have those classes pulled directly rather than inspecting every
+    attribute of the module.
+
+    The cache is stored as a json file within the given directory, and a
+    separate file is used for each abstract.
+
+    .. code-block:: python
+
+        >>> import factories
+        >>> import factories.examples.reader
+        >>>
+        >>> factory = factories.Factory(
+        ...     abstract=factories.examples.reader.ReaderPlugin,
+        ...     cache_dir='/tmp/factories_cache',
+        ... )
+    """
+
+    # -- This is stored within the cache file and bumped whenever
+    # -- the layout of the stored data changes
+    FORMAT_VERSION = 1
+
+    # --------------------------------------------------------------------------
+    def __init__(self, directory, abstract):
+        """
+        :param directory: Folder in which the cache file should be stored.
+            This will be created if it does not exist.
+        :type directory: str
+
+        :param abstract: The abstract class of the factory the cache is
+            being used by
+        :type abstract: Class
+        """
+        self._directory = directory
+        self._filepath = os.path.join(
+            directory,
+            '{}.json'.format(
+                re.sub(
+                    r'[^\w.\-]',
+                    '_',
+                    '{}.{}'.format(
+                        abstract.__module__,
+                        getattr(abstract, '__qualname__', abstract.__name__),
+                    ),
+                ),
+            ),
+        )
+
+        # -- We only write the cache back to disk if it has changed
+        self._dirty = False
+        self._entries = self._read()
+
+    # --------------------------------------------------------------------------
+    def _read(self):
+        """
+        Reads the cache file from disk. If the file does not exist or is
+        not readable for any reason then an empty cache is returned.
+
+        :return: dict
+        """
+        if not os.path.exists(self._filepath):
+            return dict()
+
+        # noinspection PyBroadException
+        try:
+            with open(self._filepath, 'r') as f:
+                data = json.load(f)
+
+        except BaseException:
+            log.debug('Discovery cache is unreadable : {}'.format(self._filepath))
+            return dict()
+
+        if data.get('format') != self.FORMAT_VERSION:
+            return dict()
+
+        return data.get('files', dict())
+
+    # --------------------------------------------------------------------------
+    @classmethod
+    def _hash(cls, filepath):
+        """
+        Returns a hash of the contents of the given file.
+
+        :param filepath: Absolute path to the file to hash
+        :type filepath: str
+
+        :return: str
+        """
+        with open(filepath, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+    # --------------------------------------------------------------------------
+    def filepath(self):
+        """
+        Returns the location of the file the cache is stored in
+
+        :return: str
+        """
+        return self._filepath
+
+    # --------------------------------------------------------------------------
+    def lookup(self, filepath):
+        """
+        Returns the names of the plugin classes found within the given file
+        the last time it was inspected. If the file is not known to the cache
+        or has changed since then None is returned.
+
+        :param filepath: Absolute path to the plugin file
+        :type filepath: str
+
+        :return: list(str, str, ...) or None
+        """
+        entry = self._entries.get(filepath)
+
+        if not entry:
+            return None
+
+        try:
+            stat = os.stat(filepath)
+
+        except OSError:
+            return None
+
+        # -- The quickest check is whether the file has been touched at all
+        if entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry['classes']
+
+        # -- A file may have been touched (such as during a checkout) without
+        # -- its contents changing, so if the size still matches we compare
+        # -- the contents before deciding it is stale
+        if entry['size'] == stat.st_size and entry['hash'] == self._hash(filepath):
+            entry['mtime'] = stat.st_mtime_ns
+            self._dirty = True
+            return entry['classes']
+
+        return None
+
+    # --------------------------------------------------------------------------
+    def store(self, filepath, class_names):
+        """
+        Records the plugin class names which were found in the given file.
+
+        :param filepath: Absolute path to the plugin file
+        :type filepath: str
+
+        :param class_names: Names of the module attributes which are plugins
+        :type class_names: list(str, str, ...)
+
+        :return: None
+        """
+        try:
+            stat = os.stat(filepath)
+            file_hash = self._hash(filepath)
+
+        except OSError:
+            return
+
+        self._entries[filepath] = dict(
+            mtime=stat.st_mtime_ns,
+            size=stat.st_size,
+            hash=file_hash,
+            classes=list(class_names),
+        )
+        self._dirty = True
+
+    # --------------------------------------------------------------------------
+    def save(self):
+        """
+        Writes the cache to disk if it has changed since it was read.
+
+        :return: None
+        """
+        if not self._dirty:
+            return
+
+        # noinspection PyBroadException
+        try:
+            if not os.path.exists(self._directory):
+                os.makedirs(self._directory)
+
+            # -- Write to a temporary file and swap it in, so that other
+            # -- processes never read a partially written cache
+            temp_filepath = '{}.{}.tmp'.format(self._filepath, os.getpid())
+
+            with open(temp_filepath, 'w') as f:
+                json.dump(
+                    dict(
+                        format=self.FORMAT_VERSION,
+                        files=self._entries,
+                    ),
+                    f,
+                )
+
+            os.replace(temp_filepath, self._filepath)
+            self._dirty = False
+
+        except BaseException:
+            log.warning('Could not write discovery cache : {}'.format(self._filepath))
@@ -0,0 +1,130 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+# ------------------------------------------------------------------------------
+class Constructor(object):
+    """
+    A callable handle to a single plugin of a factory, which creates
+    instances of it without looking the plugin up on every call. This is
+    given by Factory.constructor.
+
+    The handle remembers the state of the factory (its snapshot) the plugin
+    was resolved within. Whenever the factory has changed since, the plugin
+    is resolved again before the instance is created - so a handle never
+    creates instances of a plugin which has been reloaded or removed. If
+    the plugin can no longer be found a KeyError is raised.
+
+    .. code-block:: python
+
+        >>> from factories.examples.zoo import Zoo
+        >>>
+        >>> zoo = Zoo()
+        >>> create_tiger = zoo.factory.constructor('tiger')
+        >>>
+        >>> tigers = [create_tiger() for _ in range(1000)]
+    """
+
+    __slots__ = (
+        '_factory',
+        '_identifier',
+        '_version',
+        '_resolved',
+    )
+
+    # --------------------------------------------------------------------------
+    def __init__(self, factory, identifier, version=None):
+        """
+        :param factory: The factory to resolve the plugin from
+        :type factory: factories.Factory
+
+        :param identifier: The identifier of the plugin
+
+        :param version: The version of the plugin, or None for the highest
+        """
+        self._factory = factory
+        self._identifier = identifier
+        self._version = version
+
+        # -- The snapshot the plugin was resolved within, along with the
+        # -- plugin. These are held together so that they are always
+        # -- replaced together.
+        self._resolved = (None, None)
+        self._resolve()
+
+    # --------------------------------------------------------------------------
+    def __repr__(self):
+        return '[Constructor - {} (version {})]'.format(
+            self._identifier,
+            self._version,
+        )
+
+    # --------------------------------------------------------------------------
+    def __call__(self, *args, **kwargs):
+        snapshot, plugin = self._resolved
+
+        if snapshot is not self._factory._snapshot:
+            plugin = self._resolve()
+
+        return plugin(*args, **kwargs)
+
+    # --------------------------------------------------------------------------
+    def _resolve(self):
+        """
+        Resolves the plugin within the current state of the factory.
+
+        :return: Plugin Class
+        """
+        factory = self._factory
+        snapshot = factory._snapshot
+
+        plugin = factory._request_loaded(
+            self._identifier,
+            self._version,
+            warn=False,
+            snapshot=snapshot,
+        )[1]
+
+        if plugin is None:
+            raise KeyError(
+                'Could not find plugin : {} (version {})'.format(
+                    self._identifier,
+                    self._version,
+                ),
+            )
+
+        self._resolved = (snapshot, plugin)
+        return plugin
+
+    # --------------------------------------------------------------------------
+    @property
+    def plugin(self):
+        """
+        Returns the plugin class instances are currently created from,
+        resolving it again if the factory has changed.
+
+        :return: Plugin Class
+        """
+        snapshot, plugin = self._resolved
+
+        if snapshot is not self._factory._snapshot:
+            plugin = self._resolve()
+
+        return plugin
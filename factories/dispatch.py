@@ -0,0 +1,376 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from .constants import log
+
+import re
+import os
+import threading
+import collections
+
+
+# ------------------------------------------------------------------------------
+class DispatchTable(object):
+    """
+    Selects which of a list of plugins should handle a given value, as
+    decided by a predicate method on each plugin (such as can_read).
+
+    Rather than calling the predicate on every plugin, plugins may declare
+    cheap static selectors for the predicate within a selectors class
+    attribute. Each selector describes the values the predicate would
+    return True for:
+
+        * extensions: Strings the value must end with, such as '.json'
+        * patterns: Regular expressions the value must contain a match
+            for. These are combined into a single expression, so any flags
+            must be given inline and scoped, such as '(?i:data)'
+        * values: Values the value must be equal to
+
+    .. code-block:: python
+
+        >>> class JSONReader(ReaderPlugin):
+        ...
+        ...     selectors = dict(
+        ...         can_read=dict(extensions=['.json']),
+        ...     )
+
+    The selectors of all the plugins are compiled into lookup tables when
+    the dispatch table is built. Plugins which declare a selector for the
+    predicate are never asked the predicate itself, whilst those which do
+    not are asked as normal. Either way, the first plugin (in the order
+    given) which would handle the value is the one returned.
+
+    Selectors are inherited along with the predicate they describe, but a
+    plugin which overrides the predicate without declaring its own
+    selector for it is asked the predicate.
+
+    The selectors are tested against the first argument given to the
+    predicate. Results are not remembered here - see SelectionCache.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, plugins, predicate_name):
+        """
+        :param plugins: The plugins to select from, in order of preference
+        :type plugins: list(class, class, ...)
+
+        :param predicate_name: Name of the predicate method on the plugins,
+            and the key for their selectors
+        :type predicate_name: str
+        """
+        self._plugins = list(plugins)
+        self._predicate_name = predicate_name
+
+        # -- Extension to the index of the first plugin which declared it,
+        # -- for extensions which start with a dot
+        self._extensions = dict()
+
+        # -- (suffix, index) for any other extensions, which are tested
+        # -- against the end of the value in turn
+        self._suffixes = list()
+
+        # -- Value to the index of the first plugin which declared it
+        self._values = dict()
+
+        # -- All the patterns combined into one expression, with a group
+        # -- per plugin from which we can get the index of that plugin
+        self._pattern = None
+
+        # -- Indices of the plugins which must be asked the predicate
+        self._fallbacks = list()
+
+        self._compile()
+
+    # --------------------------------------------------------------------------
+    def _selector(self, plugin):
+        """
+        Returns the selector the given plugin declares for the predicate.
+        Only the selectors declared on or below the class which defines
+        the predicate are used, as any declared above it describe a
+        predicate which has since been overridden.
+
+        :param plugin: The plugin to get the selector for
+        :type plugin: class
+
+        :return: dict or None
+        """
+        for class_type in getattr(plugin, '__mro__', (plugin,)):
+            attributes = vars(class_type)
+            selector = (attributes.get('selectors') or dict()).get(
+                self._predicate_name,
+            )
+
+            if selector:
+                return selector
+
+            if self._predicate_name in attributes:
+                return None
+
+        return None
+
+    # --------------------------------------------------------------------------
+    def _compile(self):
+        """
+        Builds the lookup tables from the selectors of each plugin.
+
+        :return: None
+        """
+        patterns = list()
+        pattern_indices = list()
+
+        for index, plugin in enumerate(self._plugins):
+            selector = self._selector(plugin)
+
+            if not selector:
+                self._fallbacks.append(index)
+                continue
+
+            for extension in selector.get('extensions', ()):
+                if extension.startswith('.') and not (
+                    '/' in extension or '\\' in extension
+                ):
+                    self._extensions.setdefault(extension, index)
+
+                else:
+                    self._suffixes.append((extension, index))
+
+            for value in selector.get('values', ()):
+                self._values.setdefault(value, index)
+
+            for pattern in selector.get('patterns', ()):
+                try:
+                    re.compile(pattern)
+
+                except re.error:
+                    log.warning(
+                        'Invalid {} pattern on {} : {}'.format(
+                            self._predicate_name,
+                            plugin,
+                            pattern,
+                        ),
+                    )
+
+                    # -- The plugin is asked the predicate instead
+                    self._fallbacks.append(index)
+                    continue
+
+                patterns.append(
+                    '.*?(?P<_plugin_{}>{})'.format(index, pattern),
+                )
+                pattern_indices.append(index)
+
+        if not patterns:
+            self._fallbacks = sorted(set(self._fallbacks))
+            return
+
+        # -- Each alternative is tried at every position before the next
+        # -- is tried, so the first plugin with a matching pattern wins
+        try:
+            self._pattern = re.compile('|'.join(patterns), re.DOTALL)
+
+        except re.error:
+            # -- Patterns which are valid alone may not be when combined,
+            # -- such as where they share group names. In that case those
+            # -- plugins are simply asked the predicate.
+            log.warning(
+                'Could not combine the {} patterns'.format(
+                    self._predicate_name,
+                ),
+            )
+            self._fallbacks = sorted(set(self._fallbacks + pattern_indices))
+
+    # --------------------------------------------------------------------------
+    def _static_match(self, value):
+        """
+        Returns the index of the first plugin whose selectors match the
+        given value, or None if there are none.
+
+        :return: int or None
+        """
+        matches = list()
+
+        if isinstance(value, str):
+            if self._extensions:
+                # -- Test every suffix of the file name which starts
+                # -- with a dot
+                name = os.path.basename(value)
+                position = name.find('.')
+
+                while position != -1:
+                    if name[position:] in self._extensions:
+                        matches.append(self._extensions[name[position:]])
+
+                    position = name.find('.', position + 1)
+
+            for suffix, index in self._suffixes:
+                if value.endswith(suffix):
+                    matches.append(index)
+                    break
+
+            if self._pattern:
+                match = self._pattern.match(value)
+
+                if match:
+                    matches.append(int(match.lastgroup.split('_')[-1]))
+
+        if self._values:
+            try:
+                if value in self._values:
+                    matches.append(self._values[value])
+
+            except TypeError:
+                pass
+
+        return min(matches) if matches else None
+
+    # --------------------------------------------------------------------------
+    def select(self, *args):
+        """
+        Returns the first plugin which would handle the given arguments,
+        or None if no plugins would.
+
+        :return: class or None
+        """
+        best = None
+
+        if args:
+            best = self._static_match(args[0])
+
+        # -- Only plugins ahead of the best static match need to be asked
+        # -- the predicate
+        for index in self._fallbacks:
+            if best is not None and index > best:
+                break
+
+            if getattr(self._plugins[index], self._predicate_name)(*args):
+                return self._plugins[index]
+
+        if best is None:
+            return None
+
+        return self._plugins[best]
+
+
+# ------------------------------------------------------------------------------
+class SelectionCache(object):
+    """
+    A least recently used cache of the plugins chosen by Factory.dispatch,
+    keyed by the predicate name and the arguments given.
+
+    The cache belongs to a single state of the factory (its snapshot).
+    Whenever it is used with a different state - which happens as soon as
+    the plugins or their disabled states change - everything it holds is
+    forgotten. The hit and miss counts are kept throughout, to help with
+    choosing a size.
+
+    As remembered results are reused without asking the plugins again,
+    this should only be used where the predicates depend only on their
+    arguments.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, size=128):
+        """
+        :param size: The most results to hold before the least recently
+            used is forgotten
+        :type size: int
+        """
+        self.size = size
+
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._owner = None
+
+        self.hits = 0
+        self.misses = 0
+
+    # --------------------------------------------------------------------------
+    def clear(self):
+        """
+        Forgets all the remembered results, but not the hit and miss counts.
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+            self._owner = None
+
+    # --------------------------------------------------------------------------
+    def fetch(self, owner, key, resolve):
+        """
+        Returns the remembered result for the given key, calling resolve to
+        get (and remember) the result if there is none.
+
+        :param owner: The state the result belongs to. If this is not the
+            state the cache currently holds results for they are forgotten.
+
+        :param key: The key to remember the result against. Keys which
+            cannot be hashed are resolved every time.
+
+        :param resolve: Callable taking no arguments which gives the result
+        :type resolve: callable
+
+        :return: The result
+        """
+        with self._lock:
+            if owner is not self._owner:
+                self._entries.clear()
+                self._owner = owner
+
+            try:
+                result = self._entries[key]
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+            except KeyError:
+                self.misses += 1
+
+            except TypeError:
+                self.misses += 1
+                return resolve()
+
+        # -- Resolve without holding the lock, so slow predicates do
+        # -- not hold up other threads
+        result = resolve()
+
+        with self._lock:
+            if owner is self._owner:
+                self._entries[key] = result
+
+                while len(self._entries) > self.size:
+                    self._entries.popitem(last=False)
+
+        return result
+
+    # --------------------------------------------------------------------------
+    def as_dict(self):
+        """
+        Returns the hit and miss counts along with the current and maximum
+        number of results held.
+
+        :return: dict
+        """
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                entries=len(self._entries),
+                size=self.size,
+            )
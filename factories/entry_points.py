@@ -0,0 +1,136 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import sys
+import threading
+import importlib.metadata
+
+
+# ------------------------------------------------------------------------------
+# -- Reading the entry points means reading the metadata of every installed
+# -- distribution, so we do it once per environment (the sys.prefix and
+# -- sys.path) and hold every group, keyed by that environment. This is
+# -- shared by all factories.
+_ENTRY_POINTS = dict()
+_LOCK = threading.Lock()
+
+
+# ------------------------------------------------------------------------------
+def _environment():
+    """
+    Returns a key describing where distributions are currently found.
+
+    :return: tuple
+    """
+    return sys.prefix, tuple(
+        path
+        for path in sys.path
+        if isinstance(path, str)
+    )
+
+
+# ------------------------------------------------------------------------------
+def _read_all():
+    """
+    Reads the entry points of every installed distribution.
+
+    :return: dict(group: tuple((name, value), ...))
+    """
+    groups = dict()
+    seen = set()
+
+    for distribution in importlib.metadata.distributions():
+
+        # -- A distribution found in more than one place on the sys.path
+        # -- is only taken from the first, as that is what is imported
+        name = distribution.metadata['Name']
+
+        if name in seen:
+            continue
+
+        seen.add(name)
+
+        for entry_point in distribution.entry_points:
+            groups.setdefault(entry_point.group, list()).append(
+                (entry_point.name, entry_point.value),
+            )
+
+    return {
+        group: tuple(entries)
+        for group, entries in groups.items()
+    }
+
+
+# ------------------------------------------------------------------------------
+def find(group):
+    """
+    Returns the name and value of each entry point within the given group,
+    reading the installed distributions only if they have not been read
+    within the current environment already.
+
+    :param group: The name of the entry point group
+    :type group: str
+
+    :return: tuple((name, value), ...)
+    """
+    environment = _environment()
+
+    with _LOCK:
+        groups = _ENTRY_POINTS.get(environment)
+
+        if groups is None:
+            groups = _ENTRY_POINTS[environment] = _read_all()
+
+    return groups.get(group, ())
+
+
+# ------------------------------------------------------------------------------
+def load(group, name, value):
+    """
+    Loads and returns the target of the given entry point, which may be a
+    module or any attribute within one.
+
+    :param group: The name of the entry point group
+    :type group: str
+
+    :param name: The name of the entry point
+    :type name: str
+
+    :param value: The entry point value, such as "package.module:Class"
+    :type value: str
+
+    :return: The loaded module or attribute
+    """
+    return importlib.metadata.EntryPoint(
+        name=name,
+        value=value,
+        group=group,
+    ).load()
+
+
+# ------------------------------------------------------------------------------
+def clear_cache():
+    """
+    Forgets the entry points read so far, such that distributions installed
+    since then are found.
+
+    :return: None
+    """
+    with _LOCK:
+        _ENTRY_POINTS.clear()
@@ -25,8 +25,10 @@ class DataReader(object):
     # --------------------------------------------------------------------------
     def read(self, filepath):
         """
-        Generic read method which will cycle over all the available plugins
-        and utilise the one which is capable of operating on the given file
+        Generic read method which will utilise the first of the available
+        plugins which is capable of operating on the given file. Plugins
+        which declare the extensions they can read are picked without
+        having to ask them.
 
         :param filepath: Absolute path to data to be read
         :type filepath: str
@@ -34,10 +36,10 @@ class DataReader(object):
         :return: Dictionary of data stored in the file
         :rtype: dict
         """
-        for plugin in self.factory.plugins():
+        plugin = self.factory.dispatch('can_read', filepath)
 
-            if plugin.can_read(filepath):
-                return plugin.contents(filepath)
+        if plugin:
+            return plugin.contents(filepath)
 
         raise Exception(
             'No plugin able to read : %s' % filepath
@@ -49,6 +51,11 @@ class ReaderPlugin(object):
 
     version = 1
 
+    # -- Plugins can also declare what they can read here, such as
+    # -- dict(can_read=dict(extensions=['.txt'])), allowing the reader
+    # -- to pick them without calling can_read
+    selectors = dict()
+
     def contents(self, filepath):
         """
         This should return a dictionary of data collated from the
@@ -8,6 +8,10 @@ class JSONReader(ReaderPlugin):
 
     version = 1
 
+    selectors = dict(
+        can_read=dict(extensions=['.json']),
+    )
+
     # --------------------------------------------------------------------------
     @classmethod
     def contents(cls, filepath):
@@ -40,6 +44,10 @@ class INIReader(ReaderPlugin):
 
     version = 1
 
+    selectors = dict(
+        can_read=dict(extensions=['.ini']),
+    )
+
     # --------------------------------------------------------------------------
     @classmethod
     def contents(cls, filepath):
@@ -19,16 +19,49 @@ SOFTWARE.
 """
 from . import constants
 from .constants import log
+from .lazy import (
+    LazyPlugin,
+    scan as lazy_scan,
+)
+from .cache import DiscoveryCache
+from .watcher import PathWatcher
+from .resolver import ModuleResolver
+from .record import PluginRecord
+from .pool import InstancePool
+from .constructor import Constructor
+from . import manifest as plugin_manifest
+from . import entry_points as plugin_entry_points
+from . import archive as plugin_archive
+from .snapshot import Snapshot
+from .dispatch import (
+    DispatchTable,
+    SelectionCache,
+)
 
 import re
 import os
 import sys
-import uuid
 import time
+import hashlib
 import inspect
+import functools
+import collections
+import asyncio
 import logging
+import threading
+import contextlib
 import signalling
-from importlib.machinery import SourceFileLoader
+import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+
+# ------------------------------------------------------------------------------
+# -- Modules loaded directly from file (rather than imported) are tracked
+# -- here, by module name, against the modification time and size of the
+# -- file at the time it was loaded. This is shared by all factories as
+# -- the modules themselves live in the (shared) sys.modules.
+_DIRECT_LOADS = dict()
 
 
 # ------------------------------------------------------------------------------
@@ -48,6 +81,33 @@ def enable_debugging(state=True):
         log.setLevel(logging.INFO)
 
 
+# ------------------------------------------------------------------------------
+class _Cancelled(Exception):
+    """
+    Raised internally to abandon a change which has been cancelled (see
+    Factory._run_async).
+    """
+
+
+# ------------------------------------------------------------------------------
+def _changes(func):
+    """
+    Decorator for Factory methods which change the factory, ensuring the
+    change is made whilst holding the factory lock (see Factory._writing).
+
+    :param func: The method to wrap
+    :type func: callable
+
+    :return: callable
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self._writing():
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
 # ------------------------------------------------------------------------------
 class Factory(object):
     """
@@ -74,6 +134,11 @@ class Factory(object):
     Many of these restrictions or missing features are relatively straight
     forward to implement, but as a starting point to getting used to - or
     experimenting with the plugin/factory approach this should suffice.
+
+    A factory can be used from multiple threads at once. Changes (such as
+    adding paths or reloading) are made one at a time, and requests never
+    wait on them - they always see the plugins as they were either before
+    or after a change, never part way through one.
     
     It is recommended that you explore the plugged.examples location to 
     see a variety of use cases. but a quick peek at a code example might
@@ -116,6 +181,10 @@ class Factory(object):
     # -- file types
     _PY_CHECK = re.compile('([a-zA-Z].*)(\.py$|\.pyc$)')
 
+    # -- The most deduplicated warnings to remember, beyond which the
+    # -- least recently logged are forgotten
+    _WARNED_SIZE = 1024
+
     # --------------------------------------------------------------------------
     def __init__(self,
                  abstract,
@@ -125,7 +194,16 @@ class Factory(object):
                  envvar=None,
                  mechanism=0,
                  regex_filter=None,
-                 log_errors=True):
+                 log_errors=True,
+                 cache_dir=None,
+                 lazy=False,
+                 workers=None,
+                 instrumentation=None,
+                 deduplicate_warnings=False,
+                 selection_cache_size=None,
+                 manifest=None,
+                 verify_manifest=False,
+                 pool_size=None):
         """
         :param abstract: The abstract class to utilise when searching for
             plugins within the add_pathed plugin locations
@@ -161,6 +239,61 @@ class Factory(object):
             when about to parse a python file as a plugin
         :type regex_filter: regular expression or str (which will be converted to a
             regular expression).
+
+        :param cache_dir: Optional folder in which to store a discovery cache.
+            When given, the factory records what each plugin file contained
+            so that unchanged files can skip inspection (or loading entirely
+            if they held no plugins) the next time they are searched.
+        :type cache_dir: str
+
+        :param lazy: If True, plugin files are parsed rather than imported
+            when searching paths. Plugins which subclass the abstract by name
+            and have literal identifier and version attributes are registered
+            without importing their module, which is then only imported when
+            the plugin is first requested. Files which cannot be understood
+            this way are imported as normal.
+        :type lazy: bool
+
+        :param workers: Default number of threads to use when searching
+            paths (see add_path). By default paths are searched serially.
+        :type workers: int
+
+        :param instrumentation: Optional object to record metrics with, such
+            as a FactoryStats instance. When given, the cost of loading each
+            file and the count and latency of each request and instance call
+            is recorded, and can be accessed through stats().
+        :type instrumentation: FactoryStats
+
+        :param deduplicate_warnings: If True, the warnings logged when a
+            requested plugin (or version) cannot be found are only logged
+            once per identifier and version until the plugins change, rather
+            than on every request. Only the most recently logged warnings
+            are remembered.
+        :type deduplicate_warnings: bool
+
+        :param selection_cache_size: If given, the plugins chosen by dispatch
+            are remembered for up to this many predicate and argument
+            combinations, until the plugins (or their disabled states)
+            change. This should only be used where the predicates depend
+            only on their arguments. See selection_cache_stats.
+        :type selection_cache_size: int
+
+        :param manifest: Optional manifest (or path to a manifest file) as
+            written by "python -m factories build-manifest". The plugins it
+            describes are registered without searching or importing
+            anything, and each module is only imported when one of its
+            plugins is first requested. See add_manifest.
+        :type manifest: str or dict
+
+        :param verify_manifest: If True, each file described by the
+            manifest is checked against the hash recorded for it before it
+            is imported, and is refused if it has changed.
+        :type verify_manifest: bool
+
+        :param pool_size: If given, instances handed out by acquire are
+            pooled once released, holding up to this many idle instances
+            of each plugin. See acquire.
+        :type pool_size: int
         """
         # -- Store our incoming variables
         self._abstract = abstract
@@ -173,11 +306,51 @@ class Factory(object):
         self.paths_changed = signalling.WeakSignal()
         self.plugins_changed = signalling.WeakSignal()
 
-        # -- Store a list of plugins
-        self._plugins = list()
-
-        # -- We store a list of plugins which are disabled
-        self._disabled = list()
+        # -- When individual files are reloaded (such as when watching
+        # -- paths) this is emitted with a dictionary describing which
+        # -- identifiers were added, removed and updated
+        self.plugins_reloaded = signalling.WeakSignal()
+
+        # -- All changes to the factory are made whilst holding this lock,
+        # -- and are only made visible to readers (through a new snapshot)
+        # -- once the outermost change is complete. Any signals emitted
+        # -- during a change are held back until that point too.
+        self._lock = threading.RLock()
+        self._write_depth = 0
+        self._pending_signals = list()
+
+        # -- Whilst an asynchronous change is being made this holds the
+        # -- event which is set if that change is cancelled
+        self._cancel_event = None
+
+        # -- Store a PluginRecord for each plugin, holding its resolved
+        # -- identifier and version along with where it came from. This
+        # -- allows us to remove the plugins from a single path or file
+        # -- without searching everything again.
+        self._records = list()
+
+        # -- Alongside the records we hold an index of the resolved
+        # -- identifiers, allowing requests to be served without scanning
+        # -- every plugin. Each identifier maps to a list of records in the
+        # -- order they were registered, and - for versioned factories - a
+        # -- version to record lookup.
+        self._index = dict()
+        self._version_index = dict()
+
+        # -- Snapshots are published incrementally, so we track (in the
+        # -- order they were changed) the identifiers whose index entries
+        # -- have changed since the last one and whether it must instead be
+        # -- rebuilt from scratch
+        self._published = None
+        self._touched = dict()
+        self._rebuild = True
+
+        # -- Records of lazy plugins which could not be loaded, which are
+        # -- removed by the next change
+        self._failed_records = list()
+
+        # -- We store the identifiers of the plugins which are disabled
+        self._disabled = set()
 
         # -- The regex filter can be given to force the factory
         # -- to only attempt to load python files which match the given
@@ -190,12 +363,75 @@ class Factory(object):
         # -- Store whether we should immediately log errors
         self._log_errors = log_errors
 
+        # -- When deduplicating warnings we track those already logged
+        self._deduplicate_warnings = deduplicate_warnings
+        self._warned = collections.OrderedDict()
+
+        # -- If asked to, we remember the plugins chosen by dispatch
+        self._selection_cache = None
+
+        if selection_cache_size:
+            self._selection_cache = SelectionCache(selection_cache_size)
+
+        # -- If asked to, we pool the instances given out by acquire
+        self._pool = None
+
+        if pool_size:
+            self._pool = InstancePool(pool_size)
+
+        # -- This is used to work out the module names of files
+        # -- which are importable
+        self._resolver = ModuleResolver()
+
+        # -- If we're given a cache location then we hold a discovery
+        # -- cache to reduce the cost of searching paths
+        self._cache = None
+
+        if cache_dir:
+            self._cache = DiscoveryCache(cache_dir, abstract)
+
+        # -- When searching lazily we hold onto the modules we load on
+        # -- behalf of lazy plugins, so that plugins sharing a file also
+        # -- share the module
+        self._lazy = lazy
+        self._lazy_modules = dict()
+
+        # -- Those modules are loaded (by readers) whilst holding this
+        # -- rather than the factory lock, so that requests never wait on
+        # -- changes. Changes only take this to forget modules.
+        self._lazy_lock = threading.RLock()
+
+        # -- Store how many threads should be used when searching
+        self._workers = workers
+
+        # -- If we're asked to watch our paths for changes we hold
+        # -- the watcher here
+        self._watcher = None
+
+        # -- Store the object (if any) we should record metrics with
+        self._instrumentation = instrumentation
+
         # -- Store all the paths we add_path regardless
         # -- of what plugins they hold. We use a dictionary
         # -- for this so we can store the Mechanisms for each
         # -- path too
         self._add_pathed_paths = dict()
 
+        # -- Equally we store the entry point groups we have been given,
+        # -- in the order they were given
+        self._entry_point_groups = list()
+
+        # -- The plugins, index, disabled states and paths above are only
+        # -- ever touched by whoever holds the lock. Everything which reads
+        # -- from the factory does so through this snapshot instead, which
+        # -- is replaced (never altered) after each change.
+        self._snapshot = Snapshot()
+
+        # -- Register anything described by a manifest before searching
+        # -- any other paths
+        if manifest:
+            self.add_manifest(manifest, verify=verify_manifest)
+
         # -- Any paths we're giving during the init we should
         # -- add_path
         if paths and isinstance(paths, (list, tuple)):
@@ -211,33 +447,388 @@ class Factory(object):
     def __repr__(self):
         return '[FACTORY - Identifier: {}, Plugin Count: {}]'.format(
             self._identifier,
-            len(self._plugins),
+            len(self._snapshot.records),
+        )
+
+    # --------------------------------------------------------------------------
+    @contextlib.contextmanager
+    def _writing(self, signals=None):
+        """
+        Context manager which must wrap every change made to the factory.
+
+        Changes are serialised through the factory lock. Once the outermost
+        change is complete a new snapshot is published for readers and
+        the lock is released before any signals raised during the change
+        are emitted, so slots always see the completed change and are free
+        to call back into the factory.
+
+        :param signals: If given, the signals raised during the change are
+            added to this list as (signal, args) rather than being emitted,
+            allowing the caller to emit them elsewhere.
+        :type signals: list
+
+        :return: None
+        """
+        pending = list()
+
+        self._lock.acquire()
+        self._write_depth += 1
+
+        try:
+            if self._write_depth == 1:
+                self._forget_failed()
+
+            yield
+
+        finally:
+            self._write_depth -= 1
+
+            if not self._write_depth:
+                self._publish()
+                pending, self._pending_signals = self._pending_signals, list()
+
+            self._lock.release()
+
+        if signals is not None:
+            signals.extend(pending)
+            return
+
+        for signal, args in pending:
+            signal.emit(*args)
+
+    # --------------------------------------------------------------------------
+    def _save_state(self):
+        """
+        Returns a copy of everything a change may alter, such that it can
+        be put back with _restore_state. This must only be called whilst
+        holding the lock.
+
+        :return: tuple
+        """
+        with self._lazy_lock:
+            lazy_modules = dict(self._lazy_modules)
+
+        return (
+            list(self._records),
+            {
+                identifier: list(entries)
+                for identifier, entries in self._index.items()
+            },
+            {
+                identifier: dict(versions)
+                for identifier, versions in self._version_index.items()
+            },
+            set(self._disabled),
+            lazy_modules,
+            dict(self._add_pathed_paths),
+            list(self._entry_point_groups),
         )
 
     # --------------------------------------------------------------------------
-    def _log(self, message, is_warning=False):
+    def _restore_state(self, state):
+        """
+        Puts back a state previously given by _save_state. This must only
+        be called whilst holding the lock.
+
+        :param state: The state to put back
+        :type state: tuple
+
+        :return: None
+        """
+        (
+            self._records,
+            self._index,
+            self._version_index,
+            self._disabled,
+            lazy_modules,
+            self._add_pathed_paths,
+            self._entry_point_groups,
+        ) = state
+
+        with self._lazy_lock:
+            self._lazy_modules = lazy_modules
+
+        self._rebuild = True
+        self._warned.clear()
+
+    # --------------------------------------------------------------------------
+    def _check_cancelled(self):
+        """
+        Raises _Cancelled if the asynchronous change currently being made
+        has been cancelled.
+
+        :return: None
+        """
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            raise _Cancelled()
+
+    # --------------------------------------------------------------------------
+    async def _run_async(self, func, executor, *args, **kwargs):
+        """
+        Carries out the given change in an executor, so the event loop is
+        never blocked by searching, loading or inspecting files.
+
+        The change is only made visible once it is complete, and any signals
+        it raises are then emitted on the event loop thread. If the awaiting
+        task is cancelled the change is abandoned at the next file and the
+        factory is left exactly as it was.
+
+        :param func: The method making the change
+        :type func: callable
+
+        :param executor: The executor to run the change in. If None the
+            loops default executor is used.
+        :type executor: concurrent.futures.Executor
+
+        :return: Whatever the given method returns
+        """
+        loop = asyncio.get_running_loop()
+        cancel_event = threading.Event()
+        signals = list()
+
+        def run():
+            with self._writing(signals=signals):
+                state = self._save_state()
+                self._cancel_event = cancel_event
+
+                try:
+                    self._check_cancelled()
+                    return func(*args, **kwargs)
+
+                except _Cancelled:
+                    self._restore_state(state)
+                    self._pending_signals = list()
+                    raise
+
+                finally:
+                    self._cancel_event = None
+
+        future = loop.run_in_executor(executor, run)
+
+        try:
+            result = await asyncio.shield(future)
+
+        except asyncio.CancelledError:
+            cancel_event.set()
+
+            # -- Wait for the change to either be abandoned or (if it was
+            # -- already complete) committed before passing on the
+            # -- cancellation
+            try:
+                await future
+
+            except _Cancelled:
+                signals = list()
+
+            for signal, args in signals:
+                signal.emit(*args)
+
+            raise
+
+        for signal, args in signals:
+            signal.emit(*args)
+
+        return result
+
+    # --------------------------------------------------------------------------
+    def _emit(self, signal, *args):
+        """
+        Emits the given signal once the current change is complete (see
+        _writing), or immediately if no change is being made.
+
+        :param signal: The signal to emit
+
+        :param args: Arguments to emit the signal with
+
+        :return: None
+        """
+        with self._lock:
+            if self._write_depth:
+                self._pending_signals.append((signal, args))
+                return
+
+        signal.emit(*args)
+
+    # --------------------------------------------------------------------------
+    def _publish(self):
+        """
+        Builds a new snapshot from the current plugins, index, disabled
+        states and paths and makes it the one readers will use. This must
+        only be called whilst holding the lock.
+
+        Only the index entries of identifiers which have changed since the
+        previous snapshot are copied, so registering plugins one at a time
+        does not rebuild the whole index on every change.
+
+        :return: None
+        """
+        previous = self._published
+
+        # -- Whether plugins which could be requested before may no
+        # -- longer be, so their pooled instances must be dropped
+        retain = self._rebuild
+
+        if previous is None or self._rebuild:
+            snapshot = Snapshot(
+                records=tuple(self._records),
+                index={
+                    identifier: tuple(entries)
+                    for identifier, entries in self._index.items()
+                },
+                versions={
+                    identifier: dict(versions)
+                    for identifier, versions in self._version_index.items()
+                },
+                disabled=frozenset(self._disabled),
+                enabled=tuple(
+                    identifier
+                    for identifier in self._index
+                    if identifier not in self._disabled
+                ),
+                paths=tuple(self._add_pathed_paths),
+            )
+
+        else:
+            records = previous.records
+            index = previous.index
+            versions = previous.versions
+            enabled = previous.enabled
+
+            if self._touched:
+                records = tuple(self._records)
+                index = dict(index)
+                versions = dict(versions)
+                added = list()
+
+                for identifier in self._touched:
+                    if identifier not in index and (
+                        identifier not in self._disabled
+                    ):
+                        added.append(identifier)
+
+                    index[identifier] = tuple(self._index[identifier])
+
+                    if identifier in self._version_index:
+                        # -- A version registered again replaces the
+                        # -- plugin previously held for it
+                        if identifier in versions:
+                            retain = True
+
+                        versions[identifier] = dict(
+                            self._version_index[identifier],
+                        )
+
+                # -- Identifiers are only ever added to the end of the
+                # -- index, and nothing has been removed, so new ones can
+                # -- simply follow the previously enabled ones
+                enabled = enabled + tuple(added)
+
+            disabled = previous.disabled
+
+            if disabled != self._disabled:
+                disabled = frozenset(self._disabled)
+                enabled = tuple(
+                    identifier
+                    for identifier in self._index
+                    if identifier not in disabled
+                )
+
+            snapshot = Snapshot(
+                records=records,
+                index=index,
+                versions=versions,
+                disabled=disabled,
+                enabled=enabled,
+                paths=tuple(self._add_pathed_paths),
+            )
+
+        self._published = snapshot
+        self._snapshot = snapshot
+        self._touched = dict()
+        self._rebuild = False
+
+        # -- Instances of plugins which have been reloaded, replaced or
+        # -- removed must not be handed out again
+        if retain and self._pool is not None:
+            self._pool.retain(self._requestable(self._snapshot))
+
+    # --------------------------------------------------------------------------
+    def _requestable(self, snapshot):
+        """
+        Returns the records of the plugins within the given snapshot which
+        can be requested. Where the factory is versioned, a record whose
+        version has since been registered again cannot be.
+
+        :param snapshot: The snapshot to get the records from
+        :type snapshot: Snapshot
+
+        :return: list(PluginRecord, ...)
+        """
+        if not self._version:
+            return snapshot.records
+
+        return [
+            record
+            for versions in snapshot.versions.values()
+            for record in versions.values()
+        ]
+
+    # --------------------------------------------------------------------------
+    def _log(self, message, *args, is_warning=False, once=False):
         """
         Internal logging logic to handle errors and warnings.
 
-        :param message:
-        :param is_warning:
+        The message is only formatted (with the given arguments) if the
+        logger will actually output it, so callers should pass their values
+        as arguments rather than formatting the message themselves.
+
+        :param message: Message to log, with {} placeholders for the args
+        :param args: Values to format into the message
+        :param is_warning: Whether this should be logged as a warning
+        :param once: If True, and the factory was asked to deduplicate
+            warnings, then this exact message is only logged once until
+            the plugins change.
         :return:
         """
-        # -- All factory logs include the abstract so it can be
-        # -- easily identified
-        message = '({}) {}'.format(
-            self._abstract.__name__,
-            message,
-        )
+        level = logging.DEBUG
+
+        if is_warning and self._log_errors:
+            level = logging.WARNING
+
+        if not log.isEnabledFor(level):
+            return
+
+        if once and self._deduplicate_warnings:
+            key = (message, args)
+
+            # -- Requests log without holding the lock, so the warnings
+            # -- may be forgotten by a change whilst we look at them
+            try:
+                self._warned.move_to_end(key)
+                return
+
+            except KeyError:
+                self._warned[key] = None
+
+            while len(self._warned) > self._WARNED_SIZE:
+                try:
+                    self._warned.popitem(last=False)
+
+                except KeyError:
+                    break
 
         # -- Wrap this in a try, because we never want to fail because
         # -- we cannot log a message for any reason.
         try:
-            if is_warning and self._log_errors:
-                log.warning(message)
-
-            else:
-                log.debug(message)
+            # -- All factory logs include the abstract so it can be
+            # -- easily identified
+            log.log(
+                level,
+                '({}) {}'.format(
+                    self._abstract.__name__,
+                    message.format(*args),
+                ),
+            )
 
         except:
             pass
@@ -252,6 +843,11 @@ class Factory(object):
 
         :return: str
         """
+        # -- Lazily discovered plugins have their identifier
+        # -- resolved up-front
+        if isinstance(plugin, LazyPlugin):
+            return plugin.identifier
+
         # -- Pull out the object from the plugin
         identifier = getattr(plugin, self._identifier)
 
@@ -272,6 +868,8 @@ class Factory(object):
 
         :return: int or float
         """
+        if isinstance(plugin, LazyPlugin):
+            return plugin.version
 
         # -- Pull out the object from the plugin
         identifier = getattr(plugin, self._version)
@@ -284,175 +882,922 @@ class Factory(object):
         return identifier
 
     # --------------------------------------------------------------------------
-    def _mechanism_load(self, filepath):
+    def _add_plugin(self, plugin, path=None, filepath=None, mechanism=None):
+        """
+        Stores a record of the given plugin and adds it to the identifier
+        index. The identifier and version are resolved once here so that
+        lookups do not need to inspect the plugin again.
+
+        :param plugin: Plugin class to store
+
+        :param path: The searched path the plugin was found within, if any
+        :type path: str
+
+        :param filepath: The file the plugin was found within, if any
+        :type filepath: str
+
+        :param mechanism: The loading mechanism used for the file, if any
+        :type mechanism: int
+
+        :return: None
+        """
+        record = PluginRecord(
+            plugin,
+            self._get_identifier(plugin),
+            version=self._get_version(plugin) if self._version else None,
+            filepath=filepath,
+            path=path,
+            mechanism=mechanism,
+            load_time=time.time(),
+        )
+
+        self._index_record(record)
+        self._records.append(record)
+        self._warned.clear()
+
+    # --------------------------------------------------------------------------
+    def _index_record(self, record):
+        """
+        Adds the given plugin record to the identifier index.
+
+        :param record: Record of the plugin to index
+        :type record: PluginRecord
+
+        :return: None
+        """
+        self._index.setdefault(record.identifier, list()).append(record)
+        self._touched[record.identifier] = None
+
+        # -- Where multiple plugins share a version the last one to be
+        # -- registered wins, which mirrors the previous lookup behaviour
+        if self._version:
+            self._version_index.setdefault(
+                record.identifier,
+                dict(),
+            )[record.version] = record
+
+    # --------------------------------------------------------------------------
+    def _remove_plugins(self, predicate):
+        """
+        Removes all the plugins whose record matches the given predicate and
+        rebuilds the index from those which remain. This does not require
+        any of the remaining plugins to be inspected again.
+
+        :param predicate: Callable which is given the PluginRecord of each
+            plugin and returns True if the plugin should be removed
+        :type predicate: callable
+
+        :return: list(PluginRecord, ...) of the removed plugins
+        """
+        records = list()
+        removed = list()
+
+        for record in self._records:
+            if predicate(record):
+                removed.append(record)
+                continue
+
+            records.append(record)
+
+        if not removed:
+            return removed
+
+        self._records = records
+        self._index = dict()
+        self._version_index = dict()
+
+        for record in records:
+            self._index_record(record)
+
+        self._rebuild = True
+        self._warned.clear()
+
+        return removed
+
+    # --------------------------------------------------------------------------
+    def _clear_plugins(self):
+        """
+        Removes all the plugins from the factory along with their index
+        entries.
+
+        :return: None
+        """
+        self._records = list()
+        self._index = dict()
+        self._version_index = dict()
+        self._rebuild = True
+        self._warned.clear()
+
+        with self._lazy_lock:
+            self._lazy_modules = dict()
+
+    # --------------------------------------------------------------------------
+    def _known(self, identifier):
+        """
+        Returns whether a plugin with the given identifier is held by the
+        factory, including any changes currently being made to it. This
+        must only be called whilst holding the lock.
+
+        :return: bool
+        """
+        return identifier in self._index
+
+    # --------------------------------------------------------------------------
+    def _mechanism_load(self, filepath, code=None, reload=False):
         """
         Attemps to find any plugins on the given filepath using the loading
-        Mechanisms. This utilises import.load_source.
+        Mechanisms. This loads the file directly from its location.
 
         As such, loading plugins through this Mechanisms has limitations in
         terms of not being able to utilise relative imports but it has the
         advantage of being able to load plugins from locations outside of
         the sys.path.
 
+        Each file is always loaded into the same module name (see
+        _load_name), and if the file has not changed since it was last
+        loaded the existing module is returned rather than loading it again.
+
         :param filepath: Absolute filepath to the file to inspect
         :type filepath: str
 
+        :param code: The compiled source of the file. If given this is
+            executed rather than reading the file again.
+        :type code: code
+
+        :param reload: If True the file is always loaded again, even if
+            it has not changed
+        :type reload: bool
+
         :return: List of found plugins
         """
-        filename = os.path.splitext(
-            os.path.basename(
-                filepath,
-            ),
-        )[0]
+        module_name = self._load_name(filepath)
 
-        # -- Generate a unique name for the module to prevent
-        # -- us from creating any clashes
-        module_name = filename + str(uuid.uuid4())
-
-        # -- The mechanism to load module files directly is specifically
-        # -- different between python2 and python3, so we need to deal
-        # -- with both cases.
         try:
-            return SourceFileLoader(
-                module_name,
-                filepath,
-            ).load_module()
+            stamp = self._file_stamp(filepath)
+
+            # -- If we have already loaded this file, and it has not
+            # -- changed since, then we can reuse the module
+            module = sys.modules.get(module_name)
+
+            if module is not None and not reload:
+                if _DIRECT_LOADS.get(module_name) == stamp:
+                    return module
+
+            # -- Files within an archive are read through zipimport,
+            # -- which uses any bytecode held alongside them
+            if code is None and plugin_archive.split(filepath):
+                code = plugin_archive.code(filepath)
+
+            spec = importlib.util.spec_from_file_location(module_name, filepath)
+            module = importlib.util.module_from_spec(spec)
+
+            # -- Any previous module for this file is replaced, so it is
+            # -- no longer held by the sys.modules
+            sys.modules[module_name] = module
+            _DIRECT_LOADS[module_name] = stamp
+
+            if code is None:
+                spec.loader.exec_module(module)
+
+            else:
+                exec(code, module.__dict__)
+
+            return module
 
         except BaseException:
+            self._evict_module(filepath)
+
             self._log(
-                'Failed trying to direct load : {} ({})'.format(
-                    filepath,
-                    str(sys.exc_info()),
-                ),
+                'Failed trying to direct load : {} ({})',
+                filepath,
+                sys.exc_info(),
             )
             return None
 
     # --------------------------------------------------------------------------
-    def _mechanism_import(self, filepath):
+    @classmethod
+    def _load_name(cls, filepath):
         """
-        Attemps to resolve a pre-existing package from the given file. If
-        the package is found it is returned otherwise we return None.
+        Returns the module name a directly loaded file is given. This is
+        derived from the absolute path of the file, so the same file is
+        always loaded into the same module.
 
-        :param filepath: Absolute filepath to access
+        :param filepath: Absolute filepath to the file
         :type filepath: str
 
-        :return: List of found plugins
+        :return: str
         """
-        # -- Attempt to get the module name. This will return None
-        # -- if the module does not exist
-        module_name = self._module_address(filepath)
-
-        # -- If the module name exists in the sys.modules list
-        # -- we return that module
-        if module_name:
-            self._log('Found Module : {}'.format(module_name))
-            return sys.modules[module_name]
+        filepath = os.path.abspath(filepath)
 
-        # -- To get here the module is invalid or does not exist
-        # -- so we return None
-        return None
+        return '_factories_{}_{}'.format(
+            re.sub(
+                r'\W',
+                '_',
+                os.path.splitext(os.path.basename(filepath))[0],
+            ),
+            hashlib.sha1(filepath.encode('utf-8')).hexdigest()[:12],
+        )
 
     # --------------------------------------------------------------------------
     @classmethod
-    def _module_address(cls, filepath):
+    def _is_unchanged(cls, filepath):
         """
-        This will take a file and attempt to build up a module address from
-        it by looking at the __init__ files around it.
+        Returns whether the given file has been loaded directly and has not
+        changed since, meaning its module will be reused as it is.
 
-        The module address will only be returned if it is successfully
-        validated in the sys.modules. If no address could be determined this
-        will return None.
-
-        :param filepath: Filepath to attempt to resolve
+        :param filepath: Absolute filepath to the file
         :type filepath: str
 
-        :return:
+        :return: bool
         """
-        # -- Ensure we're working with consistent character
-        # -- types in the path
-        filepath = filepath.replace('\\', '/')
+        module_name = cls._load_name(filepath)
 
-        # -- Do an immediate test to check if this is a lone-python
-        # -- package
-        lone_name = os.path.splitext(
-            os.path.basename(filepath),
-        )[0]
+        if module_name not in _DIRECT_LOADS or module_name not in sys.modules:
+            return False
 
-        # noinspection PyBroadException
+        return _DIRECT_LOADS[module_name] == cls._file_stamp(filepath)
+
+    # --------------------------------------------------------------------------
+    @classmethod
+    def _file_stamp(cls, filepath):
+        """
+        Returns the modification time and size of the given file, or None
+        if the file does not exist. Files within an archive are given the
+        modification time and size of the archive.
+
+        :return: (int, int) or None
+        """
         try:
-            exec('import {}'.format(lone_name))
+            stat = os.stat(filepath)
 
-        except BaseException:
-            pass
+        except OSError:
+            location = plugin_archive.split(filepath)
 
-        # -- If the lone name is in the sys.modules list we then
-        # -- need to check if it equates to the same file we're
-        # -- looking at.
-        if lone_name in sys.modules:
-            add_pathed_path = sys.modules[lone_name].__file__.replace('\\', '/')
-
-            # -- If it matches we return it as we do not need to start
-            # -- looking at __init__ structures
-            if filepath == add_pathed_path:
-                return lone_name
-
-        # -- Collage a list of parts which we can move between
-        parts = filepath.split('/')
-        package_parts = []
-
-        # -- Keep cycling for as long as we have a path to actually
-        # -- cycle
-        while parts:
-
-            # -- Build a path to look for
-            # -- TODO: This needs to work with PYC & PYD files
-            package_test = os.path.join(
-                '/'.join(parts[:-1]),
-                '__init__.py',
-            )
+            if location:
+                return cls._file_stamp(location[0])
+
+            return None
 
-            # -- Get the current part
-            part = parts.pop()
+        return stat.st_mtime_ns, stat.st_size
 
-            # -- If the path does not exist, we have hit the end
-            # -- of the package
-            if not os.path.exists(package_test):
+    # --------------------------------------------------------------------------
+    @classmethod
+    def _evict_module(cls, filepath, stale_only=False):
+        """
+        Removes the module for a directly loaded file from the sys.modules.
 
-                # -- Pop the final component and define the
-                # -- sys path and the package name
-                package_parts.append(part)
-                package_name = '.'.join(reversed(package_parts))
+        :param filepath: Absolute filepath to the file
+        :type filepath: str
 
-                # -- If our package name has a suffix we need to remove
-                # -- it. Note: We do not test the last characters, as
-                # -- this means the test works for .py, .pyc and .pyd files
-                if '.py' in package_name:
-                    package_name = os.path.splitext(str(package_name))[0]
+        :param stale_only: If True the module is only removed if the file
+            has changed or been deleted since it was loaded
+        :type stale_only: bool
 
-                # noinspection PyBroadException
-                try:
-                    exec('import {}'.format(package_name))
+        :return: True if a module was removed
+        """
+        module_name = cls._load_name(filepath)
 
-                except BaseException:
-                    pass
+        if module_name not in _DIRECT_LOADS:
+            return False
 
-                # -- Return our type of data
-                if package_name in sys.modules:
-                    return package_name
+        if stale_only and _DIRECT_LOADS[module_name] == cls._file_stamp(filepath):
+            return False
 
-            # -- Pop the item and keep searching
-            package_parts.append(part)
+        del _DIRECT_LOADS[module_name]
+        sys.modules.pop(module_name, None)
 
-        # -- We could not determine the package name, so we
-        # -- skip out
-        return None
+        return True
 
     # --------------------------------------------------------------------------
-    def clear(self):
+    def _mechanism_import(self, filepath, reload=False):
         """
-        Clears the entire factory of plugins and add_pathed paths.
-
-        :return: None
+        Attemps to resolve a pre-existing package from the given file. If
+        the package is found it is returned otherwise we return None.
+
+        :param filepath: Absolute filepath to access
+        :type filepath: str
+
+        :param reload: If True the module is reloaded from disk
+        :type reload: bool
+
+        :return: List of found plugins
+        """
+        # -- Attempt to get the module name. This will return None
+        # -- if the file is not importable from the sys.path
+        module_name = self._resolver.module_name(filepath)
+
+        if not module_name:
+            return None
+
+        # -- If the module has already been imported we can use it
+        # -- directly, so long as it really is the same file
+        module = sys.modules.get(module_name)
+
+        if module is not None:
+            if getattr(module, '__file__', None) != filepath:
+                return None
+
+            self._log('Found Module : {}', module_name)
+
+            if reload:
+                return importlib.reload(module)
+
+            return module
+
+        # noinspection PyBroadException
+        try:
+            module = importlib.import_module(module_name)
+
+        except BaseException:
+            self._log(
+                'Failed trying to import : {} ({})',
+                module_name,
+                sys.exc_info(),
+            )
+            return None
+
+        self._log('Imported Module : {}', module_name)
+        return module
+
+    # --------------------------------------------------------------------------
+    def _is_plugin_file(self, filename):
+        """
+        Returns whether the given filename is one we should look for
+        plugins within.
+
+        :param filename: Name of the file (without its folder)
+        :type filename: str
+
+        :return: bool
+        """
+        # -- skip any private or structural files, along with
+        # -- any files which are not py files
+        if not self._PY_CHECK.match(filename):
+            return False
+
+        # -- If we're given a regex filter and this does not
+        # -- match then we skip it
+        if self._regex_filter and not self._regex_filter.match(filename):
+            return False
+
+        return True
+
+    # --------------------------------------------------------------------------
+    def _walk(self, path):
+        """
+        Returns all the python files within the given path which we should
+        look for plugins within.
+
+        :param path: Absolute folder location
+        :type path: str
+
+        :return: list(str, str, ...)
+        """
+        if plugin_archive.is_archive(path):
+            return [
+                os.path.join(path, *member.split('/'))
+                for member in plugin_archive.members(path)
+                if self._is_plugin_file(member.rpartition('/')[2])
+            ]
+
+        filepaths = list()
+
+        for root, _, files in os.walk(path):
+            for filename in files:
+                if self._is_plugin_file(filename):
+                    filepaths.append(
+                        os.path.join(
+                            root,
+                            filename
+                        ),
+                    )
+
+        return filepaths
+
+    # --------------------------------------------------------------------------
+    def _collect_files(self, path, workers=None):
+        """
+        Returns all the python files within the given path which we should
+        look for plugins within. If workers are given then each of the top
+        level folders is walked in parallel. The files are returned in the
+        same order regardless.
+
+        :param path: Absolute folder location
+        :type path: str
+
+        :param workers: Number of threads to walk the path with
+        :type workers: int
+
+        :return: list(str, str, ...)
+        """
+        if not workers or plugin_archive.is_archive(path):
+            return self._walk(path)
+
+        filepaths = list()
+
+        # -- Take the top level of the walk ourselves, as this gives us
+        # -- the files at this level and the folders to be walked
+        for root, folders, files in os.walk(path):
+            for filename in files:
+                if self._is_plugin_file(filename):
+                    filepaths.append(
+                        os.path.join(
+                            root,
+                            filename
+                        ),
+                    )
+            break
+
+        else:
+            return filepaths
+
+        # -- os.walk does not follow linked folders, so we must not
+        # -- walk them either
+        folders = [
+            os.path.join(root, folder)
+            for folder in folders
+            if not os.path.islink(os.path.join(root, folder))
+        ]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for folder_filepaths in pool.map(self._walk, folders):
+                filepaths.extend(folder_filepaths)
+
+        return filepaths
+
+    # --------------------------------------------------------------------------
+    def _prepare_file(self, filepath, mechanism, read=False):
+        """
+        Carries out the work needed ahead of loading a file which does not
+        depend on any other file, so that it can be done in parallel.
+
+        This looks the file up in the discovery cache (if we have one) and,
+        if read is True, reads the source and compiles it if it will
+        be directly loaded.
+
+        :param filepath: Absolute filepath to the file to prepare
+        :type filepath: str
+
+        :param mechanism: The loading mechanism to utilise (see add_path)
+        :type mechanism: int
+
+        :param read: Whether the file should be read and compiled
+        :type read: bool
+
+        :return: (filepath, cached_names, source, code)
+        """
+        cached_names = None
+        source = None
+        code = None
+
+        if self._cache:
+            cached_names = self._cache.lookup(filepath)
+
+        # -- Files which we know hold no plugins will not be loaded,
+        # -- and we only read source files
+        if not read or cached_names == [] or not filepath.endswith('.py'):
+            return filepath, cached_names, source, code
+
+        # -- Any failure here is left for the load itself to report
+        # noinspection PyBroadException
+        try:
+            with open(filepath, 'rb') as f:
+                source = f.read()
+
+            if not self._lazy and mechanism != self.IMPORTABLE:
+                code = compile(source, filepath, 'exec', dont_inherit=True)
+
+        except BaseException:
+            pass
+
+        return filepath, cached_names, source, code
+
+    # --------------------------------------------------------------------------
+    def _prepare_files(self, filepaths, mechanism, workers=None):
+        """
+        Yields the prepared data (see _prepare_file) for each of the given
+        files in order. If workers are given the files are read and compiled
+        in a thread pool ahead of them being yielded.
+
+        :param filepaths: Absolute filepaths to prepare
+        :type filepaths: list(str, str, ...)
+
+        :param mechanism: The loading mechanism to utilise (see add_path)
+        :type mechanism: int
+
+        :param workers: Number of threads to prepare files with
+        :type workers: int
+
+        :return: generator
+        """
+        if not workers:
+            for filepath in filepaths:
+                yield self._prepare_file(filepath, mechanism)
+            return
+
+        # -- Files which have been loaded directly and not changed since
+        # -- will reuse their module, so there is nothing to read for them
+        changed_filepaths = [
+            filepath
+            for filepath in filepaths
+            if not self._is_unchanged(filepath)
+        ]
+
+        if not changed_filepaths:
+            for filepath in filepaths:
+                yield self._prepare_file(filepath, mechanism)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                filepath: pool.submit(
+                    self._prepare_file,
+                    filepath,
+                    mechanism,
+                    read=True,
+                )
+                for filepath in changed_filepaths
+            }
+
+            for filepath in filepaths:
+                if filepath in futures:
+                    yield futures.pop(filepath).result()
+
+                else:
+                    yield self._prepare_file(filepath, mechanism)
+
+    # --------------------------------------------------------------------------
+    def _add_file(self,
+                  filepath,
+                  mechanism,
+                  path=None,
+                  cached_names=None,
+                  source=None,
+                  code=None,
+                  reload=False):
+        """
+        Loads the given file and adds any plugins found within it.
+
+        :param filepath: Absolute filepath to the file to load
+        :type filepath: str
+
+        :param mechanism: The loading mechanism to utilise (see add_path)
+        :type mechanism: int
+
+        :param path: The searched path the file was found within
+        :type path: str
+
+        :param cached_names: The plugin names the discovery cache holds for
+            this file, if any
+        :type cached_names: list(str, str, ...)
+
+        :param source: The source of the file, if it has already been read
+        :type source: bytes
+
+        :param code: The compiled source of the file, if it has already
+            been compiled
+        :type code: code
+
+        :param reload: If True, and the file has already been imported,
+            the module is reloaded rather than taken from sys.modules
+        :type reload: bool
+
+        :return: None
+        """
+        # -- Track the time we started the load
+        start_time = time.perf_counter()
+
+        # -- When searching lazily we attempt to find the plugins
+        # -- without importing the file at all
+        if self._lazy and filepath.endswith('.py'):
+            candidates = lazy_scan(
+                filepath,
+                self._abstract,
+                self._identifier,
+                self._version,
+                source=source,
+            )
+
+            if candidates is not None:
+                for class_name, identifier, version in candidates:
+                    self._add_plugin(
+                        LazyPlugin(
+                            functools.partial(
+                                self._load_lazy_module,
+                                mechanism=mechanism,
+                            ),
+                            filepath,
+                            class_name,
+                            identifier,
+                            version,
+                        ),
+                        path=path,
+                        filepath=filepath,
+                        mechanism=mechanism,
+                    )
+                    self._log('Found Lazy Plugin : {}', class_name)
+
+                if self._instrumentation is not None:
+                    self._instrumentation.record_file(
+                        filepath,
+                        0.0,
+                        time.perf_counter() - start_time,
+                        len(candidates),
+                        len(candidates),
+                    )
+                return
+
+        # -- If we have a discovery cache we can find out what this
+        # -- file contained the last time we saw it. Unchanged files
+        # -- which held no plugins do not need to be loaded at all.
+        if cached_names == []:
+            self._log('Unchanged (No Plugins) : {}', filepath)
+            return
+
+        module_to_inspect = self._load_module(
+            filepath,
+            mechanism,
+            code=code,
+            reload=reload,
+        )
+
+        import_time = time.perf_counter()
+
+        # -- If the module is invalid for any reason we do not
+        # -- go further
+        if not module_to_inspect:
+            if self._instrumentation is not None:
+                self._instrumentation.record_file(
+                    filepath,
+                    import_time - start_time,
+                    0.0,
+                    0,
+                    0,
+                    failed=True,
+                )
+            return
+
+        # -- We have no control over what we load, so we wrap
+        # -- this is a try/except
+        try:
+            found, inspected = self._find_plugins(
+                module_to_inspect,
+                cached_names,
+            )
+
+            for _, item in found:
+                self._add_plugin(
+                    item,
+                    path=path,
+                    filepath=filepath,
+                    mechanism=mechanism,
+                )
+                self._log('Loaded Plugin : {}', item)
+
+            # -- Only files the cache did not already know about need to
+            # -- be stored, as storing means hashing the file again
+            if self._cache and cached_names is None:
+                self._cache.store(
+                    filepath,
+                    [item_name for item_name, _ in found],
+                )
+
+            if self._instrumentation is not None:
+                self._instrumentation.record_file(
+                    filepath,
+                    import_time - start_time,
+                    time.perf_counter() - import_time,
+                    inspected,
+                    len(found),
+                )
+
+            # -- Output the time it took to load this module
+            self._log(
+                '{} took {:.4f} to load',
+                module_to_inspect,
+                time.perf_counter() - start_time,
+            )
+
+        # -- We keep the exception type explitely broad as it
+        # -- is completely out of our control what might be being
+        # -- imported
+        except BaseException:
+            self._log('{}', sys.exc_info(), is_warning=True)
+
+            if self._instrumentation is not None:
+                self._instrumentation.record_file(
+                    filepath,
+                    import_time - start_time,
+                    time.perf_counter() - import_time,
+                    0,
+                    0,
+                    failed=True,
+                )
+
+    # --------------------------------------------------------------------------
+    def _load_module(self, filepath, mechanism, code=None, reload=False):
+        """
+        Imports or loads the given file based on the given mechanism,
+        returning the resulting module. If the file could not be imported
+        or loaded then None is returned.
+
+        :param filepath: Absolute filepath to the file to load
+        :type filepath: str
+
+        :param mechanism: The loading mechanism to utilise (see add_path)
+        :type mechanism: int
+
+        :param code: The compiled source of the file, if it has already
+            been compiled
+        :type code: code
+
+        :param reload: If True, and the file has already been imported,
+            the module is reloaded rather than taken from sys.modules
+        :type reload: bool
+
+        :return: module or None
+        """
+        module = None
+
+        # -- If we need to import - or guess, then we attempt to
+        # -- get the package name
+        if mechanism == self.IMPORTABLE or mechanism == self.GUESS:
+            module = self._mechanism_import(filepath, reload=reload)
+
+            # -- The plugin name may clash with a module name, so we
+            # -- need to protect against that and fall back to a direct
+            # -- load if that is the case
+            if module and module.__file__ != filepath:
+                module = None
+
+            if module:
+                self._log('Module Import : {}', filepath)
+
+        # -- If we do not have a module, and we're using the loading
+        # -- or guess Mechanisms
+        if not module:
+            if mechanism == self.LOAD_SOURCE or mechanism == self.GUESS:
+                module = self._mechanism_load(
+                    filepath,
+                    code=code,
+                    reload=reload,
+                )
+                if module:
+                    self._log('Direct Load : {}', filepath)
+
+        if not module:
+            self._log(
+                'Could not import or load : {}\n\t{}',
+                filepath,
+                sys.exc_info(),
+                is_warning=True,
+            )
+
+        return module
+
+    # --------------------------------------------------------------------------
+    def _load_lazy_module(self, filepath, mechanism):
+        """
+        Loads the module for a lazily discovered plugin, ensuring any given
+        file is only loaded once.
+
+        :param filepath: Absolute filepath to the file to load
+        :type filepath: str
+
+        :param mechanism: The loading mechanism to utilise (see add_path)
+        :type mechanism: int
+
+        :return: module or None
+        """
+        # -- This is called by readers, so we hold the lazy lock (rather
+        # -- than the factory lock) to ensure the module is not loaded twice
+        # -- without waiting on any change being made
+        with self._lazy_lock:
+            if filepath not in self._lazy_modules:
+                self._lazy_modules[filepath] = self._load_module(
+                    filepath,
+                    mechanism,
+                )
+
+            return self._lazy_modules[filepath]
+
+    # --------------------------------------------------------------------------
+    def _load_manifest_module(self, filepath, module_name, mechanism, sha1):
+        """
+        Loads the module for a plugin registered from a manifest, ensuring
+        any given file is only loaded once. Where the manifest tells us the
+        name the module can be imported as we import it by that name
+        directly rather than working the name out again.
+
+        :param filepath: Absolute filepath to the file to load
+        :type filepath: str
+
+        :param module_name: The name the file can be imported as, if any
+        :type module_name: str
+
+        :param mechanism: The loading mechanism to utilise (see add_path)
+        :type mechanism: int
+
+        :param sha1: If given, the file is only loaded if its contents
+            still match this hash
+        :type sha1: str
+
+        :return: module or None
+        """
+        with self._lazy_lock:
+            if filepath in self._lazy_modules:
+                return self._lazy_modules[filepath]
+
+            module = None
+
+            try:
+                changed = sha1 and plugin_manifest.file_hash(filepath) != sha1
+
+            except OSError:
+                changed = True
+
+            if changed:
+                self._log(
+                    'Refusing to load {} as it has changed since the '
+                    'manifest was built',
+                    filepath,
+                    is_warning=True,
+                )
+
+            else:
+                if module_name and mechanism != self.LOAD_SOURCE:
+                    # noinspection PyBroadException
+                    try:
+                        module = importlib.import_module(module_name)
+
+                    except BaseException:
+                        self._log(
+                            'Failed trying to import : {} ({})',
+                            module_name,
+                            sys.exc_info(),
+                        )
+
+                    if getattr(module, '__file__', None) != filepath:
+                        module = None
+
+                if not module:
+                    module = self._load_module(filepath, mechanism)
+
+            self._lazy_modules[filepath] = module
+            return module
+
+    # --------------------------------------------------------------------------
+    def _find_plugins(self, module, item_names=None):
+        """
+        Looks for implementations of the abstract within the given module.
+
+        :param module: The module to inspect
+        :type module: module
+
+        :param item_names: If given, only these attributes of the module
+            will be inspected. Otherwise all attributes are inspected.
+        :type item_names: list(str, str, ...)
+
+        :return: (list((item_name, class), ...), number of classes inspected)
+        """
+        found = list()
+        inspected = 0
+
+        if item_names is None:
+            item_names = dir(module)
+
+        for item_name in item_names:
+
+            item = getattr(
+                module,
+                item_name,
+                None,
+            )
+
+            # -- If this bases off the abstract, we should store it
+            if not inspect.isclass(item):
+                continue
+
+            inspected += 1
+
+            # -- We do not want to pick up the abstract
+            # -- itself, so ignore that
+            if item == self._abstract:
+                continue
+
+            if issubclass(item, self._abstract):
+                found.append((item_name, item))
+
+        return found, inspected
+
+    # --------------------------------------------------------------------------
+    @_changes
+    def clear(self):
+        """
+        Clears the entire factory of plugins, add_pathed paths and entry
+        point groups.
+
+        :return: None
 
         ..code-block:: python
 
@@ -473,13 +1818,14 @@ class Factory(object):
         0
         """
         # -- Start clearing out the factory variables
-        self._plugins = list()
+        self._clear_plugins()
         self._add_pathed_paths = dict()
+        self._entry_point_groups = list()
 
         # -- Emit our change signals
-        self.paths_changed.emit()
-        self.plugins_changed.emit()
-        self.changed.emit()
+        self._emit(self.paths_changed)
+        self._emit(self.plugins_changed)
+        self._emit(self.changed)
 
     # --------------------------------------------------------------------------
     def identifiers(self, include_disabled=False):
@@ -505,17 +1851,10 @@ class Factory(object):
             >>> print(reader.factory.identifiers())
             set(['JSONReader', 'INIReader'])
         """
-        results = []
-
-        for plugin in self._plugins:
-            identifier = self._get_identifier(plugin)
-
-            if not include_disabled and self.is_disabled(identifier):
-                continue
+        if include_disabled:
+            return set(self._snapshot.index)
 
-            results.append(identifier)
-
-        return set(results)
+        return set(self._snapshot.enabled)
 
     # --------------------------------------------------------------------------
     def paths(self):
@@ -535,15 +1874,17 @@ class Factory(object):
             >>> print(reader.factory.paths())
             {...factories/examples/reader/readers}
         """
-        # -- Cast the keys to a list to ensure compatibility
-        # -- between python 2.x and 3.x
-        return list(self._add_pathed_paths.keys())
+        return list(self._snapshot.paths)
 
     # --------------------------------------------------------------------------
     def plugins(self, include_disabled=False):
         """
         Returns a unique list of plugins. Where multiple versions are available
-        the highest version will be given.
+        the highest version will be given. Plugins are given in the order
+        their identifiers were first registered.
+
+        The resolved list is cached until the plugins (or their disabled
+        states) change.
 
         :return: list(class, class, ...)
 
@@ -560,26 +1901,309 @@ class Factory(object):
             JSONReader
             INIReader
         """
-        return [
-            self.request(identifier)
-            for identifier in self.identifiers(include_disabled)
-        ]
+        # -- Return a copy so the cache cannot be altered by the caller
+        return list(self._resolve_plugins(self._snapshot, include_disabled))
+
+    # --------------------------------------------------------------------------
+    def _resolve_plugins(self, snapshot, include_disabled=False):
+        """
+        Returns the plugins given by plugins() for the given snapshot. They
+        are only resolved the first time they are asked for, after which
+        the same list is returned.
+
+        :param snapshot: The snapshot to resolve the plugins from
+        :type snapshot: Snapshot
+
+        :param include_disabled: Include disabled plugins
+        :type include_disabled: bool
+
+        :return: list(class, class, ...)
+        """
+        plugins = snapshot.resolved.get(include_disabled)
 
+        if plugins is None:
+            plugins = [
+                self._request(identifier, snapshot=snapshot)
+                for identifier in (
+                    snapshot.index if include_disabled else snapshot.enabled
+                )
+            ]
+
+            # -- Lazy plugins which could not be loaded are left out
+            plugins = [plugin for plugin in plugins if plugin is not None]
+            snapshot.resolved[include_disabled] = plugins
+
+        return plugins
+
+    # --------------------------------------------------------------------------
+    def _require(self, identifier, version=None):
+        """
+        Returns the record of the plugin with the given identifier and
+        version along with the (loaded) plugin itself, raising a KeyError
+        if it cannot be found or loaded.
+
+        :return: (PluginRecord, Plugin Class)
+        """
+        record, plugin = self._request_loaded(identifier, version)
+
+        if plugin is None:
+            raise KeyError(
+                'Could not find plugin : {} (version {})'.format(
+                    identifier,
+                    version,
+                ),
+            )
+
+        return record, plugin
+
+    # --------------------------------------------------------------------------
     def instance(self, identifier, version=None, *args, **kwargs):
         """
-        This will return an instanced version of the plugin
+        This will return an instanced version of the plugin. If the plugin
+        cannot be found (or could not be loaded) a KeyError is raised.
         """
-        return self.request(identifier, version)(*args, **kwargs)
+        if self._instrumentation is None:
+            return self._require(identifier, version)[1](*args, **kwargs)
+
+        start_time = time.perf_counter()
+        result = self._require(identifier, version)[1](*args, **kwargs)
+
+        self._instrumentation.record_instance(
+            identifier,
+            time.perf_counter() - start_time,
+        )
+
+        return result
+
+    # --------------------------------------------------------------------------
+    def constructor(self, identifier, version=None):
+        """
+        Returns a callable which creates instances of the plugin, for use
+        where many instances are created in a loop. The plugin is resolved
+        once rather than on every call, and is only resolved again once the
+        plugins of the factory change. Unlike instance, the calls are not
+        recorded by any instrumentation.
+
+        :param identifier: The identifier of the plugin to instance
+        :param version: The version of the plugin, or None for the highest
+
+        :return: Constructor
+
+        ..code-block:: python
+
+            >>> from factories.examples.zoo import Zoo
+            >>>
+            >>> zoo = Zoo()
+            >>> create_tiger = zoo.factory.constructor('tiger')
+            >>>
+            >>> tigers = [create_tiger() for _ in range(1000)]
+        """
+        return Constructor(self, identifier, version)
+
+    # --------------------------------------------------------------------------
+    def acquire(self, identifier, version=None, *args, **kwargs):
+        """
+        Returns an instance of the plugin, as per instance. If the factory
+        was given a pool_size then an instance previously given back through
+        release is reused where there is one, in which case the given
+        arguments are not used. Otherwise a new instance is constructed
+        with them.
+
+        Plugins which hold state between uses can implement a reset method,
+        which is called as they are released. Instances which are never
+        released are not kept alive by the pool.
+
+        :param identifier: The identifier of the plugin to instance
+        :param version: The version of the plugin, or None for the highest
+
+        :return: Instance of the plugin
+
+        ..code-block:: python
+
+            >>> from factories.examples.zoo import Zoo
+            >>>
+            >>> zoo = Zoo(pool_size=4)
+            >>>
+            >>> tiger = zoo.factory.acquire('tiger')
+            >>> zoo.factory.release(tiger)
+            >>>
+            >>> # -- Or, releasing automatically
+            >>> with zoo.factory.pooled('tiger') as tiger:
+            ...     tiger.increment_age()
+        """
+        record, plugin = self._require(identifier, version)
+
+        if self._pool is None:
+            return plugin(*args, **kwargs)
+
+        return self._pool.acquire(
+            record,
+            functools.partial(plugin, *args, **kwargs),
+        )
+
+    # --------------------------------------------------------------------------
+    def release(self, instance):
+        """
+        Gives back an instance given by acquire, so that it can be reused.
+        The instance should not be used again by the caller.
+
+        :param instance: The instance given by acquire
+
+        :raises ValueError: If the factory has a pool and the instance was
+            not given by acquire, or has already been released.
+
+        :return: True if the instance was pooled. If the factory has no
+            pool, the pool is full, the instance could not be reset, or the
+            plugin has been reloaded, replaced or removed since the
+            instance was acquired then it is dropped and False is returned.
+        """
+        if self._pool is None:
+            return False
+
+        return self._pool.release(instance)
+
+    # --------------------------------------------------------------------------
+    @contextlib.contextmanager
+    def pooled(self, identifier, version=None, *args, **kwargs):
+        """
+        Context manager which acquires an instance of the plugin (see
+        acquire) and releases it again on exit, unless it has already been
+        released within the block.
+
+        :param identifier: The identifier of the plugin to instance
+        :param version: The version of the plugin, or None for the highest
+
+        :return: Instance of the plugin
+        """
+        instance = self.acquire(identifier, version, *args, **kwargs)
+
+        try:
+            yield instance
+
+        finally:
+            # -- The instance may have been released within the block
+            try:
+                self.release(instance)
+
+            except ValueError:
+                pass
+
+    # --------------------------------------------------------------------------
+    def pool_stats(self):
+        """
+        Returns the statistics of the instance pool used by acquire (see
+        InstancePool.as_dict). If the factory has no pool None is returned.
+
+        :return: dict or None
+        """
+        if self._pool is None:
+            return None
+
+        return self._pool.as_dict()
+
+    # --------------------------------------------------------------------------
+    def dispatch(self, predicate_name, *args):
+        """
+        Returns the first plugin (in the order given by plugins) whose
+        predicate method returns True for the given arguments, such as
+        the first plugin whose can_read method accepts a filepath. If no
+        plugin accepts the arguments None is returned.
+
+        Plugins can declare static selectors for a predicate, allowing them
+        to be chosen without the predicate being called at all (see
+        DispatchTable). The selectors are compiled once for the current
+        plugins, and if the factory has a selection cache the result for
+        each set of arguments is remembered until the plugins (or their
+        disabled states) change.
+
+        :param predicate_name: Name of the predicate method to dispatch on
+        :type predicate_name: str
+
+        :param args: Arguments to give to the predicate
+
+        :return: Plugin Class (or None)
+
+        ..code-block:: python
+
+            >>> from factories.examples.reader import DataReader
+            >>>
+            >>> # -- Instance a reader
+            >>> reader = DataReader()
+            >>>
+            >>> # -- Get the plugin which can read a file
+            >>> plugin = reader.factory.dispatch('can_read', 'data.json')
+            >>>
+            >>> print(plugin.__name__)
+            JSONReader
+        """
+        snapshot = self._snapshot
+        key = ('dispatch', predicate_name)
+
+        table = snapshot.resolved.get(key)
+
+        if table is None:
+            table = snapshot.resolved[key] = DispatchTable(
+                [
+                    plugin
+                    for plugin in self._resolve_plugins(snapshot)
+                    if plugin
+                ],
+                predicate_name,
+            )
+
+        if self._selection_cache is None:
+            return table.select(*args)
+
+        return self._selection_cache.fetch(
+            snapshot,
+            (predicate_name, args),
+            functools.partial(table.select, *args),
+        )
+
+    # --------------------------------------------------------------------------
+    def selection_cache_stats(self):
+        """
+        Returns the hit and miss counts of the selection cache used by
+        dispatch, along with how many results it holds and the most it
+        can hold. If the factory has no selection cache None is returned.
+
+        :return: dict or None
+        """
+        if self._selection_cache is None:
+            return None
+
+        return self._selection_cache.as_dict()
+
+    # --------------------------------------------------------------------------
+    def stats(self):
+        """
+        Returns the metrics collected by the factories instrumentation as
+        a dictionary (see FactoryStats.as_dict). If the factory has no
+        instrumentation then None is returned.
+
+        :return: dict or None
+        """
+        if self._instrumentation is None:
+            return None
+
+        return self._instrumentation.as_dict()
 
     # --------------------------------------------------------------------------
     # noinspection PyBroadException
-    def add_path(self, path, mechanism=0):
+    @_changes
+    def add_path(self, path, mechanism=0, workers=None):
         """
         Registers a search address with the factory. The factory will
         immediately being searching recursively within this location for
         any plugins.
 
-        :param path: Absolute folder location
+        The path may also be a .zip, .whl or .pyz archive, in which case
+        the archive's directory is read once and its files are loaded
+        through zipimport rather than from disk. To use the IMPORTABLE
+        mechanism (and relative imports) the archive must be on the
+        sys.path, just as a folder would be.
+
+        :param path: Absolute folder location, or archive file
         :type path: str
 
         :param mechanism: This allows you to specify the behaviour for
@@ -598,8 +2222,9 @@ class Factory(object):
                     directly rather than import it from sys.modules.
                     This method has flexibility in terms of structure but
                     means you cannot utilise relative import paths within
-                    your plugin. All loaded plugins using this module are
-                    imported into a namespace defined through a uuid.
+                    your plugin. Each file is loaded into a module whose name
+                    is derived from its path, and is only loaded again
+                    once the file changes.
 
                 * GUESS
                     This is the default mechanism. When guessing the factory
@@ -610,6 +2235,22 @@ class Factory(object):
                     behaviour.
         :type mechanism: int
 
+        :param workers: If given, this many threads are used to walk the
+            path and to read (and where files will be loaded directly,
+            compile) the plugin files ahead of them being loaded. The files
+            are still loaded and inspected in order, so the resulting
+            plugins are identical to a search without workers. If not given
+            the value given to the factory is used.
+
+            Compiling and loading hold the interpreter lock, so workers
+            only help where walking and reading the files is slow, such as
+            on a network share. On a local disk they make little difference
+            (see benchmarks/bench_parallel_loading.py), and a search of
+            unchanged files reads next to nothing for them to overlap.
+            Threads rather than processes are used as the loaded modules
+            and classes cannot be passed between processes.
+        :type workers: int
+
         :return: Count of plugins add_pathed
 
         ..code-block:: python
@@ -640,140 +2281,296 @@ class Factory(object):
         if not path:
             return 0
 
+        if workers is None:
+            workers = self._workers
+
+        # -- Ensure we look at the file system afresh for this path
+        self._resolver.refresh()
+
         # -- Regardless of what is found along the path we store the
         # -- fact that this path has been given to us
         self._add_pathed_paths[path] = mechanism
 
         # -- Emit the fact that our paths have changed
-        self.paths_changed.emit()
+        self._emit(self.paths_changed)
 
         # -- We return how many plugins have been add_pathed
         # -- by this path, so we get the plugin count prior
         # -- to doing anything
-        current_plugin_count = len(self._plugins)
-
-        filepaths = list()
+        current_plugin_count = len(self._records)
 
         # -- Collate all our valid files in an initial pass. This could
         # -- be done in situ, but for the sake of clarity its done up-front
-        for root, _, files in os.walk(path):
-            for filename in files:
+        filepaths = self._collect_files(path, workers)
 
-                # -- skip any private or structural files, along with
-                # -- any files which are not py files
-                if not self._PY_CHECK.match(filename):
-                    continue
+        # -- Start cycling over the files we have found and look inside
+        # -- for plugins. Any preparation of the files happens in the
+        # -- background when using workers, but the files are always loaded
+        # -- and inspected in order.
+        for filepath, cached_names, source, code in self._prepare_files(
+                filepaths,
+                mechanism,
+                workers,
+        ):
+            # -- Asynchronous searches may be cancelled between files
+            self._check_cancelled()
+
+            self._add_file(
+                filepath,
+                mechanism,
+                path=path,
+                cached_names=cached_names,
+                source=source,
+                code=code,
+            )
 
-                # -- If we're given a regex filter and this does not
-                # -- match then we skip it
-                if self._regex_filter and not self._regex_filter.match(filename):
-                    continue
+        if self._cache:
+            self._cache.save()
 
-                filepaths.append(
-                    os.path.join(
-                        root,
-                        filename
-                    ),
+        plugin_change = len(self._records) - current_plugin_count
+
+        # -- Emit the fact that our plugins have changed if they
+        # -- ahve done sone
+        if plugin_change:
+            self._emit(self.plugins_changed)
+
+        # -- Return the amount of plugins which have
+        # -- been loaded during this registration pass
+        return
+
+    # --------------------------------------------------------------------------
+    async def add_path_async(self,
+                             path,
+                             mechanism=0,
+                             workers=None,
+                             executor=None):
+        """
+        Asynchronous version of add_path for use within an asyncio event
+        loop. The path is searched (and its files loaded) within an executor
+        so the loop is not blocked, and the found plugins only become
+        visible once the whole path has been searched. The paths_changed
+        and plugins_changed signals are then emitted on the loop thread.
+
+        If the awaiting task is cancelled the search stops at the next file
+        and the factory is left as it was before the call.
+
+        :param path: Absolute folder location
+        :type path: str
+
+        :param mechanism: The loading mechanism to utilise (see add_path)
+        :type mechanism: int
+
+        :param workers: Number of threads to use when searching the path
+            (see add_path)
+        :type workers: int
+
+        :param executor: The executor to search within. If not given the
+            loops default executor is used.
+        :type executor: concurrent.futures.Executor
+
+        :return: None
+
+        ..code-block:: python
+
+            >>> import asyncio
+            >>> from factories.examples.reader import DataReader
+            >>>
+            >>> reader = DataReader()
+            >>>
+            >>> async def main():
+            ...     await reader.factory.add_path_async('/my/plugins')
+            >>>
+            >>> asyncio.run(main())
+        """
+        return await self._run_async(
+            self.add_path,
+            executor,
+            path,
+            mechanism=mechanism,
+            workers=workers,
+        )
+
+    # --------------------------------------------------------------------------
+    @_changes
+    def add_entry_points(self, group):
+        """
+        Registers the plugins advertised by installed distributions through
+        the given entry point group. Only the targets of those entry points
+        are imported, and each may either be a plugin class or a module -
+        in which case the module is searched for plugins just as a file
+        within a path would be.
+
+        The entry points of the installed distributions are only read once
+        per environment, so any number of factories may use the same group
+        without reading them again. If distributions are installed whilst
+        running, factories.entry_points.clear_cache() will find them.
+
+        :param group: The name of the entry point group
+        :type group: str
+
+        :return: Count of plugins registered
+
+        ..code-block:: python
+
+            >>> # -- Within the setup.cfg of a distribution holding readers
+            >>> # -- [options.entry_points]
+            >>> # -- my_app.readers =
+            >>> # --     yaml = my_readers.yaml_reader:YAMLReader
+            >>>
+            >>> from factories.examples.reader import DataReader
+            >>>
+            >>> reader = DataReader()
+            >>> reader.factory.add_entry_points('my_app.readers')
+        """
+        if not group:
+            return 0
+
+        if group not in self._entry_point_groups:
+            self._entry_point_groups.append(group)
+
+        current_plugin_count = len(self._records)
+
+        for name, value in plugin_entry_points.find(group):
+
+            # -- We have no control over what we load, so we wrap
+            # -- this is a try/except
+            # noinspection PyBroadException
+            try:
+                target = plugin_entry_points.load(group, name, value)
+
+            except BaseException:
+                self._log(
+                    'Could not load entry point : {} ({})\n\t{}',
+                    name,
+                    value,
+                    sys.exc_info(),
+                    is_warning=True,
                 )
+                continue
 
-        # -- Start cycling over the files we have found and look inside
-        # -- for plugins
-        for filepath in filepaths:
+            if inspect.ismodule(target):
+                module = target
+                found = [item for _, item in self._find_plugins(module)[0]]
+
+            elif (inspect.isclass(target) and
+                  target != self._abstract and
+                  issubclass(target, self._abstract)):
+                module = sys.modules.get(target.__module__)
+                found = [target]
 
-            # -- Track the time we started the load
-            start_time = time.time()
-
-            # -- Declare the variable we will ultimately inspect
-            # -- for plugins
-            module_to_inspect = None
-
-            # -- If we need to import - or guess, then we attempt to
-            # -- get the package name
-            if mechanism == self.IMPORTABLE or mechanism == self.GUESS:
-                module_to_inspect = self._mechanism_import(filepath)
-
-                # -- The plugin name may clash with a module name, so we
-                # -- need to protect against that and fall back to a direct
-                # -- load if that is the case
-                if module_to_inspect and module_to_inspect.__file__ != filepath:
-                    module_to_inspect = None
-
-                if module_to_inspect:
-                    self._log('Module Import : {}'.format(filepath))
-
-            # -- If we do not have a module, and we're using the loading
-            # -- or guess Mechanisms
-            if not module_to_inspect:
-                if mechanism == self.LOAD_SOURCE or mechanism == self.GUESS:
-                    module_to_inspect = self._mechanism_load(filepath)
-                    if module_to_inspect:
-                        self._log('Direct Load : {}'.format(filepath))
-
-            # -- If the module is invalid for any reason we do not
-            # -- go further
-            if not module_to_inspect:
+            else:
                 self._log(
-                    'Could not import or load : {}\n\t{}'.format(
-                        filepath,
-                        str(sys.exc_info()),
-                    ),
+                    'Entry point is not a plugin : {} ({})',
+                    name,
+                    value,
                     is_warning=True,
                 )
                 continue
 
-            # -- We have no control over what we load, so we wrap
-            # -- this is a try/except
-            try:
+            for item in found:
+                self._add_plugin(
+                    item,
+                    filepath=getattr(module, '__file__', None),
+                    mechanism=self.IMPORTABLE,
+                )
+                self._log('Loaded Plugin : {}', item)
+
+        plugin_change = len(self._records) - current_plugin_count
+
+        if plugin_change:
+            self._emit(self.plugins_changed)
 
-                # -- Look for implementations of the abstract
-                for item_name in dir(module_to_inspect):
+        return plugin_change
 
-                    item = getattr(
-                        module_to_inspect,
-                        item_name,
-                    )
+    # --------------------------------------------------------------------------
+    @_changes
+    def add_manifest(self, manifest, verify=False):
+        """
+        Registers the plugins described by a manifest (see
+        "python -m factories build-manifest"), without searching any paths
+        or importing any modules. Each plugin is registered as a stand-in
+        holding its identifier and version, and its module is only imported
+        when the plugin is first requested.
+
+        The paths the manifest was built from are stored as though they had
+        been added, so they are watched and are searched afresh by reload.
+        If the manifest was built for a different abstract, identifier or
+        versioning identifier then its paths are searched instead.
+
+        :param manifest: The manifest, or the path to a manifest file
+        :type manifest: str or dict
+
+        :param verify: If True, each file is checked against the hash the
+            manifest recorded for it before it is imported, and its plugins
+            are not loaded if the file has changed.
+        :type verify: bool
+
+        :return: Count of plugins registered
+        """
+        if isinstance(manifest, str):
+            manifest = plugin_manifest.read(manifest)
 
-                    # -- If this bases off the abstract, we should store it
-                    if inspect.isclass(item):
+        if not manifest:
+            return 0
 
-                        # -- We do not want to pick up the abstract
-                        # -- itself, so ignore that
-                        if item == self._abstract:
-                            continue
+        paths = manifest.get('paths', list())
 
-                        if issubclass(item, self._abstract):
-                            self._plugins.append(item)
-                            self._log('Loaded Plugin : {}'.format(item))
+        # -- A manifest built for another factory configuration would give
+        # -- us the wrong identifiers, so we fall back to searching
+        configuration = (
+            plugin_manifest.abstract_name(self._abstract),
+            self._identifier,
+            self._version,
+        )
 
+        if configuration != (
+            manifest.get('abstract'),
+            manifest.get('identifier'),
+            manifest.get('versioning_identifier'),
+        ):
+            self._log(
+                'Plugin manifest does not match this factory, searching '
+                'its paths instead',
+                is_warning=True,
+            )
 
-                # -- Output the time it took to load this module
-                delta_time = time.time() - start_time
-                self._log(
-                    '{} took {} to load'.format(
-                        module_to_inspect,
-                        round(delta_time, 4),
-                    ),
-                    is_warning=False,
-                )
+            for entry in paths:
+                self.add_path(entry['path'], mechanism=entry['mechanism'])
 
-            # -- We keep the exception type explitely broad as it
-            # -- is completely out of our control what might be being
-            # -- imported
-            except BaseException:
-                self._log(str(sys.exc_info()), is_warning=True)
+            return 0
 
-        plugin_change = len(self._plugins) - current_plugin_count
+        for entry in paths:
+            self._add_pathed_paths[entry['path']] = entry['mechanism']
 
-        # -- Emit the fact that our plugins have changed if they
-        # -- ahve done sone
-        if plugin_change:
-            self.plugins_changed.emit()
+        if paths:
+            self._emit(self.paths_changed)
 
-        # -- Return the amount of plugins which have
-        # -- been loaded during this registration pass
-        return
+        for entry in manifest.get('plugins', list()):
+            self._add_plugin(
+                LazyPlugin(
+                    functools.partial(
+                        self._load_manifest_module,
+                        module_name=entry['module'],
+                        mechanism=entry['mechanism'],
+                        sha1=entry['sha1'] if verify else None,
+                    ),
+                    entry['filepath'],
+                    entry['class_name'],
+                    entry['identifier'],
+                    entry['version'],
+                ),
+                path=entry['path'],
+                filepath=entry['filepath'],
+                mechanism=entry['mechanism'],
+            )
+
+        if manifest.get('plugins'):
+            self._emit(self.plugins_changed)
+
+        return len(manifest.get('plugins', list()))
 
     # --------------------------------------------------------------------------
+    @_changes
     def register(self, class_type):
         """
         Registers the given class type as a plugin for this factory. Note,
@@ -794,18 +2591,31 @@ class Factory(object):
         if not issubclass(class_type, self._abstract):
             return False
 
-        self._plugins.append(class_type)
+        self._add_plugin(class_type)
+        self._emit(self.plugins_changed)
+
+        return True
 
     # --------------------------------------------------------------------------
+    @_changes
     def reload(self):
         """
         This will forget any add_pathed plugins or information about plugins
-        and perform a search over all the stored paths.
+        and perform a search over all the stored paths and entry point
+        groups.
 
         :return:
         """
         # -- Take a snapshot of the path data
         path_data = self._add_pathed_paths.copy()
+        groups = list(self._entry_point_groups)
+
+        # -- Any directly loaded modules whose files have changed or
+        # -- been removed are evicted. Unchanged files keep their modules
+        # -- and are not loaded again.
+        for filepath in set(record.filepath for record in self._records):
+            if filepath:
+                self._evict_module(filepath, stale_only=True)
 
         # -- Start clearing out the factory variables
         self.clear()
@@ -817,6 +2627,162 @@ class Factory(object):
                 mechanism=mechanism,
             )
 
+        for group in groups:
+            self.add_entry_points(group)
+
+    # --------------------------------------------------------------------------
+    async def reload_async(self, executor=None):
+        """
+        Asynchronous version of reload for use within an asyncio event loop.
+        See add_path_async for how the reload is carried out, and what
+        happens if it is cancelled. Until the reload is complete requests
+        continue to be served from the plugins as they were before it.
+
+        :param executor: The executor to reload within. If not given the
+            loops default executor is used.
+        :type executor: concurrent.futures.Executor
+
+        :return: None
+        """
+        return await self._run_async(self.reload, executor)
+
+    # --------------------------------------------------------------------------
+    @_changes
+    def reload_files(self, filepaths):
+        """
+        Reloads only the given files, replacing any plugins they previously
+        held with the plugins they now hold. Files which no longer exist
+        have their plugins removed, and files which are new to the factory
+        are added. Files which do not sit within any of the factories paths
+        are ignored.
+
+        If anything has changed the plugins_changed signal is emitted, along
+        with the plugins_reloaded signal which is given the same dictionary
+        as is returned.
+
+        :param filepaths: Absolute paths to the files to reload
+        :type filepaths: list(str, str, ...)
+
+        :return: dict(added=set, removed=set, updated=set) of identifiers
+        """
+        previous_identifiers = set()
+        current_identifiers = set()
+
+        for filepath in filepaths:
+            path = self._path_for(filepath)
+
+            if path is None:
+                continue
+
+            mechanism = self._add_pathed_paths[path]
+
+            # -- Remove whatever this file gave us last time
+            removed = self._remove_plugins(
+                lambda record: record.filepath == filepath,
+            )
+
+            with self._lazy_lock:
+                self._lazy_modules.pop(filepath, None)
+
+            previous_identifiers.update(
+                record.identifier
+                for record in removed
+            )
+
+            if not (os.path.exists(filepath) or
+                    plugin_archive.contains(filepath)):
+                self._evict_module(filepath)
+                continue
+
+            # -- Load the file again, tracking what it gives us
+            plugin_count = len(self._records)
+
+            _, cached_names, _, _ = self._prepare_file(filepath, mechanism)
+
+            self._add_file(
+                filepath,
+                mechanism,
+                path=path,
+                cached_names=cached_names,
+                reload=True,
+            )
+
+            current_identifiers.update(
+                record.identifier
+                for record in self._records[plugin_count:]
+            )
+
+        if self._cache:
+            self._cache.save()
+
+        changes = dict(
+            added=current_identifiers - previous_identifiers,
+            removed=previous_identifiers - current_identifiers,
+            updated=previous_identifiers & current_identifiers,
+        )
+
+        if previous_identifiers or current_identifiers:
+            self._emit(self.plugins_changed)
+            self._emit(self.plugins_reloaded, changes)
+
+        return changes
+
+    # --------------------------------------------------------------------------
+    def _path_for(self, filepath):
+        """
+        Returns the registered path which the given file sits within. Where
+        paths are nested the deepest is returned.
+
+        :param filepath: Absolute path to the file
+        :type filepath: str
+
+        :return: str or None
+        """
+        filepath = os.path.abspath(filepath)
+        result = None
+
+        for path in self._add_pathed_paths:
+            folder = os.path.join(os.path.abspath(path), '')
+
+            if not filepath.startswith(folder):
+                continue
+
+            if result is None or len(path) > len(result):
+                result = path
+
+        return result
+
+    # --------------------------------------------------------------------------
+    def watch(self, interval=1.0):
+        """
+        Starts watching the factories paths on a background thread. Whenever
+        a plugin file is added, changed or deleted only that file is
+        reloaded (see reload_files).
+
+        :param interval: Number of seconds between each check for changes
+        :type interval: float
+
+        :return: PathWatcher
+        """
+        if not self._watcher:
+            self._watcher = PathWatcher(self, interval=interval)
+
+        self._watcher.interval = interval
+        self._watcher.start()
+
+        return self._watcher
+
+    # --------------------------------------------------------------------------
+    def unwatch(self):
+        """
+        Stops watching the factories paths for changes.
+
+        :return: None
+        """
+        if self._watcher:
+            self._watcher.stop()
+            self._watcher = None
+
     # --------------------------------------------------------------------------
     def request(self, plugin_identifier, version=None):
         """
@@ -868,54 +2834,355 @@ class Factory(object):
             >>> print(plugin.version)
             1
         """
+        if self._instrumentation is None:
+            return self._request(plugin_identifier, version)
+
+        start_time = time.perf_counter()
+        plugin = self._request(plugin_identifier, version)
+
+        self._instrumentation.record_request(
+            plugin_identifier,
+            time.perf_counter() - start_time,
+            plugin is not None,
+        )
+
+        return plugin
+
+    # --------------------------------------------------------------------------
+    def request_many(self, pairs):
+        """
+        Retrieves the plugins for a whole batch of identifiers and versions
+        in one call. This is considerably cheaper than calling request in a
+        loop when the batch is large, as each distinct pair is only resolved
+        once and any misses are reported in a single warning rather than
+        one warning per miss.
+
+        :param pairs: Iterable of (identifier, version) tuples. The version
+            may be None to request the highest available version.
+        :type pairs: iterable
+
+        :return: list(Plugin Class or None, ...) in the same order as the
+            given pairs
+
+        ..code-block:: python
+
+            >>> from factories.examples.reader import DataReader
+            >>>
+            >>> # -- Instance a reader
+            >>> reader = DataReader()
+            >>>
+            >>> # -- Get a batch of plugins
+            >>> plugins = reader.factory.request_many(
+            ...     [
+            ...         ('JSONReader', 1),
+            ...         ('JSONReader', None),
+            ...         ('INIReader', None),
+            ...     ],
+            ... )
+        """
+        # -- The whole batch is resolved against the same snapshot, even
+        # -- if the plugins are changed part way through
+        snapshot = self._snapshot
+
+        # -- Pairs already resolved within this batch
+        resolved = dict()
+        results = list()
+        missing = list()
+        misses = 0
+
+        for identifier, version in pairs:
+            key = (identifier, version)
+
+            if self._instrumentation is not None:
+                start_time = time.perf_counter()
+
+            if key in resolved:
+                plugin = resolved[key]
+
+            else:
+                plugin = resolved[key] = self._request(
+                    identifier,
+                    version,
+                    warn=False,
+                    snapshot=snapshot,
+                )
+
+                if plugin is None:
+                    missing.append(key)
+
+            if plugin is None:
+                misses += 1
+
+            if self._instrumentation is not None:
+                self._instrumentation.record_request(
+                    identifier,
+                    time.perf_counter() - start_time,
+                    plugin is not None,
+                )
+
+            results.append(plugin)
+
+        # -- The counts cover every pair requested, whilst each missing
+        # -- pair is only named once
+        if missing:
+            self._log(
+                'Could not find {} of the {} requested plugins : {}',
+                misses,
+                len(results),
+                ', '.join(
+                    str(identifier) if version is None
+                    else '{} (version {})'.format(identifier, version)
+                    for identifier, version in missing
+                ),
+                is_warning=True,
+            )
+
+        return results
+
+    # --------------------------------------------------------------------------
+    def instance_many(self, specs, *args, **kwargs):
+        """
+        Instances the plugins for a whole batch of identifiers and versions
+        in one call, resolving them as per request_many. Any arguments
+        given are passed to every instance.
+
+        Unlike instance, a plugin which cannot be found does not raise
+        an error - None is given in its place and the misses are reported
+        in a single warning.
+
+        :param specs: Iterable of (identifier, version) tuples. The version
+            may be None to request the highest available version.
+        :type specs: iterable
+
+        :return: list(instance or None, ...) in the same order as the
+            given specs
+        """
+        specs = list(specs)
+        instances = list()
+
+        for (identifier, _), plugin in zip(specs, self.request_many(specs)):
+            if plugin is None:
+                instances.append(None)
+                continue
+
+            if self._instrumentation is None:
+                instances.append(plugin(*args, **kwargs))
+                continue
+
+            start_time = time.perf_counter()
+            instances.append(plugin(*args, **kwargs))
+
+            self._instrumentation.record_instance(
+                identifier,
+                time.perf_counter() - start_time,
+            )
+
+        return instances
+
+    # --------------------------------------------------------------------------
+    def _request(self,
+                 plugin_identifier,
+                 version=None,
+                 warn=True,
+                 snapshot=None):
+        """
+        Retrieves the plugin with the specified plugin identifier and
+        version. See request for details.
+
+        :param warn: If False, no warning is logged when the plugin cannot
+            be found, allowing the caller to report it instead.
+        :type warn: bool
+
+        :param snapshot: The snapshot to look the plugin up within. If
+            not given the current snapshot is used.
+        :type snapshot: Snapshot
+
+        :return: Plugin Class (or None)
+        """
+        return self._request_loaded(
+            plugin_identifier,
+            version,
+            warn=warn,
+            snapshot=snapshot,
+        )[1]
+
+    # --------------------------------------------------------------------------
+    def _request_loaded(self,
+                        plugin_identifier,
+                        version=None,
+                        warn=True,
+                        snapshot=None):
+        """
+        Retrieves the record of the plugin with the specified plugin
+        identifier and version along with the (loaded) plugin itself. See
+        _request.
+
+        :return: (PluginRecord or None, Plugin Class or None)
+        """
+        record = self._request_record(
+            plugin_identifier,
+            version,
+            warn=warn,
+            snapshot=snapshot,
+        )
+
+        if record is None:
+            return None, None
+
+        plugin = self._load_record(record, warn=warn)
+
+        # -- Where a lazy plugin could not be loaded, another registered
+        # -- under the same identifier may stand in for it
+        if plugin is None:
+            fallback = self._request_record(
+                plugin_identifier,
+                version,
+                warn=False,
+                snapshot=snapshot,
+            )
+
+            if fallback is not None and fallback is not record:
+                return self._request_loaded(
+                    plugin_identifier,
+                    version,
+                    warn=warn,
+                    snapshot=snapshot,
+                )
+
+        return record, plugin
+
+    # --------------------------------------------------------------------------
+    def _request_record(self,
+                        plugin_identifier,
+                        version=None,
+                        warn=True,
+                        snapshot=None):
+        """
+        Retrieves the record of the plugin with the specified plugin
+        identifier and version, without loading it. See _request.
+
+        :return: PluginRecord (or None)
+        """
+        snapshot = snapshot or self._snapshot
+
         # -- Get all the plugins which match the given
         # -- identifier
-        matching_plugins = [
-            plugin
-            for plugin in self._plugins
-            if self._get_identifier(plugin) == plugin_identifier
-        ]
+        matching_records = snapshot.index.get(plugin_identifier)
 
         # -- If there are no matching plugins we have nothing
         # -- to return
-        if not matching_plugins:
-            self._log(
-                'No plugin matching {}'.format(plugin_identifier),
-                is_warning=True,
-            )
+        if not matching_records:
+            if warn:
+                self._log(
+                    'No plugin matching {}',
+                    plugin_identifier,
+                    is_warning=True,
+                    once=True,
+                )
             return None
 
         # -- If we have not been given a versioning identifier
-        # -- then we arbitrarily return from our matching plugins.
+        # -- then we arbitrarily return from our matching plugins,
+        # -- passing over lazy plugins which could not be loaded
         if not self._version:
-            return matching_plugins[0]
+            for record in matching_records:
+                if not record.failed():
+                    return record
 
-        # -- Sort out plugins in version order
-        versions = {
-            self._get_version(plugin): plugin
-            for plugin in matching_plugins
-        }
+            return None
+
+        # -- Pull out the version lookup for this identifier
+        versions = snapshot.versions[plugin_identifier]
 
         # -- If we have not been given a version we simply return
-        # -- the plugin with the highest value
+        # -- the plugin with the highest value which can be loaded
         if not version:
-            return versions[max(versions.keys())]
+            version = max(versions.keys())
+
+            if versions[version].failed():
+                loadable = [
+                    key
+                    for key, record in versions.items()
+                    if not record.failed()
+                ]
+
+                if not loadable:
+                    return None
+
+                version = max(loadable)
 
         # -- If the requested version is not in the versions
         # -- available we return None
         if version not in versions:
-            self._log(
-                'Version {} of {} could not be found'.format(
+            if warn:
+                self._log(
+                    'Version {} of {} could not be found',
                     version,
                     plugin_identifier,
-                ),
-                is_warning=True,
-            )
+                    is_warning=True,
+                    once=True,
+                )
             return None
 
-        # -- Finally we return the requested version
         return versions[version]
 
+    # --------------------------------------------------------------------------
+    def _load_record(self, record, warn=True):
+        """
+        Returns the plugin held by the given record, loading it first if it
+        was discovered lazily.
+
+        :param record: The record of the plugin
+        :type record: PluginRecord
+
+        :param warn: If False, no warning is logged when the plugin cannot
+            be loaded
+        :type warn: bool
+
+        :return: Plugin Class (or None)
+        """
+        plugin = record.plugin
+
+        # -- Plugins discovered lazily are only loaded now that they
+        # -- have actually been asked for
+        if isinstance(plugin, LazyPlugin):
+            plugin = plugin.load()
+
+            if not plugin:
+                if warn:
+                    self._log(
+                        'Could not load lazy plugin {}',
+                        record.identifier,
+                        is_warning=True,
+                    )
+
+                # -- Readers never take the lock, so the record is passed
+                # -- over until the next change removes it
+                self._failed_records.append(record)
+
+        return plugin
+
+    # --------------------------------------------------------------------------
+    def _forget_failed(self):
+        """
+        Removes the records of any lazy plugins which could not be loaded
+        since the last change. This must only be called whilst holding the
+        lock.
+
+        :return: None
+        """
+        failed, self._failed_records = self._failed_records, list()
+
+        if not failed:
+            return
+
+        failed = set(failed)
+
+        if self._remove_plugins(lambda record: record in failed):
+            self._emit(self.plugins_changed)
+
+    # --------------------------------------------------------------------------
+    @_changes
     def set_disabled(self, identifier, state):
         """
         This will mark the given plugin as being disabled and will no longer
@@ -928,27 +3195,53 @@ class Factory(object):
         :param state: True if the plugin is being disabled, False
         :type state: bool
         """
-        if state and identifier not in self._disabled:
-            self._disabled.append(identifier)
-            self.plugins_changed.emit()
+        self.set_disabled_many([identifier], state)
+
+    # --------------------------------------------------------------------------
+    @_changes
+    def set_disabled_many(self, identifiers, state):
+        """
+        Sets the disabled state of all the given plugins at once (see
+        set_disabled). The plugins_changed signal is emitted only once,
+        and only if any of the states were changed.
+
+        :param identifiers: Identifiers of the plugins you want to change
+            the disabled state for
+        :type identifiers: iterable
+
+        :param state: True if the plugins are being disabled, False
+        :type state: bool
+
+        :return: None
+        """
+        identifiers = set(identifiers)
+
+        if state:
+            changed = identifiers - self._disabled
+            self._disabled |= changed
+
+        else:
+            changed = identifiers & self._disabled
+            self._disabled -= changed
 
-        if not state and identifier in self._disabled:
-            self._disabled.remove(identifier)
-            self.plugins_changed.emit()
+        if changed:
+            self._emit(self.plugins_changed)
 
     def is_disabled(self, identifier):
         """
         This will return whether the given plugin identifier has been disbaled
         """
-        return identifier in self._disabled
+        return identifier in self._snapshot.disabled
 
     # --------------------------------------------------------------------------
+    @_changes
     def remove_path(self, path):
         """
         This will remove a path from the path list. Any plugins from this 
         location will be removed.
         
-        Note: This action performs a factory clear and re-scan.
+        Only the plugins found within this path are removed, none of the
+        other paths are searched again.
         
         :param path: Path to remove from the factory. This must be an 
             absolute path
@@ -975,24 +3268,57 @@ class Factory(object):
             >>> print(len(reader.factory.plugins()))
             0
         """
-        # -- Take a snapshot of the path data
-        path_data = self._add_pathed_paths.copy()
+        # -- Find the registered paths which match the one we're
+        # -- being asked to remove
+        removed_paths = set(
+            original_path
+            for original_path in self._add_pathed_paths
+            if os.path.abspath(original_path) == os.path.abspath(path)
+        )
 
-        # -- Start clearing out the factory variables
-        self._plugins = list()
-        self._add_pathed_paths = dict()
+        if not removed_paths:
+            return
 
-        # -- Now cycle over the path data and re-add_path them
-        for original_path, mechanism in path_data.items():
+        for removed_path in removed_paths:
+            del self._add_pathed_paths[removed_path]
 
-            # -- Skip the path we're being asked to remove
-            if os.path.abspath(original_path) == os.path.abspath(path):
-                continue
+        # -- Drop only the plugins which came from the removed paths
+        removed = self._remove_plugins(
+            lambda record: record.path in removed_paths,
+        )
 
-            self.add_path(
-                path=original_path,
-                mechanism=mechanism,
-            )
+        # -- Forget any modules loaded on behalf of lazy plugins
+        # -- from these paths
+        for record in removed:
+            if isinstance(record.plugin, LazyPlugin):
+                with self._lazy_lock:
+                    self._lazy_modules.pop(record.filepath, None)
+
+            if record.filepath:
+                self._evict_module(record.filepath)
+
+        self._emit(self.paths_changed)
+
+        if removed:
+            self._emit(self.plugins_changed)
+
+    # --------------------------------------------------------------------------
+    async def remove_path_async(self, path, executor=None):
+        """
+        Asynchronous version of remove_path for use within an asyncio event
+        loop. See add_path_async for details.
+
+        :param path: Path to remove from the factory. This must be an
+            absolute path
+        :type path: str
+
+        :param executor: The executor to remove the path within. If not
+            given the loops default executor is used.
+        :type executor: concurrent.futures.Executor
+
+        :return: None
+        """
+        return await self._run_async(self.remove_path, executor, path)
 
     # --------------------------------------------------------------------------
     def versions(self, identifier):
@@ -1020,9 +3346,8 @@ class Factory(object):
             return list()
 
         return sorted(
-            self._get_version(plugin)
-            for plugin in self._plugins
-            if self._get_identifier(plugin) == identifier
+            record.version
+            for record in self._snapshot.index.get(identifier, ())
         )
 
     def serialise(self):
@@ -1030,17 +3355,26 @@ class Factory(object):
         This will serialise down the factories state into a dictionarly. This is
         particularly useful if you want to store the factory state in a persistent
         way.
+
+        Alongside the state, a description of each plugin (its class name,
+        identifier, version, and the file, path and mechanism it was loaded
+        from) is given under 'plugins'. This is for information only and
+        is not needed by restore_from.
         """
+        snapshot = self._snapshot
+
         return dict(
-            paths=self.paths(),
+            paths=list(snapshot.paths),
             disabled_identifiers=[
                 identifier
-                for identifier in self.identifiers(include_disabled=True)
-                if self.is_disabled(identifier)
+                for identifier in snapshot.index
+                if identifier in snapshot.disabled
             ],
             identifier=self._identifier,
+            plugins=[record.as_dict() for record in snapshot.records],
         )
 
+    @_changes
     def restore_from(self, data):
         """
         This will reset the factory and populate it based on a serialised
@@ -1063,9 +3397,16 @@ class Factory(object):
         for path in data["paths"]:
             self.add_path(path=path)
 
-        for disabled_identifier in data["disabled_identifiers"]:
-            if disabled_identifier in self.identifiers():
-                self.set_disabled(disabled_identifier, True)
+        # -- We check against the index rather than the identifiers, as
+        # -- this change is not visible to readers until it is complete
+        self.set_disabled_many(
+            [
+                disabled_identifier
+                for disabled_identifier in data["disabled_identifiers"]
+                if self._known(disabled_identifier)
+            ],
+            True,
+        )
 
 
 # ------------------------------------------------------------------------------
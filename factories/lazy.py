@@ -0,0 +1,362 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import ast
+import inspect
+import builtins
+import importlib.util
+
+
+# ------------------------------------------------------------------------------
+class LazyPlugin(object):
+    """
+    A lightweight stand-in for a plugin class which has been discovered
+    but whose module has not yet been imported. The identifier and version
+    are known up-front, and the real class is only loaded when it is
+    first asked for.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, loader, filepath, class_name, identifier, version):
+        """
+        :param loader: Callable which takes a filepath and returns the
+            loaded module (or None if it could not be loaded)
+        :type loader: callable
+
+        :param filepath: Absolute path to the file holding the plugin
+        :type filepath: str
+
+        :param class_name: Name of the plugin class within the module
+        :type class_name: str
+
+        :param identifier: The resolved identifier of the plugin
+
+        :param version: The resolved version of the plugin (or None)
+        """
+        self.loader = loader
+        self.filepath = filepath
+        self.class_name = class_name
+        self.identifier = identifier
+        self.version = version
+
+        # -- Whether the plugin could not be loaded when it was asked for
+        self.failed = False
+
+        self._plugin = None
+
+    # --------------------------------------------------------------------------
+    def __repr__(self):
+        return '[LazyPlugin - {} ({})]'.format(
+            self.class_name,
+            self.filepath,
+        )
+
+    # --------------------------------------------------------------------------
+    def is_loaded(self):
+        """
+        Returns whether the real plugin class has been loaded
+
+        :return: bool
+        """
+        return self._plugin is not None
+
+    # --------------------------------------------------------------------------
+    def load(self):
+        """
+        Loads (if needed) and returns the real plugin class. If the module
+        could not be loaded, or no longer holds the class, None is returned
+        and the plugin is marked as failed.
+
+        :return: Class or None
+        """
+        if self._plugin is None and not self.failed:
+            module = self.loader(self.filepath)
+
+            if module:
+                self._plugin = getattr(module, self.class_name, None)
+
+            self.failed = self._plugin is None
+
+        return self._plugin
+
+
+# ------------------------------------------------------------------------------
+class _Unresolvable(Exception):
+    """
+    Raised internally when a file cannot be understood statically.
+    """
+
+
+# ------------------------------------------------------------------------------
+def scan(filepath, abstract, identifier, version=None, source=None):
+    """
+    Statically parses the given python file looking for classes which
+    subclass the abstract (by name), and resolves their identifier and
+    version from literal class attributes without importing the file.
+
+    If anything within the file cannot be resolved statically - such as
+    an identifier implemented as a method, a base class which is defined
+    elsewhere, a class defined within a conditional block or a class
+    imported from another module - then None is returned, indicating the
+    file must be imported to be inspected.
+
+    :param filepath: Absolute path to the python file to parse
+    :type filepath: str
+
+    :param abstract: The abstract class plugins must inherit from
+    :type abstract: Class
+
+    :param identifier: Name of the attribute used as the plugin identifier
+    :type identifier: str
+
+    :param version: Name of the attribute used as the plugin version
+    :type version: str
+
+    :param source: The contents of the file, if it has already been read
+    :type source: bytes
+
+    :return: list((class_name, identifier, version), ...) or None
+    """
+    # noinspection PyBroadException
+    try:
+        if source is None:
+            with open(filepath, 'rb') as f:
+                source = f.read()
+
+        tree = ast.parse(source, filename=filepath)
+
+    except BaseException:
+        return None
+
+    abstract_names = _abstract_aliases(tree, abstract.__name__)
+
+    # -- Importing the file may give plugins we cannot see here, so we
+    # -- leave those files to be imported
+    if _hidden_classes(tree, abstract.__name__):
+        return None
+
+    # -- Classes in this file which we know to be plugins
+    candidates = dict()
+    results = list()
+
+    try:
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+
+            parent = _plugin_base(node, abstract_names, candidates)
+
+            if parent is None:
+                continue
+
+            candidates[node.name] = (node, parent)
+
+            resolved_identifier = _resolve(
+                node.name,
+                identifier,
+                candidates,
+                abstract,
+            )
+
+            resolved_version = None
+
+            if version:
+                resolved_version = _resolve(
+                    node.name,
+                    version,
+                    candidates,
+                    abstract,
+                )
+
+            results.append((node.name, resolved_identifier, resolved_version))
+
+    except _Unresolvable:
+        return None
+
+    return results
+
+
+# ------------------------------------------------------------------------------
+def _abstract_aliases(tree, abstract_name):
+    """
+    Returns all the names the abstract may be referred to by within the
+    module, taking into account import aliases.
+
+    :return: set(str, ...)
+    """
+    names = {abstract_name}
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if alias.name == abstract_name and alias.asname:
+                    names.add(alias.asname)
+
+    return names
+
+
+# ------------------------------------------------------------------------------
+def _hidden_classes(tree, abstract_name):
+    """
+    Returns whether the module may hold classes which are not defined at
+    its top level, such as those defined within a try or if block or those
+    imported from other modules. Names imported from other modules are
+    only trusted where they are the abstract or are themselves modules.
+
+    :return: bool
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and node not in tree.body:
+            return True
+
+        if not isinstance(node, ast.ImportFrom):
+            continue
+
+        # -- Relative imports cannot be resolved without the package
+        if node.level:
+            return True
+
+        for alias in node.names:
+            if alias.name == abstract_name:
+                continue
+
+            if alias.name == '*' or not _is_module(
+                '{}.{}'.format(node.module, alias.name),
+            ):
+                return True
+
+    return False
+
+
+# ------------------------------------------------------------------------------
+def _is_module(name):
+    """
+    Returns whether the given dotted name is a module which can be found
+    without importing it. Its parent packages may be imported to find it.
+
+    :return: bool
+    """
+    # noinspection PyBroadException
+    try:
+        return importlib.util.find_spec(name) is not None
+
+    except BaseException:
+        return False
+
+
+# ------------------------------------------------------------------------------
+def _base_name(node):
+    """
+    Returns the final name of a base class node, so that both Name and
+    module.Name are supported.
+
+    :return: str or None
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+
+    if isinstance(node, ast.Attribute):
+        return node.attr
+
+    return None
+
+
+# ------------------------------------------------------------------------------
+def _plugin_base(node, abstract_names, candidates):
+    """
+    Returns the name of the plugin within the same file through which the
+    given class inherits from the abstract, or an empty string if it
+    inherits from the abstract directly. If the class is not a plugin None is returned.
+
+    Any base class which is neither a builtin, the abstract or a known
+    plugin makes the file unresolvable, as it may itself be a plugin.
+
+    :return: str or None
+    """
+    parent = None
+
+    for base in node.bases:
+        name = _base_name(base)
+
+        # -- An empty string represents the abstract itself
+        if name in abstract_names:
+            if parent is None:
+                parent = ''
+
+        elif name in candidates:
+            if parent is None:
+                parent = name
+
+        elif name is None or not hasattr(builtins, name):
+            raise _Unresolvable()
+
+    return parent
+
+
+# ------------------------------------------------------------------------------
+def _resolve(class_name, attribute, candidates, abstract):
+    """
+    Resolves the value of the given attribute for the given plugin class,
+    walking up through any plugins in the same file and finally to the
+    abstract.
+
+    :return: The resolved value
+    """
+    if attribute == '__name__':
+        return class_name
+
+    while class_name:
+        node, parent = candidates[class_name]
+
+        for statement in node.body:
+            if isinstance(statement, ast.Assign):
+                targets = statement.targets
+
+            elif isinstance(statement, ast.AnnAssign) and statement.value:
+                targets = [statement.target]
+
+            elif isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if statement.name == attribute:
+                    raise _Unresolvable()
+                continue
+
+            else:
+                continue
+
+            for target in targets:
+                if isinstance(target, ast.Name) and target.id == attribute:
+                    try:
+                        return ast.literal_eval(statement.value)
+
+                    except ValueError:
+                        raise _Unresolvable()
+
+        class_name = parent
+
+    # -- The attribute is inherited from the abstract. If it is a plain
+    # -- value we can use that, but methods may vary by subclass
+    if not hasattr(abstract, attribute):
+        raise _Unresolvable()
+
+    value = getattr(abstract, attribute)
+
+    if inspect.ismethod(value) or inspect.isfunction(value):
+        raise _Unresolvable()
+
+    return value
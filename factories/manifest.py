@@ -0,0 +1,218 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from .lazy import LazyPlugin
+from .constants import log
+from . import archive as plugin_archive
+
+import os
+import sys
+import json
+import hashlib
+
+
+# -- This is stored within each manifest and bumped whenever the layout
+# -- of the stored data changes
+FORMAT_VERSION = 1
+
+
+# ------------------------------------------------------------------------------
+def abstract_name(abstract):
+    """
+    Returns the dotted name a manifest uses to record the abstract class
+    it was built for.
+
+    :param abstract: The abstract class of a factory
+    :type abstract: Class
+
+    :return: str
+    """
+    return '{}.{}'.format(
+        abstract.__module__,
+        getattr(abstract, '__qualname__', abstract.__name__),
+    )
+
+
+# ------------------------------------------------------------------------------
+def file_hash(filepath):
+    """
+    Returns a hash of the contents of the given file, which may be a file
+    within an archive.
+
+    :param filepath: Absolute path to the file to hash
+    :type filepath: str
+
+    :return: str
+    """
+    if plugin_archive.split(filepath):
+        return hashlib.sha1(plugin_archive.read(filepath)).hexdigest()
+
+    with open(filepath, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+# ------------------------------------------------------------------------------
+def _module_for(factory, record):
+    """
+    Returns the name the given plugins file can be imported as (or None if
+    it was loaded directly) along with the module it was loaded into.
+
+    :return: (str or None, module or None)
+    """
+    module_name = None
+
+    if record.mechanism != factory.LOAD_SOURCE:
+        module_name = factory._resolver.module_name(record.filepath)
+
+    module = sys.modules.get(module_name) if module_name else None
+
+    # -- If the file was not imported under that name then it was loaded
+    # -- directly, and must be loaded directly again
+    if module is None or getattr(module, '__file__', None) != record.filepath:
+        module_name = None
+        module = sys.modules.get(factory._load_name(record.filepath))
+
+    return module_name, module
+
+
+# ------------------------------------------------------------------------------
+def build(factory):
+    """
+    Describes every plugin the given factory found within its paths, such
+    that another factory can register them from the description alone
+    without searching or importing anything.
+
+    For each plugin we store the module it can be imported as (if any),
+    the file it lives in along with a hash of that file, the name of the
+    class within the module and its resolved identifier and version.
+    Plugins which were registered directly rather than found within a
+    path are not included.
+
+    :param factory: The factory to describe
+    :type factory: factories.Factory
+
+    :return: dict
+    """
+    with factory._lock:
+        paths = [
+            dict(path=path, mechanism=mechanism)
+            for path, mechanism in factory._add_pathed_paths.items()
+        ]
+
+    plugins = list()
+    file_hashes = dict()
+
+    for record in factory._snapshot.records:
+        if not record.filepath:
+            continue
+
+        if record.filepath not in file_hashes:
+            file_hashes[record.filepath] = file_hash(record.filepath)
+
+        module_name, module = _module_for(factory, record)
+        class_name = record.class_name()
+
+        # -- The plugin may be held under a different name to its own
+        # -- (such as when it is imported into the module), so we look
+        # -- for the name the factory would have found it under
+        if not isinstance(record.plugin, LazyPlugin) and module:
+            if getattr(module, class_name, None) is not record.plugin:
+                for name, item in vars(module).items():
+                    if item is record.plugin:
+                        class_name = name
+                        break
+
+        plugins.append(
+            dict(
+                module=module_name,
+                filepath=record.filepath,
+                class_name=class_name,
+                identifier=record.identifier,
+                version=record.version,
+                sha1=file_hashes[record.filepath],
+                path=record.path,
+                mechanism=record.mechanism,
+            ),
+        )
+
+    return dict(
+        format=FORMAT_VERSION,
+        abstract=abstract_name(factory._abstract),
+        identifier=factory._identifier,
+        versioning_identifier=factory._version,
+        paths=paths,
+        plugins=plugins,
+    )
+
+
+# ------------------------------------------------------------------------------
+def write(manifest, filepath):
+    """
+    Writes the given manifest to the given file as json.
+
+    :param manifest: A manifest, as returned by build
+    :type manifest: dict
+
+    :param filepath: Absolute path to write the manifest to
+    :type filepath: str
+
+    :return: None
+    """
+    directory = os.path.dirname(filepath)
+
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    # -- Write to a temporary file and swap it in, so that factories
+    # -- starting up never read a partially written manifest
+    temp_filepath = '{}.{}.tmp'.format(filepath, os.getpid())
+
+    with open(temp_filepath, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    os.replace(temp_filepath, filepath)
+
+
+# ------------------------------------------------------------------------------
+def read(filepath):
+    """
+    Reads a manifest from the given file. If the file cannot be read, or
+    was written in a different format, None is returned.
+
+    :param filepath: Absolute path to the manifest file
+    :type filepath: str
+
+    :return: dict or None
+    """
+    # noinspection PyBroadException
+    try:
+        with open(filepath, 'r') as f:
+            manifest = json.load(f)
+
+    except BaseException:
+        log.warning('Plugin manifest is unreadable : {}'.format(filepath))
+        return None
+
+    if manifest.get('format') != FORMAT_VERSION:
+        log.warning(
+            'Plugin manifest is in an unknown format : {}'.format(filepath),
+        )
+        return None
+
+    return manifest
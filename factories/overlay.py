@@ -0,0 +1,208 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from .factory import Factory
+from .snapshot import OverlaySnapshot
+
+
+# ------------------------------------------------------------------------------
+class FactoryOverlay(Factory):
+    """
+    A factory which is layered on top of another (base) factory. It offers
+    all the plugins of the base, without loading or inspecting anything
+    again, along with any plugins it holds itself.
+
+    Paths added to, plugins registered with and plugins disabled within
+    the overlay only affect the overlay. Plugins disabled within the base
+    are disabled within the overlay too. Changes to the base are seen by
+    the overlay straight away, and the base signals are passed on through
+    the overlay signals.
+
+    This makes it cheap to hold many variations of the same factory, such
+    as one per user or per tenant, as each overlay only holds what it
+    adds.
+
+    .. code-block:: python
+
+        >>> import factories
+        >>> from factories.examples.zoo import Zoo
+        >>>
+        >>> zoo = Zoo()
+        >>>
+        >>> tenant = factories.FactoryOverlay(zoo.factory)
+        >>> tenant.set_disabled('tiger', True)
+        >>>
+        >>> print('tiger' in tenant.identifiers())
+        False
+        >>> print('tiger' in zoo.factory.identifiers())
+        True
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self,
+                 base,
+                 paths=None,
+                 mechanism=0,
+                 instrumentation=None,
+                 selection_cache_size=None,
+                 pool_size=None):
+        """
+        :param base: The factory to layer on top of
+        :type base: Factory
+
+        :param paths: Paths to search for plugins held only by the overlay
+        :type paths: list(str, str, ...)
+
+        :param mechanism: The loading mechanism to use for the given paths
+            (see Factory.add_path)
+        :type mechanism: int
+
+        :param instrumentation: Optional object to record metrics with (see
+            Factory)
+        :type instrumentation: FactoryStats
+
+        :param selection_cache_size: If given, the size of the selection
+            cache used by dispatch (see Factory)
+        :type selection_cache_size: int
+
+        :param pool_size: If given, the size of the instance pool used by
+            acquire (see Factory)
+        :type pool_size: int
+        """
+        self._base = base
+
+        # -- The snapshot of our own plugins, and the snapshot combining
+        # -- them with the base as (base, own, combined)
+        self._own_snapshot = None
+        self._combined = None
+
+        super(FactoryOverlay, self).__init__(
+            abstract=base._abstract,
+            paths=paths,
+            plugin_identifier=base._identifier,
+            versioning_identifier=base._version,
+            mechanism=mechanism,
+            regex_filter=base._regex_filter,
+            log_errors=base._log_errors,
+            lazy=base._lazy,
+            workers=base._workers,
+            instrumentation=instrumentation,
+            deduplicate_warnings=base._deduplicate_warnings,
+            selection_cache_size=selection_cache_size,
+            pool_size=pool_size,
+        )
+
+        # -- Pass on the signals of the base
+        base.changed.connect(self._base_changed)
+        base.paths_changed.connect(self._base_paths_changed)
+        base.plugins_changed.connect(self._base_plugins_changed)
+        base.plugins_reloaded.connect(self._base_plugins_reloaded)
+
+    # --------------------------------------------------------------------------
+    def __repr__(self):
+        return '[FACTORY OVERLAY - Identifier: {}, Plugin Count: {}]'.format(
+            self._identifier,
+            len(self._own_snapshot.records),
+        )
+
+    # --------------------------------------------------------------------------
+    @property
+    def _snapshot(self):
+        """
+        The snapshot readers use, combining the current snapshot of the
+        base with that of the overlay. This is only rebuilt when either
+        of them has changed.
+
+        :return: OverlaySnapshot
+        """
+        base = self._base._snapshot
+        own = self._own_snapshot
+        combined = self._combined
+
+        if not combined or combined[0] is not base or combined[1] is not own:
+            combined = self._combined = (base, own, OverlaySnapshot(base, own))
+
+        return combined[2]
+
+    # --------------------------------------------------------------------------
+    @_snapshot.setter
+    def _snapshot(self, snapshot):
+        self._own_snapshot = snapshot
+
+    # --------------------------------------------------------------------------
+    def _known(self, identifier):
+        """
+        Returns whether a plugin with the given identifier is held by either
+        the overlay or the base.
+
+        :return: bool
+        """
+        if identifier in self._index:
+            return True
+
+        return identifier in self._base._snapshot.index
+
+    # --------------------------------------------------------------------------
+    def serialise(self):
+        """
+        Serialises the state of the overlay (see Factory.serialise). Only
+        the paths and disabled plugins of the overlay itself are given, as
+        those of the base belong to the base.
+
+        :return: dict
+        """
+        data = super(FactoryOverlay, self).serialise()
+        own = self._own_snapshot
+
+        data['paths'] = list(own.paths)
+        data['disabled_identifiers'] = [
+            identifier
+            for identifier in data['disabled_identifiers']
+            if identifier in own.disabled
+        ]
+
+        return data
+
+    # --------------------------------------------------------------------------
+    def base(self):
+        """
+        Returns the factory this overlay is layered on top of.
+
+        :return: Factory
+        """
+        return self._base
+
+    # --------------------------------------------------------------------------
+    def _base_changed(self):
+        self.changed.emit()
+
+    # --------------------------------------------------------------------------
+    def _base_paths_changed(self):
+        self.paths_changed.emit()
+
+    # --------------------------------------------------------------------------
+    def _base_plugins_changed(self):
+        if self._pool is not None:
+            self._pool.retain(self._requestable(self._snapshot))
+
+        self.plugins_changed.emit()
+
+    # --------------------------------------------------------------------------
+    def _base_plugins_reloaded(self, changes):
+        self.plugins_reloaded.emit(changes)
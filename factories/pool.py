@@ -0,0 +1,282 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from .constants import log
+
+import sys
+import weakref
+import threading
+
+
+# ------------------------------------------------------------------------------
+class InstancePool(object):
+    """
+    Holds onto instances of plugins once they are released, so that they
+    can be handed out again rather than constructing new ones. Instances
+    are pooled per plugin record, so a plugin which is reloaded or removed
+    never gives back instances of what it was before.
+
+    When an instance is released its reset method (if it has one) is called
+    to put it back into a usable state. Instances which fail to reset, or
+    which are released when their pool is already full, are dropped.
+
+    Instances which are acquired but never released are only weakly held,
+    so they are forgotten (and no longer counted as in use) once nothing
+    else refers to them. Instances which cannot be weakly referenced are
+    held until they are released.
+
+    Acquiring and releasing is safe to do from multiple threads. New
+    instances are constructed and reset without holding the lock.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, size=8):
+        """
+        :param size: The most idle instances to hold for any one plugin
+        :type size: int
+        """
+        self.size = size
+
+        self._lock = threading.Lock()
+
+        # -- record: [idle instance, ...]
+        self._pools = dict()
+
+        # -- id(instance): (reference, record) for everything handed out
+        # -- and not yet released, where calling the reference gives the
+        # -- instance (or None once it has been collected)
+        self._acquired = dict()
+
+        # -- Keys of acquired instances which have since been collected.
+        # -- These are added to by the weak reference callbacks, which may
+        # -- run whilst the lock is held, so are only forgotten by _prune.
+        self._collected = list()
+
+        # -- identifier: [hits, misses, returned, discarded]
+        self._counts = dict()
+
+    # --------------------------------------------------------------------------
+    def _count(self, record, index):
+        """
+        Increments one of the counts held for the identifier of the given
+        record. This must only be called whilst holding the lock.
+
+        :return: None
+        """
+        counts = self._counts.get(record.identifier)
+
+        if counts is None:
+            counts = self._counts[record.identifier] = [0, 0, 0, 0]
+
+        counts[index] += 1
+
+    # --------------------------------------------------------------------------
+    def _track(self, instance, record):
+        """
+        Remembers the given instance as being acquired, without stopping
+        it from being collected. This must only be called whilst holding
+        the lock.
+
+        :return: None
+        """
+        key = id(instance)
+
+        try:
+            reference = weakref.ref(
+                instance,
+                lambda _: self._collected.append(key),
+            )
+
+        except TypeError:
+            reference = lambda: instance
+
+        self._acquired[key] = (reference, record)
+
+    # --------------------------------------------------------------------------
+    def _prune(self):
+        """
+        Forgets the acquired instances which have been collected without
+        being released. This must only be called whilst holding the lock.
+
+        :return: None
+        """
+        while self._collected:
+            key = self._collected.pop()
+            entry = self._acquired.get(key)
+
+            # -- The id may already belong to a newly acquired instance
+            if entry is not None and entry[0]() is None:
+                del self._acquired[key]
+
+    # --------------------------------------------------------------------------
+    def acquire(self, record, create):
+        """
+        Returns an idle instance of the plugin held by the given record, or
+        a new one if there are none idle.
+
+        :param record: The record of the plugin to get an instance of
+        :type record: PluginRecord
+
+        :param create: Callable taking no arguments which gives a new
+            instance of the plugin
+        :type create: callable
+
+        :return: The instance
+        """
+        with self._lock:
+            self._prune()
+            idle = self._pools.setdefault(record, list())
+
+            if idle:
+                instance = idle.pop()
+                self._track(instance, record)
+                self._count(record, 0)
+                return instance
+
+            self._count(record, 1)
+
+        instance = create()
+
+        with self._lock:
+            self._prune()
+            self._track(instance, record)
+
+        return instance
+
+    # --------------------------------------------------------------------------
+    def release(self, instance):
+        """
+        Resets the given instance and holds onto it so it can be acquired
+        again.
+
+        :param instance: An instance given by acquire
+
+        :return: True if the instance was pooled, or False if it was dropped
+        """
+        with self._lock:
+            self._prune()
+            entry = self._acquired.get(id(instance))
+
+            if entry is not None and entry[0]() is instance:
+                del self._acquired[id(instance)]
+
+            else:
+                entry = None
+
+        if entry is None:
+            raise ValueError(
+                '{} was not acquired from this pool'.format(instance),
+            )
+
+        record = entry[1]
+        reset = getattr(instance, 'reset', None)
+
+        if callable(reset):
+            # -- We have no control over what the plugin does, so any
+            # -- failure simply means the instance is not reused
+            # noinspection PyBroadException
+            try:
+                reset()
+
+            except BaseException:
+                log.warning(
+                    'Failed to reset {} : {}'.format(
+                        instance,
+                        str(sys.exc_info()),
+                    ),
+                )
+                record = None
+
+        with self._lock:
+            idle = self._pools.get(record)
+
+            # -- The plugin may have been reloaded or removed since the
+            # -- instance was acquired, in which case its pool is gone
+            if idle is None or len(idle) >= self.size:
+                self._count(entry[1], 3)
+                return False
+
+            idle.append(instance)
+            self._count(record, 2)
+
+        return True
+
+    # --------------------------------------------------------------------------
+    def retain(self, records):
+        """
+        Drops the pools of any plugins which are not in the given records,
+        along with the idle instances they hold.
+
+        :param records: The records of the plugins which are still current
+        :type records: iterable
+
+        :return: None
+        """
+        records = set(records)
+
+        with self._lock:
+            for record in list(self._pools):
+                if record not in records:
+                    del self._pools[record]
+
+    # --------------------------------------------------------------------------
+    def clear(self):
+        """
+        Drops every pool along with the idle instances they hold, but not
+        the counts.
+
+        :return: None
+        """
+        with self._lock:
+            self._pools.clear()
+
+    # --------------------------------------------------------------------------
+    def as_dict(self):
+        """
+        Returns, per identifier, how many acquisitions reused an idle
+        instance (hits) or constructed a new one (misses), how many
+        instances were returned to the pool or discarded on release, and
+        how many are currently idle or in use.
+
+        :return: dict
+        """
+        with self._lock:
+            self._prune()
+            identifiers = dict()
+
+            for identifier, counts in self._counts.items():
+                identifiers[identifier] = dict(
+                    hits=counts[0],
+                    misses=counts[1],
+                    returned=counts[2],
+                    discarded=counts[3],
+                    idle=0,
+                    in_use=0,
+                )
+
+            for record, idle in self._pools.items():
+                identifiers[record.identifier]['idle'] += len(idle)
+
+            for _, record in self._acquired.values():
+                identifiers[record.identifier]['in_use'] += 1
+
+            return dict(
+                size=self.size,
+                identifiers=identifiers,
+            )
@@ -0,0 +1,125 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from .lazy import LazyPlugin
+
+
+# ------------------------------------------------------------------------------
+class PluginRecord(object):
+    """
+    Everything a factory knows about a single registered plugin. The
+    identifier and version are resolved once, when the plugin is registered,
+    so nothing which reads a record needs to inspect the plugin again.
+    """
+
+    __slots__ = (
+        'plugin',
+        'identifier',
+        'version',
+        'filepath',
+        'path',
+        'mechanism',
+        'load_time',
+    )
+
+    # --------------------------------------------------------------------------
+    def __init__(self,
+                 plugin,
+                 identifier,
+                 version=None,
+                 filepath=None,
+                 path=None,
+                 mechanism=None,
+                 load_time=None):
+        """
+        :param plugin: The plugin class (or a LazyPlugin standing in for it)
+
+        :param identifier: The resolved identifier of the plugin
+
+        :param version: The resolved version of the plugin (or None)
+
+        :param filepath: The file the plugin was found within, if any
+        :type filepath: str
+
+        :param path: The searched path the plugin was found within, if any
+        :type path: str
+
+        :param mechanism: The loading mechanism used for the file, if any
+            (see Factory.add_path)
+        :type mechanism: int
+
+        :param load_time: When the plugin was registered, as given by
+            time.time()
+        :type load_time: float
+        """
+        self.plugin = plugin
+        self.identifier = identifier
+        self.version = version
+        self.filepath = filepath
+        self.path = path
+        self.mechanism = mechanism
+        self.load_time = load_time
+
+    # --------------------------------------------------------------------------
+    def __repr__(self):
+        return '[PluginRecord - {} ({})]'.format(
+            self.identifier,
+            self.filepath or 'registered',
+        )
+
+    # --------------------------------------------------------------------------
+    def class_name(self):
+        """
+        Returns the name of the plugin class, without loading it if it is
+        a lazily discovered plugin.
+
+        :return: str
+        """
+        if isinstance(self.plugin, LazyPlugin):
+            return self.plugin.class_name
+
+        return self.plugin.__name__
+
+    # --------------------------------------------------------------------------
+    def failed(self):
+        """
+        Returns whether the plugin was discovered lazily and then could not
+        be loaded when it was asked for.
+
+        :return: bool
+        """
+        return isinstance(self.plugin, LazyPlugin) and self.plugin.failed
+
+    # --------------------------------------------------------------------------
+    def as_dict(self):
+        """
+        Returns the record as a dictionary describing where the plugin
+        came from, made up only of plain python types.
+
+        :return: dict
+        """
+        return dict(
+            class_name=self.class_name(),
+            identifier=self.identifier,
+            version=self.version,
+            filepath=self.filepath,
+            path=self.path,
+            mechanism=self.mechanism,
+            load_time=self.load_time,
+        )
@@ -0,0 +1,147 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import os
+import sys
+
+
+# ------------------------------------------------------------------------------
+class ModuleResolver(object):
+    """
+    Works out the dotted module name a python file would be imported as,
+    without importing anything.
+
+    The folders on the sys.path are gathered once (and again only if the
+    sys.path changes) and whether each folder holds an __init__ file is
+    remembered, so resolving many files within the same tree only needs
+    to look at each folder once.
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self):
+        self._sys_path = None
+        self._roots = set()
+
+        # -- Folder to whether that folder is a package
+        self._packages = dict()
+
+    # --------------------------------------------------------------------------
+    @classmethod
+    def _normalise(cls, path):
+        """
+        Returns the given path in a form which can be compared with others.
+
+        :return: str
+        """
+        return os.path.normcase(os.path.abspath(path or os.getcwd()))
+
+    # --------------------------------------------------------------------------
+    def refresh(self):
+        """
+        Forgets everything we know about the file system, such that it is
+        looked at again on the next resolve.
+
+        :return: None
+        """
+        self._sys_path = None
+        self._packages = dict()
+
+    # --------------------------------------------------------------------------
+    def _update_roots(self):
+        """
+        Rebuilds our set of sys.path folders if the sys.path has changed.
+
+        :return: None
+        """
+        if self._sys_path == sys.path:
+            return
+
+        self._sys_path = list(sys.path)
+        self._roots = set(
+            self._normalise(path)
+            for path in self._sys_path
+            if isinstance(path, str)
+        )
+
+    # --------------------------------------------------------------------------
+    def is_package(self, folder):
+        """
+        Returns whether the given folder holds an __init__ file.
+
+        :param folder: Absolute folder path
+        :type folder: str
+
+        :return: bool
+        """
+        if folder not in self._packages:
+            self._packages[folder] = os.path.exists(
+                os.path.join(folder, '__init__.py'),
+            )
+
+        return self._packages[folder]
+
+    # --------------------------------------------------------------------------
+    def module_name(self, filepath):
+        """
+        Returns the dotted module name the given file would be imported as
+        from the sys.path, or None if it cannot be imported.
+
+        Where the file's own folder is on the sys.path it is treated as a
+        lone module. Otherwise we walk up through the folders until we find
+        one which is on the sys.path and is not itself a package.
+
+        :param filepath: Absolute path to the python file
+        :type filepath: str
+
+        :return: str or None
+        """
+        self._update_roots()
+
+        folder, filename = os.path.split(os.path.abspath(filepath))
+        parts = [os.path.splitext(filename)[0]]
+
+        if os.path.normcase(folder) in self._roots:
+            return self._join(parts)
+
+        while True:
+            folder, part = os.path.split(folder)
+
+            # -- We have reached the top of the file system
+            if not part:
+                return None
+
+            parts.append(part)
+
+            if os.path.normcase(folder) in self._roots:
+                if not self.is_package(folder):
+                    return self._join(parts)
+
+    # --------------------------------------------------------------------------
+    @classmethod
+    def _join(cls, parts):
+        """
+        Joins the given (reversed) module parts into a dotted name, so long
+        as each of them is a valid identifier.
+
+        :return: str or None
+        """
+        if not all(part.isidentifier() for part in parts):
+            return None
+
+        return '.'.join(reversed(parts))
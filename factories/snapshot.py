@@ -0,0 +1,165 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import collections
+
+
+# ------------------------------------------------------------------------------
+class Snapshot(object):
+    """
+    An immutable view of the plugins held by a factory at a single point
+    in time.
+
+    A factory builds a new snapshot whenever a change to its plugins is
+    complete and swaps it in with a single assignment. Readers take the
+    current snapshot once and work only with that, so they never see a
+    change which is half way through being made and never need to take
+    a lock.
+
+    Nothing within a snapshot is altered once it has been built, with the
+    exception of the resolved dictionary, which is only ever used to cache
+    results derived from the snapshot itself.
+    """
+
+    __slots__ = (
+        'records',
+        'index',
+        'versions',
+        'disabled',
+        'enabled',
+        'paths',
+        'resolved',
+    )
+
+    # --------------------------------------------------------------------------
+    def __init__(self,
+                 records=(),
+                 index=None,
+                 versions=None,
+                 disabled=frozenset(),
+                 enabled=(),
+                 paths=()):
+        """
+        :param records: The PluginRecord of every plugin in the order they
+            were registered
+        :type records: tuple
+
+        :param index: Identifier to a tuple of records in the order they
+            were registered
+        :type index: dict
+
+        :param versions: Identifier to a version to record lookup
+        :type versions: dict
+
+        :param disabled: Identifiers which are disabled
+        :type disabled: frozenset
+
+        :param enabled: Identifiers within the index which are not disabled,
+            in the order they were first registered
+        :type enabled: tuple
+
+        :param paths: The paths registered with the factory
+        :type paths: tuple
+        """
+        self.records = records
+        self.index = index or dict()
+        self.versions = versions or dict()
+        self.disabled = disabled
+        self.enabled = enabled
+        self.paths = paths
+
+        # -- Results resolved from this snapshot, such as the plugin lists
+        # -- given by Factory.plugins, keyed by whatever the caller chooses
+        self.resolved = dict()
+
+
+# ------------------------------------------------------------------------------
+class OverlaySnapshot(Snapshot):
+    """
+    A snapshot which layers the plugins of an overlay factory on top of
+    the snapshot of its base factory, without copying the base.
+
+    Lookups are chained so that they check the overlay first and then the
+    base. Where an identifier exists within both, its entries are merged
+    exactly as they would be had all the plugins been registered with a
+    single factory (base first). Only those identifiers are copied, so
+    building an overlay snapshot costs as much as the overlay itself
+    rather than the base.
+    """
+
+    __slots__ = (
+        'base',
+        'own',
+        '_records',
+        '_enabled',
+    )
+
+    # --------------------------------------------------------------------------
+    def __init__(self, base, own):
+        """
+        :param base: The snapshot of the base factory
+        :type base: Snapshot
+
+        :param own: The snapshot of the overlay factories own plugins
+        :type own: Snapshot
+        """
+        self.base = base
+        self.own = own
+
+        index = dict()
+        versions = dict()
+
+        for identifier, records in own.index.items():
+            index[identifier] = base.index.get(identifier, ()) + records
+
+            if identifier in own.versions:
+                versions[identifier] = dict(
+                    base.versions.get(identifier, dict()),
+                )
+                versions[identifier].update(own.versions[identifier])
+
+        self.index = collections.ChainMap(index, base.index)
+        self.versions = collections.ChainMap(versions, base.versions)
+        self.disabled = base.disabled | own.disabled
+        self.paths = base.paths + own.paths
+        self.resolved = dict()
+
+        # -- These span every plugin, so are only built if asked for
+        self._records = None
+        self._enabled = None
+
+    # --------------------------------------------------------------------------
+    @property
+    def records(self):
+        if self._records is None:
+            self._records = self.base.records + self.own.records
+
+        return self._records
+
+    # --------------------------------------------------------------------------
+    @property
+    def enabled(self):
+        if self._enabled is None:
+            self._enabled = tuple(
+                identifier
+                for identifier in self.index
+                if identifier not in self.disabled
+            )
+
+        return self._enabled
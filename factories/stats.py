@@ -0,0 +1,240 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import threading
+
+
+# ------------------------------------------------------------------------------
+class FactoryStats(object):
+    """
+    Collects metrics about the work a factory carries out - both the cost of
+    loading each plugin file and the number and latency of the requests made
+    for each plugin identifier.
+
+    A factory is given an instance of this (or any object implementing the
+    same record methods) through its instrumentation argument, and the
+    collected metrics can then be accessed through factory.stats().
+
+    Recording only stores raw numbers, so it adds very little to the cost of
+    each call. The numbers are only arranged into a dictionary when as_dict
+    is called. Recording is safe to do from multiple threads.
+
+    .. code-block:: python
+
+        >>> import factories
+        >>> from factories.examples.zoo import Zoo
+        >>>
+        >>> zoo = Zoo(instrumentation=factories.FactoryStats())
+        >>> zoo.factory.request('tiger')
+        >>>
+        >>> print(zoo.factory.stats()['requests']['tiger']['count'])
+        1
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    # --------------------------------------------------------------------------
+    def reset(self):
+        """
+        Forgets all the metrics collected so far.
+
+        :return: None
+        """
+        with self._lock:
+            # -- filepath: [import_seconds, inspect_seconds,
+            # --            classes_inspected, plugins_found, failed]
+            self._files = dict()
+
+            # -- identifier: [count, misses, total_seconds, max_seconds]
+            self._requests = dict()
+
+            # -- identifier: [count, total_seconds, max_seconds]
+            self._instances = dict()
+
+    # --------------------------------------------------------------------------
+    def record_file(self,
+                    filepath,
+                    import_seconds,
+                    inspect_seconds,
+                    classes_inspected,
+                    plugins_found,
+                    failed=False):
+        """
+        Records the cost of loading and inspecting a single file. If the
+        file is loaded again (such as during a reload) the previous record
+        is replaced.
+
+        :param filepath: Absolute path to the file
+        :type filepath: str
+
+        :param import_seconds: Time taken to import or load the file
+        :type import_seconds: float
+
+        :param inspect_seconds: Time taken to look for plugins in the file
+        :type inspect_seconds: float
+
+        :param classes_inspected: Number of classes which were checked
+        :type classes_inspected: int
+
+        :param plugins_found: Number of plugins which were found
+        :type plugins_found: int
+
+        :param failed: True if the file could not be loaded or inspected
+        :type failed: bool
+
+        :return: None
+        """
+        with self._lock:
+            self._files[filepath] = [
+                import_seconds,
+                inspect_seconds,
+                classes_inspected,
+                plugins_found,
+                failed,
+            ]
+
+    # --------------------------------------------------------------------------
+    def record_request(self, identifier, seconds, found):
+        """
+        Records a single request for a plugin.
+
+        :param identifier: The identifier which was requested
+
+        :param seconds: Time taken to serve the request
+        :type seconds: float
+
+        :param found: Whether a plugin was returned
+        :type found: bool
+
+        :return: None
+        """
+        with self._lock:
+            record = self._requests.get(identifier)
+
+            if record is None:
+                record = self._requests[identifier] = [0, 0, 0.0, 0.0]
+
+            record[0] += 1
+            record[2] += seconds
+
+            if not found:
+                record[1] += 1
+
+            if seconds > record[3]:
+                record[3] = seconds
+
+    # --------------------------------------------------------------------------
+    def record_instance(self, identifier, seconds):
+        """
+        Records a single instancing of a plugin.
+
+        :param identifier: The identifier which was instanced
+
+        :param seconds: Time taken to request and instance the plugin
+        :type seconds: float
+
+        :return: None
+        """
+        with self._lock:
+            record = self._instances.get(identifier)
+
+            if record is None:
+                record = self._instances[identifier] = [0, 0.0, 0.0]
+
+            record[0] += 1
+            record[1] += seconds
+
+            if seconds > record[2]:
+                record[2] = seconds
+
+    # --------------------------------------------------------------------------
+    def as_dict(self):
+        """
+        Returns all the collected metrics as a dictionary made up only of
+        plain python types, making it suitable for serialising or passing
+        on to a metrics pipeline.
+
+        :return: dict
+        """
+        with self._lock:
+            file_records = dict(self._files)
+            request_records = {
+                identifier: list(record)
+                for identifier, record in self._requests.items()
+            }
+            instance_records = {
+                identifier: list(record)
+                for identifier, record in self._instances.items()
+            }
+
+        files = dict()
+
+        for filepath, record in file_records.items():
+            files[filepath] = dict(
+                import_seconds=record[0],
+                inspect_seconds=record[1],
+                classes_inspected=record[2],
+                plugins_found=record[3],
+                failed=record[4],
+            )
+
+        requests = dict()
+
+        for identifier, record in request_records.items():
+            requests[identifier] = dict(
+                count=record[0],
+                misses=record[1],
+                total_seconds=record[2],
+                max_seconds=record[3],
+                mean_seconds=record[2] / record[0],
+            )
+
+        instances = dict()
+
+        for identifier, record in instance_records.items():
+            instances[identifier] = dict(
+                count=record[0],
+                total_seconds=record[1],
+                max_seconds=record[2],
+                mean_seconds=record[1] / record[0],
+            )
+
+        file_values = list(file_records.values())
+
+        return dict(
+            files=files,
+            totals=dict(
+                files=len(files),
+                failures=sum(1 for record in file_values if record[4]),
+                plugins_found=sum(record[3] for record in file_values),
+                classes_inspected=sum(record[2] for record in file_values),
+                import_seconds=sum(record[0] for record in file_values),
+                inspect_seconds=sum(record[1] for record in file_values),
+                requests=sum(record[0] for record in request_records.values()),
+                instances=sum(
+                    record[0]
+                    for record in instance_records.values()
+                ),
+            ),
+            requests=requests,
+            instances=instances,
+        )
@@ -6,11 +6,28 @@ from factories.examples.reader import DataReader
 
 import re
 import os
+import gc
 import sys
+import shutil
+import marshal
+import zipfile
+import zipimport
+import asyncio
+import logging
+import importlib.util
+import tempfile
+import weakref
+import threading
 import factories
+import factories.cache
+import factories.manifest
+import factories.entry_points
+import factories.__main__
 import factories.examples.zoo
+import factories.examples.reader
 
 import unittest
+from unittest import mock
 
 
 class FlipResult:
@@ -818,6 +835,1768 @@ class FactoryTests(unittest.TestCase):
             except KeyError:
                 pass
 
+    def test_request_after_clear_and_register(self):
+
+        zoo = Zoo()
+        self.assertIsNotNone(zoo.factory.request("tiger"))
+
+        zoo.factory.clear()
+
+        self.assertIsNone(zoo.factory.request("tiger"))
+
+        from factories.examples.zoo.animals import carnivores
+
+        self.assertTrue(zoo.factory.register(carnivores.Tiger))
+
+        self.assertIs(
+            zoo.factory.request("tiger"),
+            carnivores.Tiger,
+        )
+
+    def test_index_is_rebuilt_after_remove_path(self):
+
+        reader = DataReader()
+
+        additional_path = os.path.join(
+            os.path.dirname(__file__),
+            'test_plugins',
+        )
+        reader.factory.add_path(additional_path)
+
+        self.assertEqual(
+            reader.factory.request('JSONReader').version,
+            2,
+        )
+
+        reader.factory.remove_path(additional_path)
+
+        self.assertEqual(
+            reader.factory.request('JSONReader').version,
+            1,
+        )
+        self.assertEqual(
+            reader.factory.versions('JSONReader'),
+            [1],
+        )
+        self.assertIsNone(
+            reader.factory.request('MethodVersionReader'),
+        )
+
+    def test_plugins_cache_follows_changes(self):
+
+        zoo = Zoo()
+        plugins = zoo.factory.plugins()
+
+        self.assertEqual(len(plugins), 6)
+
+        # -- Altering the returned list must not affect the factory
+        plugins.pop()
+        self.assertEqual(len(zoo.factory.plugins()), 6)
+
+        zoo.factory.set_disabled("polar bear", True)
+        self.assertEqual(len(zoo.factory.plugins()), 5)
+        self.assertEqual(len(zoo.factory.plugins(include_disabled=True)), 6)
+
+        zoo.factory.set_disabled("polar bear", False)
+        self.assertEqual(len(zoo.factory.plugins()), 6)
+
+        zoo.factory.remove_path(zoo.factory.paths()[0])
+        self.assertEqual(len(zoo.factory.plugins()), 0)
+
+    def test_plugins_are_in_registration_order(self):
+
+        zoo = Zoo()
+        zoo.factory.clear()
+
+        from factories.examples.zoo.animals import carnivores
+
+        zoo.factory.register(carnivores.Tiger)
+        zoo.factory.register(carnivores.Boa)
+        zoo.factory.register(carnivores.ArticFox)
+
+        self.assertEqual(
+            zoo.factory.plugins(),
+            [carnivores.Tiger, carnivores.Boa, carnivores.ArticFox],
+        )
+
+    def test_discovery_cache(self):
+
+        cache_dir = tempfile.mkdtemp()
+        plugin_dir = tempfile.mkdtemp()
+
+        try:
+            # -- Write a file which holds no plugins but counts how many
+            # -- times it has been executed
+            with open(os.path.join(plugin_dir, 'no_plugins.py'), 'w') as f:
+                f.write(
+                    'import os\n'
+                    'os.environ["FACTORIES_CACHE_COUNT"] = str(\n'
+                    '    int(os.environ.get("FACTORIES_CACHE_COUNT", 0)) + 1\n'
+                    ')\n'
+                )
+
+            os.environ['FACTORIES_CACHE_COUNT'] = '0'
+            self.addCleanup(os.environ.pop, 'FACTORIES_CACHE_COUNT', None)
+
+            first = Zoo(cache_dir=cache_dir)
+            first.factory.add_path(plugin_dir)
+
+            self.assertEqual(os.environ['FACTORIES_CACHE_COUNT'], '1')
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            # -- A second factory using the same cache should find the
+            # -- same plugins without executing the unchanged empty file
+            second = Zoo(cache_dir=cache_dir)
+            second.factory.add_path(plugin_dir)
+
+            self.assertEqual(os.environ['FACTORIES_CACHE_COUNT'], '1')
+            self.assertEqual(
+                first.factory.identifiers(),
+                second.factory.identifiers(),
+            )
+            self.assertIsNotNone(second.factory.request('tiger'))
+
+            # -- Nothing is hashed on a warm start, and the cache file is
+            # -- left as it was
+            cache_filepath = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+            cache_stamp = os.stat(cache_filepath).st_mtime_ns
+
+            with mock.patch.object(
+                factories.cache.DiscoveryCache,
+                '_hash',
+                wraps=factories.cache.DiscoveryCache._hash,
+            ) as file_hash:
+                warm = Zoo(cache_dir=cache_dir)
+                warm.factory.add_path(plugin_dir)
+
+            self.assertEqual(file_hash.call_count, 0)
+            self.assertEqual(os.stat(cache_filepath).st_mtime_ns, cache_stamp)
+            self.assertEqual(
+                first.factory.identifiers(),
+                warm.factory.identifiers(),
+            )
+
+            # -- Changing the file invalidates its cache entry
+            with open(os.path.join(plugin_dir, 'no_plugins.py'), 'a') as f:
+                f.write('# -- changed\n')
+
+            third = Zoo(cache_dir=cache_dir)
+            third.factory.add_path(plugin_dir)
+
+            self.assertEqual(os.environ['FACTORIES_CACHE_COUNT'], '2')
+
+        finally:
+            shutil.rmtree(cache_dir)
+            shutil.rmtree(plugin_dir)
+
+    def test_lazy_discovery(self):
+
+        plugin_dir = tempfile.mkdtemp()
+
+        try:
+            with open(os.path.join(plugin_dir, 'heavy_readers.py'), 'w') as f:
+                f.write(
+                    'import os\n'
+                    'from factories.examples import reader as r\n'
+                    'os.environ["FACTORIES_LAZY_COUNT"] = str(\n'
+                    '    int(os.environ.get("FACTORIES_LAZY_COUNT", 0)) + 1\n'
+                    ')\n'
+                    'class HeavyReader(r.ReaderPlugin):\n'
+                    '    version = 3\n'
+                    'class HeavierReader(HeavyReader):\n'
+                    '    pass\n'
+                )
+
+            os.environ['FACTORIES_LAZY_COUNT'] = '0'
+            self.addCleanup(os.environ.pop, 'FACTORIES_LAZY_COUNT', None)
+
+            factory = factories.Factory(
+                abstract=factories.examples.reader.ReaderPlugin,
+                versioning_identifier='version',
+                paths=[plugin_dir],
+                lazy=True,
+            )
+
+            # -- Querying the factory should not import the module
+            self.assertEqual(
+                factory.identifiers(),
+                {'HeavyReader', 'HeavierReader'},
+            )
+            self.assertEqual(factory.versions('HeavierReader'), [3])
+            self.assertEqual(
+                factory.serialise()['paths'],
+                [plugin_dir],
+            )
+            self.assertEqual(os.environ['FACTORIES_LAZY_COUNT'], '0')
+
+            # -- Requesting imports the module once for both plugins
+            heavy = factory.request('HeavyReader')
+            heavier = factory.request('HeavierReader')
+
+            self.assertEqual(heavy.__name__, 'HeavyReader')
+            self.assertTrue(issubclass(heavier, heavy))
+            self.assertEqual(os.environ['FACTORIES_LAZY_COUNT'], '1')
+
+        finally:
+            shutil.rmtree(plugin_dir)
+
+    def test_lazy_plugin_which_fails_to_load(self):
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+
+        with open(os.path.join(root, 'dodos.py'), 'w') as f:
+            f.write(
+                'import factories_tests_missing_module\n'
+                'from factories.examples.zoo import Animal\n\n\n'
+                'class Dodo(Animal):\n'
+                '    species = "dodo"\n',
+            )
+
+        factory = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            paths=[root],
+            lazy=True,
+            log_errors=False,
+        )
+
+        # -- The plugin is found without importing its module
+        self.assertEqual(factory.identifiers(), {'dodo'})
+
+        # -- Failing to load it does not wait on a change being made
+        locked = threading.Event()
+        finished = threading.Event()
+
+        def change():
+            with factory._lock:
+                locked.set()
+                finished.wait(10)
+
+        changing = threading.Thread(target=change)
+        changing.start()
+        locked.wait(10)
+
+        requested = list()
+        requesting = threading.Thread(
+            target=lambda: requested.append(factory.plugins()),
+        )
+        requesting.start()
+        requesting.join(5)
+        waited = requesting.is_alive()
+
+        finished.set()
+        changing.join()
+        requesting.join()
+
+        self.assertFalse(waited)
+
+        # -- Once it has failed to load it is passed over
+        self.assertEqual(requested, [[]])
+        self.assertIsNone(factory.request('dodo'))
+
+        with self.assertRaises(KeyError):
+            factory.instance('dodo')
+
+        # -- and is removed from the factory by the next change
+        class Kiwi(Animal):
+            species = 'kiwi'
+
+        factory.register(Kiwi)
+        self.assertEqual(factory.identifiers(), {'kiwi'})
+
+        # -- An overlay also passes over a plugin of its base which could
+        # -- not be loaded
+        base = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            paths=[root],
+            lazy=True,
+            log_errors=False,
+        )
+        tenant = factories.FactoryOverlay(base)
+
+        self.assertIsNone(tenant.request('dodo'))
+        self.assertEqual(tenant.plugins(), [])
+        self.assertIsNone(base.request('dodo'))
+
+    def test_lazy_requests_do_not_wait_on_changes(self):
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        self._write_animals(root, 1)
+
+        factory = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            paths=[root],
+            lazy=True,
+        )
+
+        # -- Hold the factory lock on another thread, as a long running
+        # -- change would
+        locked = threading.Event()
+        finished = threading.Event()
+
+        def change():
+            with factory._lock:
+                locked.set()
+                finished.wait(10)
+
+        changing = threading.Thread(target=change)
+        changing.start()
+        locked.wait(10)
+
+        requested = list()
+        requesting = threading.Thread(
+            target=lambda: requested.append(factory.request('animal_0')),
+        )
+        requesting.start()
+        requesting.join(5)
+        waited = requesting.is_alive()
+
+        finished.set()
+        changing.join()
+        requesting.join()
+
+        self.assertFalse(waited)
+        self.assertEqual(len(requested), 1)
+        self.assertEqual(requested[0].species, 'animal_0')
+
+    def test_lazy_discovery_matches_eager_discovery(self):
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+
+        with open(os.path.join(root, 'hidden_animals.py'), 'w') as f:
+            f.write(
+                'from factories.examples.zoo import Animal\n'
+                'from factories.examples.zoo.animals.carnivores import Tiger\n'
+                '\n\n'
+                'try:\n'
+                '    class Mole(Animal):\n'
+                '        species = "mole"\n'
+                '\n'
+                'except ImportError:\n'
+                '    pass\n',
+            )
+
+        identifiers = [
+            factories.Factory(
+                abstract=Animal,
+                plugin_identifier='species',
+                paths=[root],
+                lazy=lazy,
+            ).identifiers()
+            for lazy in [False, True]
+        ]
+
+        # -- Neither the conditional nor the imported plugin can be seen
+        # -- without importing the file, so it is imported
+        self.assertEqual(identifiers[0], {'mole', 'tiger'})
+        self.assertEqual(identifiers[1], identifiers[0])
+
+    def test_lazy_discovery_falls_back_to_importing(self):
+
+        zoo = Zoo(lazy=True)
+
+        zoo.factory.add_path(
+            os.path.join(
+                os.path.dirname(__file__),
+                'test_plugins',
+            )
+        )
+
+        # -- The goat defines its species through a method, so it can
+        # -- only be found by importing
+        self.assertIn('goat', zoo.factory.identifiers())
+        self.assertIsNotNone(zoo.factory.request('goat'))
+        self.assertEqual(zoo.factory.request('tiger').species, 'tiger')
+
+    def test_parallel_loading_matches_serial(self):
+
+        plugin_path = os.path.dirname(__file__)
+
+        for mechanism in [factories.Factory.GUESS, factories.Factory.LOAD_SOURCE]:
+            serial = Zoo().factory
+            serial.add_path(plugin_path, mechanism=mechanism)
+
+            parallel = Zoo().factory
+            parallel.add_path(plugin_path, mechanism=mechanism, workers=4)
+
+            self.assertEqual(
+                [record.class_name() for record in serial._records],
+                [record.class_name() for record in parallel._records],
+            )
+            self.assertEqual(
+                serial.identifiers(),
+                parallel.identifiers(),
+            )
+
+    def test_parallel_loading_skips_unchanged_files(self):
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        self._write_animals(root, 4)
+
+        factory = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            workers=4,
+        )
+        factory.add_path(root, mechanism=factory.LOAD_SOURCE)
+
+        # -- Reloading reuses the modules of the unchanged files, so they
+        # -- are not read and compiled again ahead of time
+        with mock.patch.object(
+            factory,
+            '_prepare_file',
+            wraps=factory._prepare_file,
+        ) as prepare_file:
+            factory.reload()
+
+        self.assertEqual(
+            [call.kwargs.get('read') for call in prepare_file.call_args_list],
+            [None] * 4,
+        )
+        self.assertEqual(len(factory.identifiers()), 4)
+
+    def test_remove_path_does_not_search_other_paths(self):
+
+        plugin_dir = tempfile.mkdtemp()
+
+        try:
+            with open(os.path.join(plugin_dir, 'counted.py'), 'w') as f:
+                f.write(
+                    'import os\n'
+                    'from factories.examples.zoo import Animal\n'
+                    'os.environ["FACTORIES_REMOVE_COUNT"] = str(\n'
+                    '    int(os.environ.get("FACTORIES_REMOVE_COUNT", 0)) + 1\n'
+                    ')\n'
+                    'class Lemur(Animal):\n'
+                    '    species = "lemur"\n'
+                )
+
+            os.environ['FACTORIES_REMOVE_COUNT'] = '0'
+            self.addCleanup(os.environ.pop, 'FACTORIES_REMOVE_COUNT', None)
+
+            zoo = Zoo()
+            zoo.factory.add_path(plugin_dir)
+
+            alternate_path = os.path.join(
+                os.path.dirname(__file__),
+                'alternate_plugins',
+            )
+            zoo.factory.add_path(alternate_path)
+
+            self.assertIn('snake', zoo.factory.identifiers())
+            self.assertEqual(os.environ['FACTORIES_REMOVE_COUNT'], '1')
+
+            emitted = list()
+
+            def on_paths_changed():
+                emitted.append('paths')
+
+            def on_plugins_changed():
+                emitted.append('plugins')
+
+            zoo.factory.paths_changed.connect(on_paths_changed)
+            zoo.factory.plugins_changed.connect(on_plugins_changed)
+
+            zoo.factory.remove_path(alternate_path)
+
+            self.assertNotIn('snake', zoo.factory.identifiers())
+            self.assertIn('lemur', zoo.factory.identifiers())
+            self.assertIn('tiger', zoo.factory.identifiers())
+            self.assertEqual(os.environ['FACTORIES_REMOVE_COUNT'], '1')
+            self.assertEqual(sorted(emitted), ['paths', 'plugins'])
+
+        finally:
+            shutil.rmtree(plugin_dir)
+
+    def test_watching_reloads_changed_files(self):
+
+        plugin_dir = tempfile.mkdtemp()
+        template = (
+            'from factories.examples.zoo import Animal\n'
+            'class {0}(Animal):\n'
+            '    species = "{1}"\n'
+            '    max_age = {2}\n'
+        )
+
+        try:
+            lemur_path = os.path.join(plugin_dir, 'lemur.py')
+
+            with open(lemur_path, 'w') as f:
+                f.write(template.format('Lemur', 'lemur', 5))
+
+            zoo = Zoo()
+            zoo.factory.add_path(plugin_dir)
+
+            watcher = factories.PathWatcher(zoo.factory)
+
+            self.assertIsNone(watcher.poll())
+            self.assertEqual(zoo.factory.request('lemur').max_age, 5)
+
+            reloaded = list()
+
+            def on_reloaded(changes):
+                reloaded.append(changes)
+
+            zoo.factory.plugins_reloaded.connect(on_reloaded)
+
+            # -- Change the file
+            with open(lemur_path, 'w') as f:
+                f.write(template.format('Lemur', 'lemur', 15))
+
+            changes = watcher.poll()
+
+            self.assertEqual(changes['updated'], {'lemur'})
+            self.assertEqual(zoo.factory.request('lemur').max_age, 15)
+            self.assertEqual(reloaded, [changes])
+
+            # -- Add a file
+            with open(os.path.join(plugin_dir, 'gecko.py'), 'w') as f:
+                f.write(template.format('Gecko', 'gecko', 10))
+
+            changes = watcher.poll()
+
+            self.assertEqual(changes['added'], {'gecko'})
+            self.assertIn('gecko', zoo.factory.identifiers())
+
+            # -- Delete a file
+            os.remove(lemur_path)
+
+            changes = watcher.poll()
+
+            self.assertEqual(changes['removed'], {'lemur'})
+            self.assertNotIn('lemur', zoo.factory.identifiers())
+            self.assertIn('tiger', zoo.factory.identifiers())
+
+            # -- Watching on a background thread can be started and stopped
+            watcher = zoo.factory.watch(interval=0.01)
+            self.assertTrue(watcher.is_running())
+
+            zoo.factory.unwatch()
+            self.assertFalse(watcher.is_running())
+
+        finally:
+            shutil.rmtree(plugin_dir)
+
+    def test_resolving_module_names(self):
+
+        resolver = factories.ModuleResolver()
+
+        self.assertEqual(
+            resolver.module_name(factories.examples.zoo.zoo.__file__),
+            'factories.examples.zoo.zoo',
+        )
+
+        # -- Folders without an __init__ within a package still resolve
+        self.assertEqual(
+            resolver.module_name(
+                os.path.join(
+                    os.path.dirname(__file__),
+                    'test_plugins',
+                    'non_package',
+                    'unpackaged_animals.py',
+                ),
+            ),
+            'factories.tests.test_plugins.non_package.unpackaged_animals',
+        )
+
+        plugin_dir = tempfile.mkdtemp()
+
+        try:
+            filepath = os.path.join(plugin_dir, 'lone_module.py')
+
+            self.assertIsNone(resolver.module_name(filepath))
+
+            # -- Once the folder is on the sys.path it is a lone module
+            sys.path.append(plugin_dir)
+
+            self.assertEqual(resolver.module_name(filepath), 'lone_module')
+
+        finally:
+            if plugin_dir in sys.path:
+                sys.path.remove(plugin_dir)
+
+            shutil.rmtree(plugin_dir)
+
+    def test_direct_loading_reuses_modules(self):
+
+        plugin_dir = tempfile.mkdtemp()
+
+        try:
+            filepath = os.path.join(plugin_dir, 'lemurs.py')
+
+            with open(filepath, 'w') as f:
+                f.write(
+                    'from factories.examples.zoo import Animal\n'
+                    'class Lemur(Animal):\n'
+                    '    species = "lemur"\n'
+                )
+
+            zoo = Zoo()
+            zoo.factory.add_path(plugin_dir, mechanism=zoo.factory.LOAD_SOURCE)
+
+            lemur = zoo.factory.request('lemur')
+            module_count = len(sys.modules)
+
+            # -- Reloading an unchanged file reuses the same module
+            zoo.factory.reload()
+
+            self.assertIs(zoo.factory.request('lemur'), lemur)
+            self.assertEqual(len(sys.modules), module_count)
+
+            # -- Once the file changes the module is replaced
+            with open(filepath, 'a') as f:
+                f.write('    max_age = 12\n')
+
+            zoo.factory.reload()
+
+            self.assertEqual(zoo.factory.request('lemur').max_age, 12)
+            self.assertEqual(len(sys.modules), module_count)
+            self.assertIn(lemur.__module__, sys.modules)
+
+            # -- Removing the path evicts the module
+            zoo.factory.remove_path(plugin_dir)
+
+            self.assertNotIn(lemur.__module__, sys.modules)
+
+        finally:
+            shutil.rmtree(plugin_dir)
+
+    def test_instrumentation(self):
+
+        zoo = Zoo(instrumentation=factories.FactoryStats())
+
+        zoo.factory.add_path(
+            os.path.join(
+                os.path.dirname(__file__),
+                'test_plugins',
+            )
+        )
+
+        zoo.factory.request('tiger')
+        zoo.factory.request('tiger')
+        zoo.factory.request('unicorn')
+        zoo.factory.instance('tiger')
+
+        stats = zoo.factory.stats()
+
+        self.assertEqual(stats['requests']['tiger']['count'], 2)
+        self.assertEqual(stats['requests']['unicorn']['misses'], 1)
+        self.assertEqual(stats['instances']['tiger']['count'], 1)
+
+        carnivores = [
+            record
+            for filepath, record in stats['files'].items()
+            if filepath.endswith('carnivores.py')
+        ][0]
+
+        self.assertEqual(carnivores['plugins_found'], 6)
+        self.assertFalse(carnivores['failed'])
+
+        unloadable = [
+            record
+            for filepath, record in stats['files'].items()
+            if filepath.endswith('unloadable.py')
+        ][0]
+
+        self.assertTrue(unloadable['failed'])
+        self.assertGreaterEqual(stats['totals']['failures'], 1)
+
+    def test_stats_without_instrumentation(self):
+
+        zoo = Zoo()
+
+        self.assertIsNone(zoo.factory.stats())
+
+    def test_log_messages_are_formatted_lazily(self):
+
+        class Unprintable(object):
+            def __str__(self):
+                raise AssertionError('Message should not be formatted')
+
+        zoo = Zoo()
+
+        level = factories.log.level
+        factories.log.setLevel(logging.ERROR)
+
+        try:
+            zoo.factory._log('Value : {}', Unprintable())
+            zoo.factory._log('Value : {}', Unprintable(), is_warning=True)
+
+        finally:
+            factories.log.setLevel(level)
+
+    def test_deduplicating_miss_warnings(self):
+
+        zoo = Zoo(deduplicate_warnings=True)
+
+        with self.assertLogs(factories.log, level='WARNING') as logs:
+            zoo.factory.request('unicorn')
+            zoo.factory.request('unicorn')
+            zoo.factory.request('pegasus')
+
+            # -- Changing the plugins allows the warning to be logged again
+            zoo.factory.remove_path(zoo.factory.paths()[0])
+            zoo.factory.request('unicorn')
+
+        self.assertEqual(
+            len([line for line in logs.output if 'unicorn' in line]),
+            2,
+        )
+        self.assertEqual(
+            len([line for line in logs.output if 'pegasus' in line]),
+            1,
+        )
+
+        # -- Only the most recently logged warnings are remembered
+        zoo = Zoo(deduplicate_warnings=True)
+
+        with mock.patch.object(factories.Factory, '_WARNED_SIZE', 2):
+            with self.assertLogs(factories.log, level='WARNING') as logs:
+                for identifier in ['unicorn', 'pegasus', 'griffin']:
+                    zoo.factory.request(identifier)
+
+                zoo.factory.request('pegasus')
+                zoo.factory.request('unicorn')
+
+        self.assertEqual(len(zoo.factory._warned), 2)
+        self.assertEqual(
+            len([line for line in logs.output if 'unicorn' in line]),
+            2,
+        )
+        self.assertEqual(
+            len([line for line in logs.output if 'pegasus' in line]),
+            1,
+        )
+
+    def test_request_many(self):
+
+        reader = DataReader()
+
+        pairs = [
+            ('JSONReader', 1),
+            ('INIReader', None),
+            ('JSONReader', 99),
+            ('YAMLReader', None),
+            ('JSONReader', 1),
+        ]
+
+        with self.assertLogs(factories.log, level='WARNING') as logs:
+            plugins = reader.factory.request_many(pairs)
+
+        self.assertEqual(
+            plugins,
+            [
+                reader.factory.request('JSONReader', 1),
+                reader.factory.request('INIReader'),
+                None,
+                None,
+                reader.factory.request('JSONReader', 1),
+            ],
+        )
+
+        # -- Both misses are reported within a single warning, counted
+        # -- against every pair requested
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('Could not find 2 of the 5', logs.output[0])
+        self.assertIn('YAMLReader', logs.output[0])
+        self.assertIn('JSONReader (version 99)', logs.output[0])
+
+    def test_instance_many(self):
+
+        zoo = Zoo()
+
+        animals = zoo.factory.instance_many(
+            [
+                ('tiger', None),
+                ('unicorn', None),
+                ('tiger', None),
+            ],
+        )
+
+        self.assertEqual(animals[0].species, 'tiger')
+        self.assertIsNone(animals[1])
+        self.assertIsNot(animals[0], animals[2])
+
+    def test_concurrent_requests_and_changes(self):
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+
+        self._write_animals(root, 40)
+
+        factory = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            paths=[root],
+        )
+
+        identifiers = factory.identifiers()
+        self.assertEqual(len(identifiers), 40)
+
+        stop = threading.Event()
+        errors = list()
+
+        def read():
+            try:
+                while not stop.is_set():
+                    # -- Readers must only ever see the factory with either
+                    # -- all or none of the plugins, never part way through
+                    # -- a change
+                    plugins = factory.plugins()
+                    self.assertIn(len(plugins), (0, 40))
+                    self.assertNotIn(None, plugins)
+
+                    self.assertIn(factory.identifiers(), (set(), identifiers))
+
+                    plugin = factory.request('animal_7')
+
+                    if plugin is not None:
+                        self.assertEqual(plugin.species, 'animal_7')
+
+            except BaseException as error:
+                errors.append(error)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+
+        # -- Switch between threads as often as possible to give any
+        # -- partial states the best chance of being seen
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        for reader in readers:
+            reader.start()
+
+        try:
+            for _ in range(10):
+                factory.remove_path(root)
+                factory.add_path(root)
+                factory.reload()
+
+        finally:
+            stop.set()
+
+            for reader in readers:
+                reader.join()
+
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(factory.identifiers(), identifiers)
+
+    def _write_animals(self, root, count, body=''):
+        """
+        Writes a plugin file for each of the given count of animals into
+        the given folder, with each module running the given body when it
+        is loaded.
+        """
+        for index in range(count):
+            filepath = os.path.join(root, 'animal_{}.py'.format(index))
+
+            with open(filepath, 'w') as f:
+                f.write(
+                    '{1}\n'
+                    'from factories.examples.zoo import Animal\n\n\n'
+                    'class Animal{0}(Animal):\n'
+                    '    species = "animal_{0}"\n'.format(index, body),
+                )
+
+    def test_add_path_async(self):
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        self._write_animals(root, 5)
+
+        factory = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+        )
+
+        emitted = list()
+
+        def plugins_changed():
+            emitted.append(
+                (threading.get_ident(), len(factory.plugins())),
+            )
+
+        factory.plugins_changed.connect(plugins_changed)
+
+        async def main():
+            await factory.add_path_async(root)
+            emitted.append(threading.get_ident())
+
+            await factory.reload_async()
+            await factory.remove_path_async(root)
+
+        asyncio.run(main())
+
+        loop_thread = emitted[1]
+
+        # -- Slots are called on the loop thread, and only once the
+        # -- whole path has been searched
+        self.assertEqual(emitted[0], (loop_thread, 5))
+        self.assertEqual(emitted[-1], (loop_thread, 0))
+        self.assertEqual(factory.paths(), [])
+
+    def test_cancelling_add_path_async(self):
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        self._write_animals(root, 10, body='import time\ntime.sleep(0.05)')
+
+        factory = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+        )
+
+        emitted = list()
+
+        def plugins_changed():
+            emitted.append(True)
+
+        factory.plugins_changed.connect(plugins_changed)
+        factory.paths_changed.connect(plugins_changed)
+
+        async def main():
+            task = asyncio.ensure_future(
+                factory.add_path_async(root, mechanism=factory.LOAD_SOURCE),
+            )
+            await asyncio.sleep(0.12)
+            task.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+
+        # -- Nothing from the cancelled search should remain
+        self.assertEqual(factory.paths(), [])
+        self.assertEqual(factory.plugins(), [])
+        self.assertEqual(factory._records, [])
+        self.assertEqual(emitted, [])
+
+    def test_dispatch(self):
+
+        calls = list()
+
+        class Reader(object):
+            selectors = dict()
+
+            @classmethod
+            def can_read(cls, filepath):
+                calls.append(cls.__name__)
+                return False
+
+        class TextReader(Reader):
+            selectors = dict(can_read=dict(extensions=['.txt', '.tar.gz']))
+
+        class PredicateReader(Reader):
+            @classmethod
+            def can_read(cls, filepath):
+                calls.append(cls.__name__)
+                return filepath.startswith('special')
+
+        class PatternReader(Reader):
+            selectors = dict(can_read=dict(patterns=[r'_v\d+\.']))
+
+        class ValueReader(Reader):
+            selectors = dict(can_read=dict(values=['README']))
+
+        factory = factories.Factory(abstract=Reader, selection_cache_size=16)
+
+        factory.register(TextReader)
+        factory.register(PredicateReader)
+        factory.register(PatternReader)
+        factory.register(ValueReader)
+
+        expected = [
+            ('notes.txt', TextReader),
+            ('a.tar.gz', TextReader),
+            ('scene_v2.ma', PatternReader),
+            ('README', ValueReader),
+            ('special.txt', TextReader),
+            ('special.ma', PredicateReader),
+            ('other.ma', None),
+        ]
+
+        for filepath, plugin in expected:
+            self.assertIs(factory.dispatch('can_read', filepath), plugin)
+
+        # -- The predicate is only asked where no plugin ahead of it had
+        # -- a matching selector, and results are remembered by the
+        # -- selection cache
+        self.assertEqual(calls.count('PredicateReader'), 4)
+        factory.dispatch('can_read', 'other.ma')
+        self.assertEqual(calls.count('PredicateReader'), 4)
+
+        # -- Changing the plugins forgets what was remembered
+        factory.set_disabled('TextReader', True)
+        self.assertIs(
+            factory.dispatch('can_read', 'special.txt'),
+            PredicateReader,
+        )
+
+    def test_data_reader_dispatches_by_extension(self):
+
+        data_reader = DataReader()
+
+        self.assertEqual(
+            data_reader.read(factories.examples.reader.json_path),
+            data_reader.factory.request('JSONReader').contents(
+                factories.examples.reader.json_path,
+            ),
+        )
+
+    def test_dispatch_extensions_match_the_end_of_the_value(self):
+
+        class Reader(object):
+            selectors = dict()
+
+            @classmethod
+            def can_read(cls, filepath):
+                return False
+
+        class JSONReader(Reader):
+            selectors = dict(can_read=dict(extensions=['json']))
+
+        class TestReader(Reader):
+            selectors = dict(can_read=dict(extensions=['_test.py']))
+
+        class PythonReader(Reader):
+            selectors = dict(can_read=dict(extensions=['.py']))
+
+        factory = factories.Factory(abstract=Reader)
+
+        factory.register(JSONReader)
+        factory.register(TestReader)
+        factory.register(PythonReader)
+
+        expected = [
+            ('data.json', JSONReader),
+            ('datajson', JSONReader),
+            ('tools/reader_test.py', TestReader),
+            ('tools/reader.py', PythonReader),
+            ('tools/reader.pyc', None),
+        ]
+
+        for filepath, plugin in expected:
+            self.assertIs(factory.dispatch('can_read', filepath), plugin)
+
+    def test_dispatch_with_overridden_predicate(self):
+
+        class Reader(object):
+            selectors = dict()
+
+            @classmethod
+            def can_read(cls, filepath):
+                return False
+
+        class JSONReader(Reader):
+            selectors = dict(can_read=dict(extensions=['.json']))
+
+        class SchemaReader(JSONReader):
+            @classmethod
+            def can_read(cls, filepath):
+                return filepath.endswith('.schema.json')
+
+        class StrictJSONReader(JSONReader):
+            pass
+
+        factory = factories.Factory(abstract=Reader)
+
+        factory.register(SchemaReader)
+        factory.register(StrictJSONReader)
+
+        # -- The selectors SchemaReader inherits describe a predicate it
+        # -- has overridden, so its own predicate is asked instead, whilst
+        # -- StrictJSONReader keeps both its predicate and selectors
+        self.assertIs(
+            factory.dispatch('can_read', 'a.schema.json'),
+            SchemaReader,
+        )
+        self.assertIs(factory.dispatch('can_read', 'a.json'), StrictJSONReader)
+        self.assertIsNone(factory.dispatch('can_read', 'a.ini'))
+
+    def test_selection_cache(self):
+
+        reader = DataReader()
+        self.assertIsNone(reader.factory.selection_cache_stats())
+
+        factory = factories.Factory(
+            abstract=factories.examples.reader.ReaderPlugin,
+            paths=reader.factory.paths(),
+            selection_cache_size=2,
+        )
+
+        for filepath in ['a.json', 'b.ini', 'a.json', 'c.json', 'b.ini']:
+            factory.dispatch('can_read', filepath)
+
+        # -- b.ini was the least recently used when c.json was added
+        self.assertEqual(
+            factory.selection_cache_stats(),
+            dict(hits=1, misses=4, entries=2, size=2),
+        )
+
+        # -- Changing the disabled state forgets everything, as does
+        # -- changing the plugins
+        factory.set_disabled('JSONReader', True)
+        self.assertIsNone(factory.dispatch('can_read', 'a.json'))
+
+        factory.set_disabled('JSONReader', False)
+        self.assertEqual(
+            factory.dispatch('can_read', 'a.json').__name__,
+            'JSONReader',
+        )
+
+        factory.clear()
+        self.assertIsNone(factory.dispatch('can_read', 'a.json'))
+
+        self.assertEqual(factory.selection_cache_stats()['hits'], 1)
+        self.assertEqual(factory.selection_cache_stats()['entries'], 1)
+
+    def test_serialisation_describes_plugins(self):
+
+        zoo = Zoo()
+        path = zoo.factory.paths()[0]
+
+        class Unicorn(Animal):
+            species = 'unicorn'
+
+        zoo.factory.register(Unicorn)
+
+        plugins = {
+            plugin['identifier']: plugin
+            for plugin in zoo.factory.serialise()['plugins']
+        }
+
+        self.assertEqual(plugins['tiger']['class_name'], 'Tiger')
+        self.assertEqual(plugins['tiger']['path'], path)
+        self.assertEqual(plugins['tiger']['mechanism'], zoo.factory.GUESS)
+        self.assertTrue(
+            plugins['tiger']['filepath'].startswith(os.path.abspath(path)),
+        )
+        self.assertIsInstance(plugins['tiger']['load_time'], float)
+
+        # -- Registered plugins did not come from any file
+        self.assertIsNone(plugins['unicorn']['filepath'])
+        self.assertIsNone(plugins['unicorn']['path'])
+
+    def test_set_disabled_many(self):
+
+        zoo = Zoo()
+
+        emitted = list()
+
+        def plugins_changed():
+            emitted.append(True)
+
+        zoo.factory.plugins_changed.connect(plugins_changed)
+
+        zoo.factory.set_disabled_many(['tiger', 'polar bear'], True)
+
+        self.assertEqual(len(emitted), 1)
+        self.assertTrue(zoo.factory.is_disabled('tiger'))
+        self.assertNotIn('tiger', zoo.factory.identifiers())
+        self.assertIn('tiger', zoo.factory.identifiers(include_disabled=True))
+        self.assertNotIn(
+            'polar bear',
+            [plugin.species for plugin in zoo.factory.plugins()],
+        )
+
+        # -- Nothing changes, so nothing is emitted
+        zoo.factory.set_disabled_many(['tiger'], True)
+        self.assertEqual(len(emitted), 1)
+
+        zoo.factory.set_disabled_many(['tiger', 'polar bear'], False)
+
+        self.assertEqual(len(emitted), 2)
+        self.assertFalse(zoo.factory.is_disabled('tiger'))
+        self.assertEqual(
+            zoo.factory.identifiers(),
+            zoo.factory.identifiers(include_disabled=True),
+        )
+
+    def test_overlay(self):
+
+        zoo = Zoo()
+        base = zoo.factory
+
+        tenant = factories.FactoryOverlay(base)
+
+        # -- The overlay offers the base plugins without loading anything
+        self.assertEqual(tenant.identifiers(), base.identifiers())
+        self.assertIs(tenant.request('tiger'), base.request('tiger'))
+        self.assertEqual(tenant._records, [])
+
+        # -- Disabling within the overlay does not affect the base
+        tenant.set_disabled('tiger', True)
+
+        self.assertNotIn('tiger', tenant.identifiers())
+        self.assertIn('tiger', base.identifiers())
+
+        # -- Nor do registered plugins
+        class Unicorn(Animal):
+            species = 'unicorn'
+
+        tenant.register(Unicorn)
+
+        self.assertIs(tenant.request('unicorn'), Unicorn)
+        self.assertIsNone(base.request('unicorn'))
+        self.assertEqual(len(tenant.plugins()), len(base.plugins()))
+
+        self.assertEqual(
+            tenant.serialise()['disabled_identifiers'],
+            ['tiger'],
+        )
+        self.assertEqual(tenant.serialise()['paths'], [])
+
+        # -- Changes to the base are seen by the overlay, and its
+        # -- signals are passed on
+        emitted = list()
+
+        def plugins_changed():
+            emitted.append(True)
+
+        tenant.plugins_changed.connect(plugins_changed)
+
+        base.set_disabled('polar bear', True)
+
+        self.assertEqual(emitted, [True])
+        self.assertNotIn('polar bear', tenant.identifiers())
+
+        base.clear()
+
+        self.assertEqual(tenant.identifiers(), {'unicorn'})
+
+    def test_overlay_merges_versions(self):
+
+        reader = DataReader()
+
+        class JSONReaderV2(factories.examples.reader.ReaderPlugin):
+            version = 2
+
+        JSONReaderV2.__name__ = 'JSONReader'
+
+        tenant = factories.FactoryOverlay(reader.factory)
+        tenant.register(JSONReaderV2)
+
+        self.assertEqual(tenant.versions('JSONReader'), [1, 2])
+        self.assertIs(tenant.request('JSONReader'), JSONReaderV2)
+        self.assertIs(
+            tenant.request('JSONReader', version=1),
+            reader.factory.request('JSONReader'),
+        )
+        self.assertEqual(reader.factory.versions('JSONReader'), [1])
+
+    def test_manifest(self):
+
+        zoo = Zoo()
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        manifest_filepath = os.path.join(root, 'zoo.json')
+
+        factories.__main__.main(
+            [
+                'build-manifest',
+                '--abstract', 'factories.examples.zoo:Animal',
+                '--identifier', 'species',
+                '--path', zoo.factory.paths()[0],
+                '--output', manifest_filepath,
+            ],
+        )
+
+        factory = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            manifest=manifest_filepath,
+            verify_manifest=True,
+        )
+
+        # -- Everything is registered without being loaded
+        self.assertEqual(factory.identifiers(), zoo.factory.identifiers())
+        self.assertEqual(factory.paths(), zoo.factory.paths())
+        self.assertEqual(
+            factory.serialise()['plugins'][0]['class_name'],
+            zoo.factory.serialise()['plugins'][0]['class_name'],
+        )
+
+        self.assertIs(factory.request('tiger'), zoo.factory.request('tiger'))
+
+        # -- A manifest for another configuration falls back to a search
+        other = factories.Factory(abstract=Animal, manifest=manifest_filepath)
+
+        self.assertIn('Tiger', other.identifiers())
+
+    def test_manifest_verifies_hashes(self):
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        self._write_animals(root, 2)
+
+        builder = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            paths=[root],
+        )
+        manifest = factories.manifest.build(builder)
+
+        self.assertEqual(len(manifest['plugins']), 2)
+        self.assertIsNone(manifest['plugins'][0]['module'])
+
+        # -- Change one of the files after the manifest was built
+        with open(os.path.join(root, 'animal_0.py'), 'a') as f:
+            f.write('\n# -- changed\n')
+
+        verified = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            manifest=manifest,
+            verify_manifest=True,
+        )
+
+        self.assertEqual(verified.identifiers(), {'animal_0', 'animal_1'})
+        self.assertIsNone(verified.request('animal_0'))
+        self.assertIsNotNone(verified.request('animal_1'))
+
+        unverified = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            manifest=manifest,
+        )
+
+        self.assertIsNotNone(unverified.request('animal_0'))
+
+    def test_entry_points(self):
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+
+        # -- Fake an installed distribution advertising a plugin class,
+        # -- a module of plugins and an entry point which cannot be loaded
+        dist_info = os.path.join(root, 'zoo_extras-1.0.dist-info')
+        os.makedirs(dist_info)
+
+        with open(os.path.join(dist_info, 'METADATA'), 'w') as f:
+            f.write('Metadata-Version: 2.1\nName: zoo-extras\nVersion: 1.0\n')
+
+        with open(os.path.join(dist_info, 'entry_points.txt'), 'w') as f:
+            f.write(
+                '[factories_tests.animals]\n'
+                'lion = zoo_extras_lion:Lion\n'
+                'birds = zoo_extras_birds\n'
+                'missing = zoo_extras_missing:Missing\n',
+            )
+
+        with open(os.path.join(root, 'zoo_extras_lion.py'), 'w') as f:
+            f.write(
+                'from factories.examples.zoo import Animal\n\n\n'
+                'class Lion(Animal):\n'
+                '    species = "lion"\n',
+            )
+
+        with open(os.path.join(root, 'zoo_extras_birds.py'), 'w') as f:
+            f.write(
+                'from factories.examples.zoo import Animal\n\n\n'
+                'class Parrot(Animal):\n'
+                '    species = "parrot"\n\n\n'
+                'class Crow(Animal):\n'
+                '    species = "crow"\n',
+            )
+
+        sys.path.insert(0, root)
+        self.addCleanup(sys.path.remove, root)
+        self.addCleanup(factories.entry_points.clear_cache)
+
+        factory = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+        )
+
+        self.assertEqual(factory.add_entry_points('factories_tests.animals'), 3)
+        self.assertEqual(factory.identifiers(), {'lion', 'parrot', 'crow'})
+        self.assertEqual(
+            factory.serialise()['plugins'][0]['filepath'],
+            os.path.join(root, 'zoo_extras_lion.py'),
+        )
+
+        # -- The distributions are only read once per environment
+        self.assertIs(
+            factories.entry_points.find('factories_tests.animals'),
+            factories.entry_points.find('factories_tests.animals'),
+        )
+
+        # -- Entry point groups are searched again on reload
+        factory.reload()
+
+        self.assertEqual(factory.identifiers(), {'lion', 'parrot', 'crow'})
+
+    def _write_archive(self, filepath, files):
+        """
+        Writes a zip archive holding the given dictionary of member names
+        to their source. Members ending in .pyc are compiled.
+        """
+        with zipfile.ZipFile(filepath, 'w') as archive:
+            for name, source in files.items():
+                if name.endswith('.pyc'):
+                    source = b''.join(
+                        [
+                            importlib.util.MAGIC_NUMBER,
+                            bytes(12),
+                            marshal.dumps(compile(source, name, 'exec')),
+                        ],
+                    )
+
+                archive.writestr(name, source)
+
+    def test_archive_paths(self):
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+
+        header = 'from factories.examples.zoo import Animal\n\n\n'
+        archive = os.path.join(root, 'bundle.zip')
+        files = {
+            'zoo_bundle/__init__.py': '',
+            'zoo_bundle/cats.py': header + (
+                'class Lion(Animal):\n'
+                '    species = "lion"\n'
+            ),
+            'wolves.py': header + (
+                'class Wolf(Animal):\n'
+                '    species = "wolf"\n'
+            ),
+            # -- Only the bytecode of this is held within the archive
+            'parrots.pyc': header + (
+                'class Parrot(Animal):\n'
+                '    species = "parrot"\n'
+            ),
+        }
+        self._write_archive(archive, files)
+
+        factory = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            paths=[archive],
+        )
+
+        self.assertEqual(factory.identifiers(), {'lion', 'wolf', 'parrot'})
+        self.assertEqual(factory.request('lion').species, 'lion')
+        self.assertIn(
+            os.path.join(archive, 'zoo_bundle', 'cats.py'),
+            [plugin['filepath'] for plugin in factory.serialise()['plugins']],
+        )
+
+        # -- Changes to the archive are picked up on reload
+        files['bears.py'] = header + (
+            'class Bear(Animal):\n'
+            '    species = "bear"\n'
+        )
+        self._write_archive(archive, files)
+        factory.reload()
+
+        self.assertIn('bear', factory.identifiers())
+
+        # -- As they are before python 3.10, where zipimporters cannot
+        # -- invalidate their caches
+        files['foxes.py'] = header + (
+            'class Fox(Animal):\n'
+            '    species = "fox"\n'
+        )
+        self._write_archive(archive, files)
+
+        with mock.patch.object(
+            zipimport.zipimporter,
+            'invalidate_caches',
+            None,
+        ):
+            factory.reload()
+
+        self.assertIn('fox', factory.identifiers())
+        self.assertEqual(factory.request('fox').species, 'fox')
+
+        # -- Archives on the sys.path can be imported from
+        sys.path.insert(0, archive)
+        self.addCleanup(sys.path.remove, archive)
+        self.addCleanup(sys.modules.pop, 'zoo_bundle.cats', None)
+        self.addCleanup(sys.modules.pop, 'zoo_bundle', None)
+
+        importable = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+        )
+        importable.add_path(archive, mechanism=importable.IMPORTABLE)
+
+        self.assertEqual(
+            importable.request('lion').__module__,
+            'zoo_bundle.cats',
+        )
+
+    def test_manifest_with_archive_paths(self):
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+
+        header = 'from factories.examples.zoo import Animal\n\n\n'
+        archive = os.path.join(root, 'bundle.zip')
+        files = {
+            'wolves.py': header + (
+                'class Wolf(Animal):\n'
+                '    species = "wolf"\n'
+            ),
+            'bears.py': header + (
+                'class Bear(Animal):\n'
+                '    species = "bear"\n'
+            ),
+        }
+        self._write_archive(archive, files)
+
+        builder = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            paths=[archive],
+        )
+        manifest = factories.manifest.build(builder)
+
+        self.assertEqual(len(manifest['plugins']), 2)
+
+        # -- Change one of the files within the archive after the
+        # -- manifest was built
+        files['bears.py'] += '\n# -- changed\n'
+        self._write_archive(archive, files)
+
+        verified = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            manifest=manifest,
+            verify_manifest=True,
+        )
+
+        self.assertEqual(verified.identifiers(), {'wolf', 'bear'})
+        self.assertEqual(verified.request('wolf').species, 'wolf')
+        self.assertIsNone(verified.request('bear'))
+
+    def test_instance_pooling(self):
+
+        factory = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            pool_size=2,
+        )
+
+        constructed = list()
+
+        class Elephant(Animal):
+            species = 'elephant'
+
+            def __init__(self):
+                super(Elephant, self).__init__()
+                constructed.append(self)
+
+            def reset(self):
+                self.age = 0
+
+        factory.register(Elephant)
+
+        elephant = factory.acquire('elephant')
+        elephant.increment_age()
+
+        self.assertTrue(factory.release(elephant))
+
+        # -- The released instance is reset and handed out again
+        with factory.pooled('elephant') as reused:
+            self.assertIs(reused, elephant)
+            self.assertEqual(reused.age, 0)
+
+            stats = factory.pool_stats()['identifiers']['elephant']
+            self.assertEqual(stats['in_use'], 1)
+
+        # -- The pool never holds more than its size
+        elephants = [factory.acquire('elephant') for _ in range(3)]
+
+        self.assertEqual(
+            [factory.release(item) for item in elephants],
+            [True, True, False],
+        )
+        self.assertEqual(len(constructed), 3)
+
+        with self.assertRaises(ValueError):
+            factory.release(elephants[0])
+
+        stats = factory.pool_stats()['identifiers']['elephant']
+
+        self.assertEqual(
+            (stats['hits'], stats['misses'], stats['idle'], stats['in_use']),
+            (2, 3, 2, 0),
+        )
+
+        # -- Removing (or reloading) the plugin drains its pool, and any
+        # -- instances still in use are dropped on release
+        in_use = factory.acquire('elephant')
+        factory.clear()
+        factory.register(Elephant)
+
+        self.assertFalse(factory.release(in_use))
+        self.assertIsNot(factory.acquire('elephant'), in_use)
+        self.assertEqual(len(constructed), 4)
+
+        with self.assertRaises(KeyError):
+            factory.acquire('mammoth')
+
+        # -- Instances which are never released are not kept alive by the
+        # -- pool, and stop counting as in use once they are collected
+        forgotten = weakref.ref(factory.acquire('elephant'))
+        del constructed[:]
+        gc.collect()
+
+        stats = factory.pool_stats()['identifiers']['elephant']
+
+        self.assertIsNone(forgotten())
+        self.assertEqual(stats['in_use'], 0)
+
+        # -- Releasing within pooled is left to the block
+        with factory.pooled('elephant') as released:
+            self.assertTrue(factory.release(released))
+
+        with self.assertRaises(ValueError):
+            factory.release(released)
+
+    def test_instance_pooling_of_replaced_plugins(self):
+
+        factory = factories.Factory(
+            abstract=Animal,
+            plugin_identifier='species',
+            versioning_identifier='version',
+            pool_size=2,
+        )
+
+        class Elephant(Animal):
+            species = 'elephant'
+            version = 1
+
+        factory.register(Elephant)
+        factory.release(factory.acquire('elephant'))
+
+        stats = factory.pool_stats()['identifiers']['elephant']
+        self.assertEqual(stats['idle'], 1)
+
+        # -- Registering the same version again replaces the plugin, so
+        # -- the idle instances of the previous one are dropped
+        class NewElephant(Elephant):
+            species = 'elephant'
+            version = 1
+
+        factory.register(NewElephant)
+
+        stats = factory.pool_stats()['identifiers']['elephant']
+        self.assertEqual(stats['idle'], 0)
+        self.assertIsInstance(factory.acquire('elephant'), NewElephant)
+
+    def test_instance_pooling_across_threads(self):
+
+        zoo = Zoo(pool_size=4)
+        errors = list()
+
+        def visit():
+            try:
+                for _ in range(200):
+                    with zoo.factory.pooled('tiger') as tiger:
+                        tiger.increment_age()
+
+            except BaseException as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=visit) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        stats = zoo.factory.pool_stats()['identifiers']['tiger']
+
+        self.assertEqual(errors, [])
+        self.assertEqual(stats['hits'] + stats['misses'], 1600)
+        self.assertEqual(stats['in_use'], 0)
+        self.assertLessEqual(stats['idle'], 4)
+
+    def test_constructor(self):
+
+        reader = DataReader()
+        create = reader.factory.constructor('JSONReader')
+        json_reader = reader.factory.request('JSONReader')
+
+        self.assertIs(create.plugin, json_reader)
+        self.assertIsInstance(create(), json_reader)
+
+        # -- Once the plugins change the plugin is resolved again
+        class JSONReaderV2(factories.examples.reader.ReaderPlugin):
+            version = 2
+
+        JSONReaderV2.__name__ = 'JSONReader'
+        reader.factory.register(JSONReaderV2)
+
+        self.assertIsInstance(create(), JSONReaderV2)
+
+        # -- A pinned version keeps to that version
+        create_first = reader.factory.constructor('JSONReader', version=1)
+
+        self.assertIs(create_first.plugin, json_reader)
+
+        # -- Once the plugin is gone the handle refuses to create it
+        reader.factory.clear()
+
+        with self.assertRaises(KeyError):
+            create()
+
+        with self.assertRaises(KeyError):
+            reader.factory.constructor('JSONReader')
+
+    def test_snapshots_are_published_incrementally(self):
+
+        zoo = Zoo()
+        zoo.factory.clear()
+
+        from factories.examples.zoo.animals import carnivores
+
+        zoo.factory.register(carnivores.Tiger)
+        zoo.factory.register(carnivores.Boa)
+        zoo.factory.set_disabled('boa constrictor', True)
+
+        tiger_entries = zoo.factory._snapshot.index['tiger']
+
+        # -- Registering another plugin only copies its own entries
+        zoo.factory.register(carnivores.ArticFox)
+
+        self.assertIs(zoo.factory._snapshot.index['tiger'], tiger_entries)
+        self.assertEqual(
+            zoo.factory.plugins(),
+            [carnivores.Tiger, carnivores.ArticFox],
+        )
+        self.assertEqual(
+            zoo.factory.identifiers(include_disabled=True),
+            {'tiger', 'boa constrictor', 'artic fox'},
+        )
+
+        # -- Changing the disabled states and clearing the plugins are
+        # -- still seen by readers
+        zoo.factory.set_disabled('boa constrictor', False)
+        self.assertEqual(
+            zoo.factory.plugins(),
+            [carnivores.Tiger, carnivores.Boa, carnivores.ArticFox],
+        )
+
+        zoo.factory.clear()
+        self.assertEqual(zoo.factory.identifiers(include_disabled=True), set())
+
+
+
 # ------------------------------------------------------------------------------
 if __name__ == '__main__':
     unittest.main(verbosity=1)
@@ -0,0 +1,221 @@
+"""
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from .constants import log
+
+import os
+import sys
+import weakref
+import threading
+
+
+# ------------------------------------------------------------------------------
+class PathWatcher(object):
+    """
+    Watches the paths registered with a factory for plugin files being
+    added, changed or deleted, and asks the factory to reload only those
+    files.
+
+    Changes are detected by polling the modification time and size of each
+    file. Polling can either be driven manually by calling poll(), or
+    carried out on a background thread by calling start().
+
+    .. code-block:: python
+
+        >>> from factories.examples.reader import DataReader
+        >>>
+        >>> reader = DataReader()
+        >>>
+        >>> # -- Start watching the paths, checking every two seconds
+        >>> watcher = reader.factory.watch(interval=2.0)
+        >>>
+        >>> # -- Stop watching again
+        >>> reader.factory.unwatch()
+    """
+
+    # --------------------------------------------------------------------------
+    def __init__(self, factory, interval=1.0):
+        """
+        :param factory: The factory whose paths should be watched
+        :type factory: factories.Factory
+
+        :param interval: Number of seconds between each poll when running
+            on a background thread
+        :type interval: float
+        """
+        # -- We only hold a weak reference so that watching a factory
+        # -- does not keep it alive
+        self._factory = weakref.ref(factory)
+        self.interval = interval
+
+        # -- Per path, the (mtime, size) of every file we have seen
+        self._snapshots = dict()
+
+        self._thread = None
+        self._stop_event = threading.Event()
+
+        self._take_snapshots()
+
+    # --------------------------------------------------------------------------
+    def _snapshot(self, factory, path):
+        """
+        Returns the modification time and size of every plugin file
+        within the given path.
+
+        :return: dict(filepath: (mtime, size))
+        """
+        snapshot = dict()
+
+        for filepath in factory._walk(path):
+            try:
+                stat = os.stat(filepath)
+
+            except OSError:
+                continue
+
+            snapshot[filepath] = (stat.st_mtime_ns, stat.st_size)
+
+        return snapshot
+
+    # --------------------------------------------------------------------------
+    def _take_snapshots(self):
+        """
+        Brings our snapshots in line with the factory paths without
+        reporting any changes.
+
+        :return: None
+        """
+        factory = self._factory()
+
+        if not factory:
+            return
+
+        self._snapshots = {
+            path: self._snapshot(factory, path)
+            for path in factory.paths()
+        }
+
+    # --------------------------------------------------------------------------
+    def is_running(self):
+        """
+        Returns whether the watcher is polling on a background thread
+
+        :return: bool
+        """
+        return bool(self._thread and self._thread.is_alive())
+
+    # --------------------------------------------------------------------------
+    def poll(self):
+        """
+        Checks all the factory paths for files which have been added,
+        changed or deleted since the last poll, and reloads them within
+        the factory.
+
+        :return: The changes as given by Factory.reload_files, or None if
+            nothing has changed
+        """
+        factory = self._factory()
+
+        if not factory:
+            return None
+
+        changed_filepaths = list()
+        snapshots = dict()
+
+        for path in factory.paths():
+            snapshot = self._snapshot(factory, path)
+            snapshots[path] = snapshot
+
+            # -- Paths which have been added since we last looked are
+            # -- searched by the factory itself
+            if path not in self._snapshots:
+                continue
+
+            previous = self._snapshots[path]
+
+            for filepath, stamp in snapshot.items():
+                if previous.get(filepath) != stamp:
+                    changed_filepaths.append(filepath)
+
+            for filepath in previous:
+                if filepath not in snapshot:
+                    changed_filepaths.append(filepath)
+
+        self._snapshots = snapshots
+
+        if not changed_filepaths:
+            return None
+
+        return factory.reload_files(changed_filepaths)
+
+    # --------------------------------------------------------------------------
+    def start(self):
+        """
+        Starts polling on a background thread
+
+        :return: None
+        """
+        if self.is_running():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name='FactoryPathWatcher',
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    # --------------------------------------------------------------------------
+    def stop(self):
+        """
+        Stops polling on the background thread, waiting for any current
+        poll to finish.
+
+        :return: None
+        """
+        self._stop_event.set()
+
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+
+        self._thread = None
+
+    # --------------------------------------------------------------------------
+    def _run(self):
+        """
+        Polls until we are stopped or the factory no longer exists.
+
+        :return: None
+        """
+        while not self._stop_event.wait(self.interval):
+            if not self._factory():
+                return
+
+            # -- Never let an error in a plugin kill the watcher
+            # noinspection PyBroadException
+            try:
+                self.poll()
+
+            except BaseException:
+                log.warning(
+                    'Failed whilst watching for changes : {}'.format(
+                        str(sys.exc_info()),
+                    ),
+                )
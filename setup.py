@@ -11,7 +11,7 @@ setuptools.setup(
     description='A python package exposing the factory/plugin design pattern',
     long_description=long_description,
     long_description_content_type='text/markdown',
-    python_requires='>3.1.1',
+    python_requires='>=3.8',
     url='https://github.com/mikemalinowski/factories',
     packages=setuptools.find_packages(),
     install_requires=[